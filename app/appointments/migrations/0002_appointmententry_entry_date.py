@@ -0,0 +1,42 @@
+# Generated by Django 4.2.10 on 2026-10-18 09:00
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def populate_entry_date(apps, schema_editor):
+    """
+    Backfill entry_date with the local date of created_on in one UPDATE
+    """
+    AppointmentEntry = apps.get_model("appointments", "AppointmentEntry")
+    AppointmentEntry.objects.update(entry_date=TruncDate("created_on"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointmententry",
+            name="entry_date",
+            field=models.DateField(
+                editable=False, null=True, verbose_name="Entry Date"
+            ),
+        ),
+        migrations.RunPython(
+            populate_entry_date, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AlterField(
+            model_name="appointmententry",
+            name="entry_date",
+            field=models.DateField(editable=False, verbose_name="Entry Date"),
+        ),
+        migrations.AddIndex(
+            model_name="appointmententry",
+            index=models.Index(
+                fields=["user", "entry_date"], name="appointment_user_date_idx"
+            ),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -20,6 +21,7 @@ class AppointmentEntry(models.Model):
     time_until = models.TimeField(_("Until"))
     created_on = models.DateTimeField(auto_now_add=True)
     updated_on = models.DateTimeField(auto_now=True)
+    entry_date = models.DateField(_("Entry Date"), editable=False)
 
     class Meta:
         """_
@@ -28,6 +30,23 @@ class AppointmentEntry(models.Model):
 
         verbose_name_plural = "Appointment Entries"
         ordering = ["date", "time_from"]
+        indexes = [
+            models.Index(
+                fields=["user", "entry_date"], name="appointment_user_date_idx"
+            ),
+            models.Index(
+                fields=["user", "created_on", "id"],
+                name="appointment_user_created_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Populate entry_date with the local date the entry is created on
+        """
+        if self.entry_date is None:
+            self.entry_date = timezone.localdate()
+        super().save(*args, **kwargs)
 
     def clean(self):
         """
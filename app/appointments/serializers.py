@@ -1,12 +1,17 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from mindfulminutes.bulk import BulkCreateListSerializer
+from mindfulminutes.fields import DynamicFieldsMixin
+
 from .models import AppointmentEntry
 
 User = get_user_model()
 
 
-class AppointmentEntrySerializer(serializers.ModelSerializer):
+class AppointmentEntrySerializer(
+    DynamicFieldsMixin, serializers.ModelSerializer
+):
     """
     Serializer for AppointmentEntry model to convert it to JSON representation
     """
@@ -22,5 +27,6 @@ class AppointmentEntrySerializer(serializers.ModelSerializer):
         """
 
         model = AppointmentEntry
-        exclude = ("updated_on",)
+        exclude = ("updated_on", "entry_date")
         read_only_fields = ("id",)
+        list_serializer_class = BulkCreateListSerializer
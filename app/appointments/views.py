@@ -9,11 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import AppointmentEntry
 from .serializers import AppointmentEntrySerializer
 
 
-class AppointmentEntryList(APIView):
+class AppointmentEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all appointment entries or create a new appointment entry
     """
@@ -33,16 +42,36 @@ class AppointmentEntryList(APIView):
                 appointment_entries = AppointmentEntry.objects.filter(
                     user=request.user
                 )
+                serializer = self.get_values_serializer(
+                    AppointmentEntrySerializer, request
+                )
+                appointment_entries = serializer.get_queryset(
+                    appointment_entries,
+                    *KeysetPagination.ordering,
+                    "updated_on"
+                )
 
-                serializer = AppointmentEntrySerializer(
-                    appointment_entries, many=True
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    appointment_entries, request, view=self
+                )
+
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
+
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
                 )
-                return Response(serializer.data)
 
             raise MethodNotAllowed(request.method)
 
 
-class AppointmentEntryListCreate(APIView):
+class AppointmentEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create appointment entries for a specific date
     """
@@ -65,14 +94,29 @@ class AppointmentEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 appointment_entries = AppointmentEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
+                )
+                serializer = self.get_values_serializer(
+                    AppointmentEntrySerializer, request
+                )
+                appointment_entries = serializer.get_queryset(
+                    appointment_entries
+                )
+
+                not_modified = self.check_not_modified(
+                    request, appointment_entries
                 )
+                if not_modified is not None:
+                    return not_modified
 
-                serializer = AppointmentEntrySerializer(
-                    appointment_entries, many=True
+                return self.cache_response(
+                    Response(serializer.to_representation(appointment_entries))
                 )
-                return Response(serializer.data)
 
         raise MethodNotAllowed(request.method)
 
@@ -102,6 +146,11 @@ class AppointmentEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(
+                        request, AppointmentEntrySerializer
+                    )
+
                 serializer = AppointmentEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -115,20 +164,22 @@ class AppointmentEntryListCreate(APIView):
         raise MethodNotAllowed(request.method)
 
 
-class AppointmentEntryDetail(APIView):
+class AppointmentEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete an appointment entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get an appointment entry object from the database
-        or raise a 404 error
+        Helper method to get an appointment entry object of the user for the
+        date from the database or raise a 404 error
         """
         try:
-            return AppointmentEntry.objects.get(pk=pk)
+            return AppointmentEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except AppointmentEntry.DoesNotExist:
             raise Http404
 
@@ -188,9 +239,16 @@ class AppointmentEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    appointment_entry = self.get_object(pk)
+                    appointment_entry = self.get_object(
+                        pk, request.user, date_request
+                    )
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -200,8 +258,16 @@ class AppointmentEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = AppointmentEntrySerializer(appointment_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(
+                        request, appointment_entry
+                    )
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = AppointmentEntrySerializer(
+                        appointment_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = AppointmentEntrySerializer(
@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
 
 class EmotionEntry(models.Model):
@@ -24,6 +26,7 @@ class EmotionEntry(models.Model):
     emotion = models.CharField(max_length=10, choices=EMOTION_CHOICES)
     created_on = models.DateTimeField(auto_now_add=True)
     updated_on = models.DateTimeField(auto_now=True)
+    entry_date = models.DateField(_("Entry Date"), editable=False)
 
     @property
     def created_on_date(self):
@@ -39,3 +42,20 @@ class EmotionEntry(models.Model):
 
         verbose_name_plural = "Emotion Entries"
         ordering = ["created_on"]
+        indexes = [
+            models.Index(
+                fields=["user", "entry_date"], name="emotion_user_date_idx"
+            ),
+            models.Index(
+                fields=["user", "created_on", "id"],
+                name="emotion_user_created_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Populate entry_date with the local date the entry is created on
+        """
+        if self.entry_date is None:
+            self.entry_date = timezone.localdate()
+        super().save(*args, **kwargs)
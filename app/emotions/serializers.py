@@ -1,12 +1,15 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from mindfulminutes.bulk import BulkCreateListSerializer
+from mindfulminutes.fields import DynamicFieldsMixin
+
 from .models import EmotionEntry
 
 User = get_user_model()
 
 
-class EmotionEntrySerializer(serializers.ModelSerializer):
+class EmotionEntrySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for EmotionEntry model to convert it to JSON representation
     """
@@ -22,5 +25,6 @@ class EmotionEntrySerializer(serializers.ModelSerializer):
         """
 
         model = EmotionEntry
-        exclude = ("updated_on",)
+        exclude = ("updated_on", "entry_date")
         read_only_fields = ("id",)
+        list_serializer_class = BulkCreateListSerializer
@@ -9,11 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import EmotionEntry
 from .serializers import EmotionEntrySerializer
 
 
-class EmotionEntryList(APIView):
+class EmotionEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all emotion entries or create a new emotion entry
     """
@@ -29,14 +38,34 @@ class EmotionEntryList(APIView):
                 emotion_entries = EmotionEntry.objects.filter(
                     user=request.user
                 )
+                serializer = self.get_values_serializer(
+                    EmotionEntrySerializer, request
+                )
+                emotion_entries = serializer.get_queryset(
+                    emotion_entries, *KeysetPagination.ordering, "updated_on"
+                )
 
-                serializer = EmotionEntrySerializer(emotion_entries, many=True)
-                return Response(serializer.data)
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    emotion_entries, request, view=self
+                )
+
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
+
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
+                )
 
             raise MethodNotAllowed(request.method)
 
 
-class EmotionEntryListCreate(APIView):
+class EmotionEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create emotion entries for a specific date
     """
@@ -59,12 +88,27 @@ class EmotionEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 emotion_entries = EmotionEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
+                )
+                serializer = self.get_values_serializer(
+                    EmotionEntrySerializer, request
+                )
+                emotion_entries = serializer.get_queryset(emotion_entries)
+
+                not_modified = self.check_not_modified(
+                    request, emotion_entries
                 )
+                if not_modified is not None:
+                    return not_modified
 
-                serializer = EmotionEntrySerializer(emotion_entries, many=True)
-                return Response(serializer.data)
+                return self.cache_response(
+                    Response(serializer.to_representation(emotion_entries))
+                )
 
         raise MethodNotAllowed(request.method)
 
@@ -95,6 +139,9 @@ class EmotionEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(request, EmotionEntrySerializer)
+
                 serializer = EmotionEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -108,20 +155,22 @@ class EmotionEntryListCreate(APIView):
         raise MethodNotAllowed(request.method)
 
 
-class EmotionEntryDetail(APIView):
+class EmotionEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete an emotion entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get an emotion entry object from the database
-        or raise a 404 error
+        Helper method to get an emotion entry object of the user for the date
+        from the database or raise a 404 error
         """
         try:
-            return EmotionEntry.objects.get(pk=pk)
+            return EmotionEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except EmotionEntry.DoesNotExist:
             raise Http404
 
@@ -179,9 +228,16 @@ class EmotionEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    emotion_entry = self.get_object(pk)
+                    emotion_entry = self.get_object(
+                        pk, request.user, date_request
+                    )
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -191,8 +247,16 @@ class EmotionEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = EmotionEntrySerializer(emotion_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(
+                        request, emotion_entry
+                    )
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = EmotionEntrySerializer(
+                        emotion_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = EmotionEntrySerializer(
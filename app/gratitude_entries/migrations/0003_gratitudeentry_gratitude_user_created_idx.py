@@ -0,0 +1,19 @@
+# Generated by Django 4.2.10 on 2026-10-18 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gratitude_entries", "0002_gratitudeentry_entry_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gratitudeentry",
+            index=models.Index(
+                fields=["user", "created_on", "id"],
+                name="gratitude_user_created_idx",
+            ),
+        ),
+    ]
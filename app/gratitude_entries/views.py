@@ -9,11 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import GratitudeEntry
 from .serializers import GratitudeEntrySerializer
 
 
-class GratitudeEntryList(APIView):
+class GratitudeEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all gratitude entries or create a new gratitude entry
     """
@@ -29,16 +38,34 @@ class GratitudeEntryList(APIView):
                 gratitude_entries = GratitudeEntry.objects.filter(
                     user=request.user
                 )
+                serializer = self.get_values_serializer(
+                    GratitudeEntrySerializer, request
+                )
+                gratitude_entries = serializer.get_queryset(
+                    gratitude_entries, *KeysetPagination.ordering, "updated_on"
+                )
 
-                serializer = GratitudeEntrySerializer(
-                    gratitude_entries, many=True
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    gratitude_entries, request, view=self
+                )
+
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
+
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
                 )
-                return Response(serializer.data)
 
             raise MethodNotAllowed(request.method)
 
 
-class GratitudeEntryListCreate(APIView):
+class GratitudeEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create gratitude entries for a specific date
     """
@@ -61,14 +88,27 @@ class GratitudeEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 gratitude_entries = GratitudeEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
+                )
+                serializer = self.get_values_serializer(
+                    GratitudeEntrySerializer, request
+                )
+                gratitude_entries = serializer.get_queryset(gratitude_entries)
+
+                not_modified = self.check_not_modified(
+                    request, gratitude_entries
                 )
+                if not_modified is not None:
+                    return not_modified
 
-                serializer = GratitudeEntrySerializer(
-                    gratitude_entries, many=True
+                return self.cache_response(
+                    Response(serializer.to_representation(gratitude_entries))
                 )
-                return Response(serializer.data)
 
         raise MethodNotAllowed(request.method)
 
@@ -99,6 +139,11 @@ class GratitudeEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(
+                        request, GratitudeEntrySerializer
+                    )
+
                 serializer = GratitudeEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -112,20 +157,22 @@ class GratitudeEntryListCreate(APIView):
         raise MethodNotAllowed(request.method)
 
 
-class GratitudeEntryDetail(APIView):
+class GratitudeEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete a gratitude entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get a gratitude entry object from the database
-        or raise a 404 error
+        Helper method to get a gratitude entry object of the user for the date
+        from the database or raise a 404 error
         """
         try:
-            return GratitudeEntry.objects.get(pk=pk)
+            return GratitudeEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except GratitudeEntry.DoesNotExist:
             raise Http404
 
@@ -183,9 +230,16 @@ class GratitudeEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    gratitude_entry = self.get_object(pk)
+                    gratitude_entry = self.get_object(
+                        pk, request.user, date_request
+                    )
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -195,8 +249,16 @@ class GratitudeEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = GratitudeEntrySerializer(gratitude_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(
+                        request, gratitude_entry
+                    )
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = GratitudeEntrySerializer(
+                        gratitude_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = GratitudeEntrySerializer(
@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration, read from the working directory
+
+The workers write their metrics to PROMETHEUS_MULTIPROC_DIR, so /metrics
+reports all of them. It has to be set before prometheus_client is
+imported, the workers inherit it from the master process
+"""
+import os
+import shutil
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus")
+
+from prometheus_client import multiprocess  # noqa: E402
+
+
+def on_starting(server):
+    """
+    Start with an empty metrics directory, the files of a previous run
+    would be added to the new counts
+    """
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+
+
+def child_exit(server, worker):
+    """
+    Drop the live gauges of a worker that exited
+    """
+    multiprocess.mark_process_dead(worker.pid)
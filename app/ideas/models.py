@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -16,6 +17,7 @@ class IdeasEntry(models.Model):
     content = models.TextField(_("Ideas Entry"))
     created_on = models.DateTimeField(auto_now_add=True)
     updated_on = models.DateTimeField(auto_now=True)
+    entry_date = models.DateField(_("Entry Date"), editable=False)
 
     @property
     def created_on_date(self):
@@ -31,3 +33,20 @@ class IdeasEntry(models.Model):
 
         verbose_name_plural = "Ideas Entries"
         ordering = ["created_on"]
+        indexes = [
+            models.Index(
+                fields=["user", "entry_date"], name="ideas_user_date_idx"
+            ),
+            models.Index(
+                fields=["user", "created_on", "id"],
+                name="ideas_user_created_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Populate entry_date with the local date the entry is created on
+        """
+        if self.entry_date is None:
+            self.entry_date = timezone.localdate()
+        super().save(*args, **kwargs)
@@ -1,12 +1,15 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from mindfulminutes.bulk import BulkCreateListSerializer
+from mindfulminutes.fields import DynamicFieldsMixin
+
 from .models import IdeasEntry
 
 User = get_user_model()
 
 
-class IdeasEntrySerializer(serializers.ModelSerializer):
+class IdeasEntrySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for IdeasEntry model to convert it to JSON representation
     """
@@ -22,5 +25,6 @@ class IdeasEntrySerializer(serializers.ModelSerializer):
         """
 
         model = IdeasEntry
-        exclude = ("updated_on",)
+        exclude = ("updated_on", "entry_date")
         read_only_fields = ("id",)
+        list_serializer_class = BulkCreateListSerializer
@@ -9,11 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import IdeasEntry
 from .serializers import IdeasEntrySerializer
 
 
-class IdeasEntryList(APIView):
+class IdeasEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all ideas entries or create a new ideas entry
     """
@@ -27,14 +36,34 @@ class IdeasEntryList(APIView):
         if request.method == "GET":
             if request.user.slug == slug:
                 ideas_entries = IdeasEntry.objects.filter(user=request.user)
+                serializer = self.get_values_serializer(
+                    IdeasEntrySerializer, request
+                )
+                ideas_entries = serializer.get_queryset(
+                    ideas_entries, *KeysetPagination.ordering, "updated_on"
+                )
 
-                serializer = IdeasEntrySerializer(ideas_entries, many=True)
-                return Response(serializer.data)
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    ideas_entries, request, view=self
+                )
+
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
+
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
+                )
 
             raise MethodNotAllowed(request.method)
 
 
-class IdeasEntryListCreate(APIView):
+class IdeasEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create ideas entries for a specific date
     """
@@ -57,12 +86,25 @@ class IdeasEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 ideas_entries = IdeasEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
                 )
+                serializer = self.get_values_serializer(
+                    IdeasEntrySerializer, request
+                )
+                ideas_entries = serializer.get_queryset(ideas_entries)
 
-                serializer = IdeasEntrySerializer(ideas_entries, many=True)
-                return Response(serializer.data)
+                not_modified = self.check_not_modified(request, ideas_entries)
+                if not_modified is not None:
+                    return not_modified
+
+                return self.cache_response(
+                    Response(serializer.to_representation(ideas_entries))
+                )
 
         raise MethodNotAllowed(request.method)
 
@@ -93,6 +135,9 @@ class IdeasEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(request, IdeasEntrySerializer)
+
                 serializer = IdeasEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -106,20 +151,22 @@ class IdeasEntryListCreate(APIView):
         raise MethodNotAllowed(request.method)
 
 
-class IdeasEntryDetail(APIView):
+class IdeasEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete an ideas entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get an ideas entry object from the database
-        or raise a 404 error
+        Helper method to get an ideas entry object of the user for the date
+        from the database or raise a 404 error
         """
         try:
-            return IdeasEntry.objects.get(pk=pk)
+            return IdeasEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except IdeasEntry.DoesNotExist:
             raise Http404
 
@@ -177,9 +224,16 @@ class IdeasEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    ideas_entry = self.get_object(pk)
+                    ideas_entry = self.get_object(
+                        pk, request.user, date_request
+                    )
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -189,8 +243,16 @@ class IdeasEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = IdeasEntrySerializer(ideas_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(
+                        request, ideas_entry
+                    )
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = IdeasEntrySerializer(
+                        ideas_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = IdeasEntrySerializer(
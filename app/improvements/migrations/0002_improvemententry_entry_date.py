@@ -0,0 +1,42 @@
+# Generated by Django 4.2.10 on 2026-10-18 09:00
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def populate_entry_date(apps, schema_editor):
+    """
+    Backfill entry_date with the local date of created_on in one UPDATE
+    """
+    ImprovementEntry = apps.get_model("improvements", "ImprovementEntry")
+    ImprovementEntry.objects.update(entry_date=TruncDate("created_on"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("improvements", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="improvemententry",
+            name="entry_date",
+            field=models.DateField(
+                editable=False, null=True, verbose_name="Entry Date"
+            ),
+        ),
+        migrations.RunPython(
+            populate_entry_date, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AlterField(
+            model_name="improvemententry",
+            name="entry_date",
+            field=models.DateField(editable=False, verbose_name="Entry Date"),
+        ),
+        migrations.AddIndex(
+            model_name="improvemententry",
+            index=models.Index(
+                fields=["user", "entry_date"], name="improvement_user_date_idx"
+            ),
+        ),
+    ]
@@ -1,12 +1,17 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from mindfulminutes.bulk import BulkCreateListSerializer
+from mindfulminutes.fields import DynamicFieldsMixin
+
 from .models import ImprovementEntry
 
 User = get_user_model()
 
 
-class ImprovementEntrySerializer(serializers.ModelSerializer):
+class ImprovementEntrySerializer(
+    DynamicFieldsMixin, serializers.ModelSerializer
+):
     """
     Serializer for ImprovementEntry model to convert it to JSON representation
     """
@@ -22,5 +27,6 @@ class ImprovementEntrySerializer(serializers.ModelSerializer):
         """
 
         model = ImprovementEntry
-        exclude = ("updated_on",)
+        exclude = ("updated_on", "entry_date")
         read_only_fields = ("id",)
+        list_serializer_class = BulkCreateListSerializer
@@ -9,11 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import ImprovementEntry
 from .serializers import ImprovementEntrySerializer
 
 
-class ImprovementEntryList(APIView):
+class ImprovementEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all improvement entries or create a new improvement entry
     """
@@ -29,16 +38,36 @@ class ImprovementEntryList(APIView):
                 improvement_entries = ImprovementEntry.objects.filter(
                     user=request.user
                 )
+                serializer = self.get_values_serializer(
+                    ImprovementEntrySerializer, request
+                )
+                improvement_entries = serializer.get_queryset(
+                    improvement_entries,
+                    *KeysetPagination.ordering,
+                    "updated_on"
+                )
 
-                serializer = ImprovementEntrySerializer(
-                    improvement_entries, many=True
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    improvement_entries, request, view=self
+                )
+
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
+
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
                 )
-                return Response(serializer.data)
 
             raise MethodNotAllowed(request.method)
 
 
-class ImprovementEntryListCreate(APIView):
+class ImprovementEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create improvement entries for a specific date
     """
@@ -61,14 +90,29 @@ class ImprovementEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 improvement_entries = ImprovementEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
+                )
+                serializer = self.get_values_serializer(
+                    ImprovementEntrySerializer, request
+                )
+                improvement_entries = serializer.get_queryset(
+                    improvement_entries
+                )
+
+                not_modified = self.check_not_modified(
+                    request, improvement_entries
                 )
+                if not_modified is not None:
+                    return not_modified
 
-                serializer = ImprovementEntrySerializer(
-                    improvement_entries, many=True
+                return self.cache_response(
+                    Response(serializer.to_representation(improvement_entries))
                 )
-                return Response(serializer.data)
 
         raise MethodNotAllowed(request.method)
 
@@ -99,6 +143,11 @@ class ImprovementEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(
+                        request, ImprovementEntrySerializer
+                    )
+
                 serializer = ImprovementEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -112,20 +161,22 @@ class ImprovementEntryListCreate(APIView):
         raise MethodNotAllowed(request.method)
 
 
-class ImprovementEntryDetail(APIView):
+class ImprovementEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete an improvement entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get an improvement entry object from the database
-        or raise a 404 error
+        Helper method to get an improvement entry object of the user for the
+        date from the database or raise a 404 error
         """
         try:
-            return ImprovementEntry.objects.get(pk=pk)
+            return ImprovementEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except ImprovementEntry.DoesNotExist:
             raise Http404
 
@@ -185,9 +236,16 @@ class ImprovementEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    improvement_entry = self.get_object(pk)
+                    improvement_entry = self.get_object(
+                        pk, request.user, date_request
+                    )
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -197,8 +255,16 @@ class ImprovementEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = ImprovementEntrySerializer(improvement_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(
+                        request, improvement_entry
+                    )
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = ImprovementEntrySerializer(
+                        improvement_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = ImprovementEntrySerializer(
@@ -0,0 +1,31 @@
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the Job model
+
+    The class defines the display and behaviour of the Job model
+    """
+
+    readonly_fields = (
+        "created_on",
+        "locked_by",
+        "locked_at",
+        "finished_on",
+        "last_error",
+    )
+    list_display = (
+        "name",
+        "status",
+        "run_at",
+        "attempts",
+        "max_attempts",
+        "finished_on",
+    )
+    list_filter = ("status", "name", "periodic")
+    search_fields = ["name"]
+    ordering = ("-run_at",)
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from jobs.worker import JOB_POLL_INTERVAL, run_workers
+
+
+class Command(BaseCommand):
+    """
+    Run the background job workers
+
+    Every process runs a pool of worker threads, each claiming and running
+    one due job at a time. The workers stop gracefully on SIGTERM or
+    SIGINT once their current job is done
+    """
+
+    help = "Run the workers of the background job queue"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=getattr(settings, "JOB_WORKER_PROCESSES", 1),
+            help="Number of worker processes",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=getattr(settings, "JOB_WORKER_THREADS", 1),
+            help="Number of worker threads per process",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=JOB_POLL_INTERVAL,
+            help="Seconds an idle worker waits before polling again",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Stop once no job is due instead of waiting for more",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"Starting {options['processes']} process(es) with "
+            f"{options['threads']} thread(s)"
+        )
+        run_workers(
+            options["processes"],
+            options["threads"],
+            options["poll_interval"],
+            options["burst"],
+        )
+        self.stdout.write(self.style.SUCCESS("Workers stopped"))
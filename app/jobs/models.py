@@ -0,0 +1,62 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    Job model to run a registered task in the background
+
+    Jobs are claimed by the workers of the run_workers command once their
+    run_at time has come
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    name = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=QUEUED
+    )
+    periodic = models.BooleanField(default=False)
+    run_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=1)
+    last_error = models.TextField(blank=True)
+    locked_by = models.CharField(max_length=255, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    created_on = models.DateTimeField(auto_now_add=True)
+    finished_on = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """
+        Meta options for the Job model
+        """
+
+        ordering = ["run_at", "id"]
+        indexes = [
+            models.Index(
+                fields=["status", "run_at", "id"],
+                name="job_status_run_at_idx",
+            ),
+        ]
+        constraints = [
+            # a periodic task has a single pending run at a time
+            models.UniqueConstraint(
+                fields=["name"],
+                condition=Q(periodic=True, status__in=["queued", "running"]),
+                name="unique_pending_periodic_job",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
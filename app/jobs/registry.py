@@ -0,0 +1,94 @@
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Job
+
+# Registered tasks by name
+TASKS = {}
+
+
+class Task:
+    """
+    A function that can be run in the background by the workers
+
+    Calling the task runs the function right away, ``enqueue`` stores a
+    job for a worker to run it. The keyword arguments of a job are kept
+    as JSON
+    """
+
+    def __init__(self, func, name, max_attempts, every):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.every = every
+
+    def __call__(self, **kwargs):
+        return self.func(**kwargs)
+
+    def enqueue(self, run_at=None, **kwargs):
+        """
+        Queue a run of the task, at once or at ``run_at``
+
+        The job is part of the current transaction, so it is only seen by
+        the workers once the data it works on is committed
+        """
+        return Job.objects.create(
+            name=self.name,
+            kwargs=kwargs,
+            run_at=run_at or timezone.now(),
+            max_attempts=self.max_attempts,
+        )
+
+    def schedule(self, run_at=None):
+        """
+        Queue the next run of a periodic task unless one is pending
+
+        Returns the job or None when a run is already queued or running
+        """
+        try:
+            with transaction.atomic():
+                return Job.objects.create(
+                    name=self.name,
+                    periodic=True,
+                    run_at=run_at or timezone.now(),
+                    max_attempts=self.max_attempts,
+                )
+        except IntegrityError:
+            return None
+
+
+def task(func=None, *, name=None, max_attempts=3, every=None):
+    """
+    Register a function as a task
+
+    ``max_attempts`` is how often a failing job is tried. Tasks with a
+    timedelta ``every`` are periodic, the workers queue them on start and
+    queue the next run whenever one finishes
+    """
+
+    def register(func):
+        task_name = name or f"{func.__module__}.{func.__name__}"
+        TASKS[task_name] = Task(func, task_name, max_attempts, every)
+        return TASKS[task_name]
+
+    if func is not None:
+        return register(func)
+    return register
+
+
+def get_task(name):
+    """
+    Return the registered task of a name
+
+    Raises KeyError when no task of that name is registered
+    """
+    return TASKS[name]
+
+
+def schedule_periodic_tasks():
+    """
+    Queue a run of every periodic task that has none pending
+    """
+    for registered_task in TASKS.values():
+        if registered_task.every is not None:
+            registered_task.schedule()
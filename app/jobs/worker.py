@@ -0,0 +1,355 @@
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+import traceback
+from datetime import timedelta
+from multiprocessing import Process
+
+from django.conf import settings
+from django.db import (
+    DatabaseError,
+    close_old_connections,
+    connection,
+    connections,
+    transaction,
+)
+from django.db.models import F
+from django.utils import timezone
+
+from mindfulminutes.db.pool import close_pools
+
+from .models import Job
+from .registry import get_task, schedule_periodic_tasks
+
+# Seconds an idle worker waits before looking for due jobs again
+JOB_POLL_INTERVAL = getattr(settings, "JOB_POLL_INTERVAL", 1)
+
+# Seconds before the first retry of a failed job, doubled on every
+# further attempt up to JOB_MAX_RETRY_DELAY
+JOB_RETRY_DELAY = getattr(settings, "JOB_RETRY_DELAY", 10)
+JOB_MAX_RETRY_DELAY = getattr(settings, "JOB_MAX_RETRY_DELAY", 60 * 60)
+
+# Seconds after which a running job whose lock was not refreshed is taken
+# for the job of a worker that died and queued again
+JOB_TIMEOUT = getattr(settings, "JOB_TIMEOUT", 60 * 60)
+
+# Seconds between two refreshes of the lock of a running job, well below
+# JOB_TIMEOUT so long jobs are not queued again while they run
+JOB_HEARTBEAT_INTERVAL = getattr(settings, "JOB_HEARTBEAT_INTERVAL", 60)
+
+# Seconds between two looks of a worker for the stale jobs of dead workers
+JOB_REQUEUE_INTERVAL = getattr(settings, "JOB_REQUEUE_INTERVAL", 60)
+
+# Seconds a worker waits after losing the database, doubled on every
+# further error up to JOB_MAX_ERROR_DELAY
+JOB_ERROR_DELAY = getattr(settings, "JOB_ERROR_DELAY", 1)
+JOB_MAX_ERROR_DELAY = getattr(settings, "JOB_MAX_ERROR_DELAY", 60)
+
+logger = logging.getLogger(__name__)
+
+
+def get_worker_id():
+    """
+    Return the name of the current worker thread, stored on the jobs
+    it claims
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def due_jobs():
+    """
+    Return the queued jobs whose time has come, oldest first
+    """
+    return Job.objects.filter(
+        status=Job.QUEUED, run_at__lte=timezone.now()
+    ).order_by("run_at", "id")
+
+
+def claim_job(worker_id):
+    """
+    Mark the oldest due job as running for the worker and return it,
+    None when no job is due
+
+    On Postgres the job is locked with SELECT ... FOR UPDATE SKIP LOCKED,
+    so concurrent workers never wait on each other. SQLite has no row
+    locks, there a job belongs to the worker whose UPDATE changed its
+    status and the losers look for the next one
+    """
+    claim = {
+        "status": Job.RUNNING,
+        "locked_by": worker_id,
+        "locked_at": timezone.now(),
+        "attempts": F("attempts") + 1,
+    }
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = due_jobs().select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            Job.objects.filter(pk=job.pk).update(**claim)
+    else:
+        while True:
+            job = due_jobs().first()
+            if job is None:
+                return None
+            if Job.objects.filter(pk=job.pk, status=Job.QUEUED).update(
+                **claim
+            ):
+                break
+
+    job.refresh_from_db()
+    return job
+
+
+def get_retry_delay(attempts):
+    """
+    Return the delay before the next attempt of a job that failed
+    ``attempts`` times
+    """
+    return timedelta(
+        seconds=min(JOB_RETRY_DELAY * 2 ** (attempts - 1), JOB_MAX_RETRY_DELAY)
+    )
+
+
+def get_next_run(job, every):
+    """
+    Return the next run of a periodic job, skipping the runs missed
+    while no worker was running
+    """
+    next_run = job.run_at + every
+    now = timezone.now()
+    if next_run <= now:
+        next_run += every * ((now - next_run) // every + 1)
+    return next_run
+
+
+def finish_job(job, status, error=""):
+    """
+    Mark a job as done or failed for good and queue the next run of a
+    periodic task
+    """
+    with transaction.atomic():
+        job.status = status
+        job.last_error = error
+        job.finished_on = timezone.now()
+        job.save(update_fields=["status", "last_error", "finished_on"])
+
+        try:
+            registered_task = get_task(job.name)
+        except KeyError:
+            return
+        if job.periodic and registered_task.every is not None:
+            registered_task.schedule(get_next_run(job, registered_task.every))
+
+
+def retry_job(job, error):
+    """
+    Queue a failed job again after a backoff or fail it for good once it
+    used all of its attempts
+    """
+    if job.attempts >= job.max_attempts:
+        finish_job(job, Job.FAILED, error)
+        return
+
+    job.status = Job.QUEUED
+    job.last_error = error
+    job.run_at = timezone.now() + get_retry_delay(job.attempts)
+    job.save(update_fields=["status", "last_error", "run_at"])
+
+
+def keep_locked(job, done):
+    """
+    Refresh the lock of a running job every JOB_HEARTBEAT_INTERVAL
+    seconds until ``done`` is set
+    """
+    try:
+        while not done.wait(JOB_HEARTBEAT_INTERVAL):
+            try:
+                Job.objects.filter(
+                    pk=job.pk, status=Job.RUNNING, locked_by=job.locked_by
+                ).update(locked_at=timezone.now())
+            except DatabaseError:
+                logger.exception("Job %s lock not refreshed", job.pk)
+    finally:
+        connection.close()
+
+
+def run_task(job):
+    """
+    Run the task of a job, keeping the job locked from another thread
+    with its own database connection
+    """
+    done = threading.Event()
+    heartbeat = threading.Thread(target=keep_locked, args=(job, done))
+    heartbeat.start()
+    try:
+        get_task(job.name)(**job.kwargs)
+    finally:
+        done.set()
+        heartbeat.join()
+
+
+def run_job(job):
+    """
+    Run the task of a claimed job and record the outcome
+    """
+    try:
+        run_task(job)
+    except Exception:
+        logger.exception("Job %s (%s) failed", job.pk, job.name)
+        retry_job(job, traceback.format_exc())
+    else:
+        finish_job(job, Job.DONE)
+
+
+def requeue_stale_jobs():
+    """
+    Queue again the running jobs of workers that died, failing those
+    that used all of their attempts like any failed job, so periodic
+    tasks keep their next run
+    """
+    stale = Job.objects.filter(
+        status=Job.RUNNING,
+        locked_at__lt=timezone.now() - timedelta(seconds=JOB_TIMEOUT),
+    )
+    for job in stale.filter(attempts__gte=F("max_attempts")):
+        finish_job(job, Job.FAILED, "The job timed out.")
+    return stale.update(status=Job.QUEUED, run_at=timezone.now())
+
+
+def get_error_delay(errors):
+    """
+    Return the delay before a worker that hit ``errors`` database errors
+    in a row polls again
+    """
+    return min(JOB_ERROR_DELAY * 2 ** (errors - 1), JOB_MAX_ERROR_DELAY)
+
+
+def work(stop, poll_interval=JOB_POLL_INTERVAL, burst=False):
+    """
+    Run due jobs one after the other until ``stop`` is set
+
+    Every JOB_REQUEUE_INTERVAL seconds the worker also queues again the
+    jobs of workers that died. A database error, such as a dropped
+    connection or a failover, does not stop the worker, it drops its
+    connection and backs off before polling again. In burst mode the
+    worker returns as soon as no job is due. Returns the number of jobs
+    run
+    """
+    worker_id = get_worker_id()
+    processed = 0
+    errors = 0
+    next_requeue = time.monotonic()
+    while not stop.is_set():
+        try:
+            if time.monotonic() >= next_requeue:
+                requeue_stale_jobs()
+                next_requeue = time.monotonic() + JOB_REQUEUE_INTERVAL
+
+            job = claim_job(worker_id)
+            if job is None:
+                if burst:
+                    break
+                errors = 0
+                stop.wait(poll_interval)
+                continue
+            run_job(job)
+            processed += 1
+            errors = 0
+        except DatabaseError:
+            errors += 1
+            delay = get_error_delay(errors)
+            logger.exception(
+                "Worker %s lost the database, retrying in %s seconds",
+                worker_id,
+                delay,
+            )
+            stop.wait(delay)
+        # between jobs, like at the end of a request, unless the worker
+        # runs inside a transaction as in the tests
+        if not connection.in_atomic_block:
+            close_old_connections()
+    return processed
+
+
+def work_in_thread(stop, poll_interval, burst):
+    """
+    Run a worker in its own thread with its own database connection
+    """
+    try:
+        work(stop, poll_interval, burst)
+    finally:
+        connection.close()
+
+
+def run_process(threads, poll_interval=JOB_POLL_INTERVAL, burst=False):
+    """
+    Run worker threads in the current process until it is asked to stop
+    with SIGTERM or SIGINT
+    """
+    stop = threading.Event()
+    handlers = {
+        signum: signal.signal(signum, lambda *args: stop.set())
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    try:
+        if threads == 1:
+            return work(stop, poll_interval, burst)
+
+        workers = [
+            threading.Thread(
+                target=work_in_thread, args=(stop, poll_interval, burst)
+            )
+            for _ in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+
+
+def run_workers(
+    processes=1, threads=1, poll_interval=JOB_POLL_INTERVAL, burst=False
+):
+    """
+    Prepare the queue and run the worker processes
+
+    The periodic tasks are scheduled before any worker starts
+    """
+    schedule_periodic_tasks()
+
+    if processes == 1:
+        run_process(threads, poll_interval, burst)
+        return
+
+    # the forked processes must not share the connections of the parent,
+    # closing hands pooled connections back to their pool, close those too
+    connections.close_all()
+    close_pools()
+    children = [
+        Process(target=run_process, args=(threads, poll_interval, burst))
+        for _ in range(processes)
+    ]
+    for child in children:
+        child.start()
+
+    def terminate(*args):
+        for child in children:
+            child.terminate()
+
+    handlers = {
+        signum: signal.signal(signum, terminate)
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    try:
+        for child in children:
+            child.join()
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
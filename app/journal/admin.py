@@ -0,0 +1,18 @@
+from django.contrib import admin
+
+from .models import DaySnapshot
+
+
+@admin.register(DaySnapshot)
+class DaySnapshotAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the DaySnapshot model
+
+    The class defines the display and behaviour of the DaySnapshot model
+    """
+
+    readonly_fields = ("user", "day", "created_on")
+    list_display = ("user", "day", "created_on")
+    fields = ("user", "day", "created_on")
+    search_fields = ["user__email", "day"]
+    ordering = ("-day",)
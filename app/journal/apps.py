@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class JournalConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "journal"
+
+    def ready(self):
+        from .signals import connect_entry_signals
+
+        connect_entry_signals()
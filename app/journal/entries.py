@@ -0,0 +1,151 @@
+import calendar
+from datetime import date, timedelta
+
+from appointments.models import AppointmentEntry
+from appointments.serializers import AppointmentEntrySerializer
+from emotions.models import EmotionEntry
+from emotions.serializers import EmotionEntrySerializer
+from gratitude_entries.models import GratitudeEntry
+from gratitude_entries.serializers import GratitudeEntrySerializer
+from ideas.models import IdeasEntry
+from ideas.serializers import IdeasEntrySerializer
+from improvements.models import ImprovementEntry
+from improvements.serializers import ImprovementEntrySerializer
+from knowledge_entries.models import KnowledgeEntry
+from knowledge_entries.serializers import KnowledgeEntrySerializer
+from mindfulminutes.fanout import fan_out
+from mindfulminutes.values import ValuesSerializer
+from notes.models import NoteEntry
+from notes.serializers import NoteEntrySerializer
+from targets.models import TargetEntry
+from targets.serializers import TargetEntrySerializer
+from user_settings.models import UserSettings
+from wins.models import WinEntry
+from wins.serializers import WinEntrySerializer
+
+# Every journal entry type, keyed by the name used in combined payloads
+ENTRY_TYPES = {
+    "appointments": (AppointmentEntry, AppointmentEntrySerializer),
+    "emotions": (EmotionEntry, EmotionEntrySerializer),
+    "gratitude": (GratitudeEntry, GratitudeEntrySerializer),
+    "ideas": (IdeasEntry, IdeasEntrySerializer),
+    "improvements": (ImprovementEntry, ImprovementEntrySerializer),
+    "knowledge": (KnowledgeEntry, KnowledgeEntrySerializer),
+    "notes": (NoteEntry, NoteEntrySerializer),
+    "targets": (TargetEntry, TargetEntrySerializer),
+    "wins": (WinEntry, WinEntrySerializer),
+}
+
+
+def serialize_day(user, requested_date):
+    """
+    Serialize the entries of every type a user has for a single date
+
+    Issues exactly one query per entry type using the
+    (user, entry_date) index, the queries run concurrently
+    """
+
+    def serialize_type(entry_type):
+        model, serializer_class = ENTRY_TYPES[entry_type]
+        serializer = ValuesSerializer(serializer_class)
+        entries = serializer.get_queryset(
+            model.objects.filter(user=user, entry_date=requested_date)
+        )
+        return serializer.to_representation(entries)
+
+    return dict(zip(ENTRY_TYPES, fan_out(serialize_type, ENTRY_TYPES)))
+
+
+def get_week_start(user, requested_date):
+    """
+    Return the first day of the week containing the date, using the start
+    week day the user has set or Monday
+
+    Raises OverflowError when the week runs past the first or last date
+    """
+    start_week_day = (
+        UserSettings.objects.filter(user=user)
+        .values_list("start_week_day", flat=True)
+        .first()
+    ) or 1
+    week_start = requested_date - timedelta(
+        days=(requested_date.isoweekday() - start_week_day) % 7
+    )
+    if week_start > date.max - timedelta(days=6):
+        raise OverflowError("date value out of range")
+    return week_start
+
+
+def serialize_week(user, week_start):
+    """
+    Serialize the entries of every type a user has for the seven days
+    from week_start, keyed by date and entry type
+
+    Issues exactly one range query per entry type using the
+    (user, entry_date) index, the queries run concurrently
+    """
+    days = [week_start + timedelta(days=offset) for offset in range(7)]
+
+    def serialize_type(entry_type):
+        model, serializer_class = ENTRY_TYPES[entry_type]
+        serializer = ValuesSerializer(serializer_class)
+        entries = serializer.get_queryset(
+            model.objects.filter(
+                user=user, entry_date__range=(days[0], days[-1])
+            ),
+            "entry_date",
+        )
+
+        entries_by_day = {day: [] for day in days}
+        for entry in entries:
+            entries_by_day[entry.entry_date].append(entry)
+        return {
+            day: serializer.to_representation(day_entries)
+            for day, day_entries in entries_by_day.items()
+        }
+
+    type_entries = fan_out(serialize_type, ENTRY_TYPES)
+    return {
+        day.isoformat(): {
+            entry_type: entries_by_day[day]
+            for entry_type, entries_by_day in zip(ENTRY_TYPES, type_entries)
+        }
+        for day in days
+    }
+
+
+def get_month_end(month_start):
+    """
+    Return the last day of the month starting on month_start
+    """
+    days_in_month = calendar.monthrange(month_start.year, month_start.month)[1]
+    return month_start + timedelta(days=days_in_month - 1)
+
+
+def month_presence(user, month_start):
+    """
+    Return for each day of the month a bitmask of the entry types the
+    user has entries of, bit n standing for the nth type of ENTRY_TYPES
+
+    Issues one distinct entry_date query per entry type, which is
+    answered from the (user, entry_date) index alone, the queries run
+    concurrently
+    """
+    month_end = get_month_end(month_start)
+
+    def entry_dates(model):
+        return list(
+            model.objects.filter(
+                user=user, entry_date__range=(month_start, month_end)
+            )
+            .order_by()
+            .values_list("entry_date", flat=True)
+            .distinct()
+        )
+
+    models = [model for model, _ in ENTRY_TYPES.values()]
+    days = [0] * month_end.day
+    for bit, dates in enumerate(fan_out(entry_dates, models)):
+        for entry_date in dates:
+            days[entry_date.day - 1] |= 1 << bit
+    return days
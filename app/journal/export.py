@@ -0,0 +1,206 @@
+import csv
+import heapq
+import zipfile
+from itertools import islice
+
+from mindfulminutes.renderers import FastJSONRenderer
+from mindfulminutes.values import ValuesSerializer
+
+from .entries import ENTRY_TYPES
+
+# Number of rows fetched from the database at a time
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "csv": ("text/csv", "csv"),
+    "md.zip": ("application/zip", "zip"),
+}
+
+
+def iter_entries(user, entry_type, ordering=("id",), **filters):
+    """
+    Yield (row, serialized entry) for the entries of one type of the
+    user, fetched in chunks in the given order
+    """
+    model, serializer_class = ENTRY_TYPES[entry_type]
+    serializer = ValuesSerializer(serializer_class)
+    entries = model.objects.filter(user=user, **filters)
+    rows = serializer.get_queryset(entries, "entry_date", *ordering)
+    rows = rows.order_by(*ordering)
+
+    rows = rows.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    while chunk := list(islice(rows, EXPORT_CHUNK_SIZE)):
+        yield from zip(chunk, serializer.to_representation(chunk))
+
+
+def iter_journal(user, start_type=None, after=None):
+    """
+    Yield (entry type, entry) for every entry of the user, type by type,
+    with the day the entry belongs to
+
+    The export can be resumed from an entry type and the id of the last
+    entry exported of that type
+    """
+    entry_types = list(ENTRY_TYPES)
+    if start_type is not None:
+        start = entry_types.index(start_type)
+        entry_types = entry_types[start:]
+    else:
+        after = None
+
+    for entry_type in entry_types:
+        filters = {} if after is None else {"id__gt": after}
+        for row, entry in iter_entries(user, entry_type, **filters):
+            yield entry_type, {
+                "entry_date": row.entry_date.isoformat(),
+                **entry,
+            }
+        after = None
+
+
+class Echo:
+    """
+    File-like object that returns what is written to it, so the csv
+    writer hands each row back to the response
+    """
+
+    def write(self, value):
+        return value
+
+
+class StreamBuffer:
+    """
+    Unseekable file-like object collecting what is written to it, so the
+    zip archive can be streamed member by member
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        """
+        Return and forget everything written since the last call
+        """
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def export_jsonl(user, start_type=None, after=None):
+    """
+    Stream the journal as one JSON object per line
+    """
+    renderer = FastJSONRenderer()
+    for entry_type, entry in iter_journal(user, start_type, after):
+        yield renderer.render({"type": entry_type, **entry}) + b"\n"
+
+
+def csv_columns():
+    """
+    Return the CSV header, the entry type and day and the fields of all
+    types
+    """
+    columns = ["type", "entry_date"]
+    for _, serializer_class in ENTRY_TYPES.values():
+        for field_name in serializer_class().fields:
+            if field_name not in columns:
+                columns.append(field_name)
+    return columns
+
+
+def export_csv(user, start_type=None, after=None):
+    """
+    Stream the journal as CSV, one row per entry
+    """
+    writer = csv.DictWriter(Echo(), csv_columns(), restval="")
+    yield writer.writeheader()
+    for entry_type, entry in iter_journal(user, start_type, after):
+        yield writer.writerow({"type": entry_type, **entry})
+
+
+def markdown_line(entry):
+    """
+    Return the Markdown list item of an entry
+    """
+    if "time_from" in entry:
+        text = f"{entry['time_from']}–{entry['time_until']} {entry['title']}"
+    elif "completed" in entry:
+        checkbox = "x" if entry["completed"] else " "
+        text = f"[{checkbox}] {entry['title']}"
+    else:
+        text = entry.get("content") or entry.get("title") or entry["emotion"]
+    return f"- {text}\n"
+
+
+def markdown_day(day, entries):
+    """
+    Return the Markdown document of the entries of one day
+    """
+    lines = [f"# {day}\n"]
+    for entry_type in ENTRY_TYPES:
+        type_entries = [
+            entry
+            for entry_type_, entry in entries
+            if entry_type_ == entry_type
+        ]
+        if type_entries:
+            lines.append(f"\n## {entry_type.capitalize()}\n\n")
+            lines.extend(markdown_line(entry) for entry in type_entries)
+    return "".join(lines)
+
+
+def tag_entries(rows, position, entry_type):
+    """
+    Yield (entry date, position, entry type, entry) for rows of one type
+    """
+    for row, entry in rows:
+        yield row.entry_date, position, entry_type, entry
+
+
+def iter_days(user, after=None):
+    """
+    Yield (day, [(entry type, entry), ...]) for every day with entries,
+    merging the entry tables by entry_date
+    """
+    filters = {} if after is None else {"entry_date__gt": after}
+    streams = []
+    for position, entry_type in enumerate(ENTRY_TYPES):
+        rows = iter_entries(
+            user, entry_type, ordering=("entry_date", "id"), **filters
+        )
+        streams.append(tag_entries(rows, position, entry_type))
+
+    day, entries = None, []
+    for entry_date, _, entry_type, entry in heapq.merge(
+        *streams, key=lambda item: item[:2]
+    ):
+        if entry_date != day:
+            if entries:
+                yield day, entries
+            day, entries = entry_date, []
+        entries.append((entry_type, entry))
+    if entries:
+        yield day, entries
+
+
+def export_markdown_zip(user, after=None):
+    """
+    Stream the journal as a zip archive with one Markdown file per day,
+    starting after the day ``after``
+    """
+    output = StreamBuffer()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        for day, entries in iter_days(user, after):
+            archive.writestr(
+                f"{day.isoformat()}.md", markdown_day(day, entries)
+            )
+            yield output.pop()
+    yield output.pop()
@@ -0,0 +1,177 @@
+import csv
+import json
+from collections import defaultdict
+from datetime import date, datetime, time
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+from mindfulminutes.bulk import entries_created
+from mindfulminutes.cache import invalidate_user_entries
+
+from .entries import ENTRY_TYPES
+
+# Number of records validated and inserted in one transaction
+IMPORT_BATCH_SIZE = 1000
+
+IMPORT_FORMATS = ("jsonl", "csv")
+
+
+def read_jsonl(stream):
+    """
+    Yield (line number, record) for every line of a JSON lines stream,
+    the record is None when the line is not valid JSON
+    """
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError:
+            yield line_number, None
+
+
+def read_csv(stream):
+    """
+    Yield (line number, record) for every row of a CSV stream with a
+    header, leaving out empty columns
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        record = {
+            column: value
+            for column, value in row.items()
+            if column is not None and value not in ("", None)
+        }
+        yield reader.line_num, record
+
+
+READERS = {"jsonl": read_jsonl, "csv": read_csv}
+
+
+def get_entry_date(value, today):
+    """
+    Return the day of an imported entry, today when it has none
+
+    Raises ValueError for anything but a YYYY-MM-DD date up to today
+    """
+    if value is None:
+        return today
+    entry_date = date.fromisoformat(value)
+    if entry_date > today:
+        raise ValueError
+    return entry_date
+
+
+def backdate_entries(model, entries, today):
+    """
+    Set created_on of the imported entries of past days to the start of
+    their day, so they are listed with their day instead of as the
+    newest entries
+
+    bulk_create always fills the auto_now_add created_on with the current
+    time, the past entries are updated afterwards in one query
+    """
+    past_entries = [entry for entry in entries if entry.entry_date < today]
+    for entry in past_entries:
+        entry.created_on = timezone.make_aware(
+            datetime.combine(entry.entry_date, time.min)
+        )
+    if past_entries:
+        model.objects.bulk_update(past_entries, ["created_on"])
+
+
+def import_batch(user, batch, today):
+    """
+    Validate a batch of (line number, record) and insert the valid
+    entries in one transaction
+
+    Returns the number of entries created and the errors of the others
+    """
+    errors = []
+    records_by_type = defaultdict(list)
+    for line_number, record in batch:
+        if not isinstance(record, dict):
+            errors.append({"line": line_number, "errors": ["Invalid record."]})
+            continue
+
+        data = dict(record)
+        entry_type = data.pop("type", None)
+        if entry_type not in ENTRY_TYPES:
+            errors.append(
+                {"line": line_number, "errors": {"type": ["Unknown type."]}}
+            )
+            continue
+        try:
+            entry_date = get_entry_date(data.pop("entry_date", None), today)
+        except (TypeError, ValueError):
+            errors.append(
+                {
+                    "line": line_number,
+                    "errors": {"entry_date": ["Invalid date."]},
+                }
+            )
+            continue
+        records_by_type[entry_type].append((line_number, entry_date, data))
+
+    created = 0
+    days = set()
+    with transaction.atomic():
+        for entry_type, records in records_by_type.items():
+            model, serializer_class = ENTRY_TYPES[entry_type]
+            serializer = serializer_class(
+                data=[data for _, _, data in records],
+                many=True,
+                context={"allow_partial": True},
+            )
+            serializer.is_valid()
+
+            invalid = set()
+            for entry_error in serializer.entry_errors:
+                invalid.add(entry_error["index"])
+                errors.append(
+                    {
+                        "line": records[entry_error["index"]][0],
+                        "errors": entry_error["errors"],
+                    }
+                )
+            valid_records = [
+                record
+                for index, record in enumerate(records)
+                if index not in invalid
+            ]
+
+            entries = model.objects.bulk_create(
+                model(user=user, entry_date=entry_date, **attrs)
+                for (_, entry_date, _), attrs in zip(
+                    valid_records, serializer.validated_data
+                )
+            )
+            backdate_entries(model, entries, today)
+            entries_created.send(sender=model, entries=entries)
+            created += len(entries)
+            days.update(entry.entry_date for entry in entries)
+
+    if days:
+        # bulk_create sends no post_save signals
+        invalidate_user_entries(user.pk, min(days))
+    errors.sort(key=lambda error: error["line"])
+    return created, errors
+
+
+def import_journal(user, stream, import_format, batch_size=None):
+    """
+    Import the entries of a JSON lines or CSV stream for the user
+
+    The stream is read and validated through the entry serializers in
+    batches, every batch is inserted with bulk_create in its own
+    transaction. Yields (last line number, entries created, errors) after
+    each batch, so the caller can report progress and keep the errors
+    """
+    batch_size = batch_size or IMPORT_BATCH_SIZE
+    today = timezone.localdate()
+    records = READERS[import_format](stream)
+    while batch := list(islice(records, batch_size)):
+        created, errors = import_batch(user, batch, today)
+        yield batch[-1][0], created, errors
@@ -0,0 +1,80 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from journal.imports import IMPORT_BATCH_SIZE, IMPORT_FORMATS, import_journal
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Import journal entries of a user from a JSON lines or CSV file
+
+    Every record names its entry type with ``type`` and may name the day
+    it belongs to with ``entry_date``, so exports of the journal can be
+    imported as they are. Invalid records are skipped and written to the
+    error file with their line number
+    """
+
+    help = "Import journal entries from a JSON lines or CSV file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", help="Slug of the user to import for")
+        parser.add_argument("path", help="File to import")
+        parser.add_argument(
+            "--format",
+            dest="import_format",
+            choices=IMPORT_FORMATS,
+            help="Format of the file, guessed from its extension by default",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="Number of records inserted in one transaction",
+        )
+        parser.add_argument(
+            "--errors",
+            dest="errors_path",
+            help="File the invalid records are written to as JSON lines, "
+            "defaults to the imported file with an .errors.jsonl suffix",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(slug=options["slug"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user with the slug {options['slug']}")
+
+        path = options["path"]
+        import_format = options["import_format"] or path.rsplit(".", 1)[-1]
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError(
+                "Cannot guess the format of the file, please use --format"
+            )
+        errors_path = options["errors_path"] or f"{path}.errors.jsonl"
+
+        created = failed = 0
+        with open(path, encoding="utf-8", newline="") as stream, open(
+            errors_path, "w", encoding="utf-8"
+        ) as errors_file:
+            for line_number, batch_created, errors in import_journal(
+                user, stream, import_format, options["batch_size"]
+            ):
+                created += batch_created
+                failed += len(errors)
+                for error in errors:
+                    errors_file.write(json.dumps(error) + "\n")
+                self.stdout.write(
+                    f"Line {line_number}: {created} created, {failed} failed"
+                )
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {created} entry(ies)"))
+        if failed:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{failed} record(s) failed, see {errors_path}"
+                )
+            )
@@ -0,0 +1,33 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from journal.sealing import seal_finished_days
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Seal the finished days of every user into compressed snapshots
+
+    The command is incremental and can be run nightly, it seals the past
+    days that have no snapshot, including days unsealed since the last
+    run
+    """
+
+    help = "Seal finished days into compressed day snapshots"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            dest="slug",
+            help="Only seal the days of the user with this slug",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by("pk")
+        if options["slug"]:
+            users = users.filter(slug=options["slug"])
+
+        sealed = seal_finished_days(users)
+        self.stdout.write(self.style.SUCCESS(f"Sealed {sealed} day(s)"))
@@ -0,0 +1,87 @@
+from django.db import migrations
+
+# Copied from journal.search, the position of a type is part of the row
+# id in the SQLite index
+SEARCH_FIELDS = [
+    ("appointments", "appointments", "AppointmentEntry", "title"),
+    ("gratitude", "gratitude_entries", "GratitudeEntry", "content"),
+    ("ideas", "ideas", "IdeasEntry", "content"),
+    ("improvements", "improvements", "ImprovementEntry", "content"),
+    ("knowledge", "knowledge_entries", "KnowledgeEntry", "content"),
+    ("notes", "notes", "NoteEntry", "content"),
+    ("targets", "targets", "TargetEntry", "title"),
+    ("wins", "wins", "WinEntry", "title"),
+]
+
+
+def search_tables(apps):
+    for position, (entry_type, app_label, model_name, field) in enumerate(
+        SEARCH_FIELDS
+    ):
+        model = apps.get_model(app_label, model_name)
+        yield position, entry_type, model._meta.db_table, field
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Add a generated tsvector column with a GIN index to every searched
+    table on Postgres, or create and fill the FTS5 table on SQLite
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for _, _, table, field in search_tables(apps):
+            schema_editor.execute(
+                f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+                "GENERATED ALWAYS AS "
+                f"(to_tsvector('english', coalesce({field}, ''))) STORED"
+            )
+            schema_editor.execute(
+                f"CREATE INDEX {table}_search_idx "
+                f"ON {table} USING gin (search_vector)"
+            )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE journal_search USING fts5("
+            "text, user_id UNINDEXED, entry_type UNINDEXED, "
+            "entry_id UNINDEXED, entry_date UNINDEXED, "
+            "tokenize='porter unicode61')"
+        )
+        for position, entry_type, table, field in search_tables(apps):
+            schema_editor.execute(
+                "INSERT INTO journal_search "
+                "(rowid, text, user_id, entry_type, entry_id, entry_date) "
+                f"SELECT id * 16 + {position}, {field}, user_id, "
+                f"'{entry_type}', id, entry_date FROM {table}"
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    """
+    Remove the search columns and indexes or the FTS5 table
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for _, _, table, _ in search_tables(apps):
+            schema_editor.execute(
+                f"ALTER TABLE {table} DROP COLUMN search_vector"
+            )
+    elif vendor == "sqlite":
+        schema_editor.execute("DROP TABLE journal_search")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("journal", "0001_initial"),
+        ("appointments", "0003_appointmententry_appointment_user_created_idx"),
+        ("gratitude_entries", "0003_gratitudeentry_gratitude_user_created_idx"),
+        ("ideas", "0003_ideasentry_ideas_user_created_idx"),
+        ("improvements", "0003_improvemententry_improvement_user_created_idx"),
+        ("knowledge_entries", "0003_knowledgeentry_knowledge_user_created_idx"),
+        ("notes", "0003_noteentry_note_user_created_idx"),
+        ("targets", "0004_targetentry_target_user_created_idx"),
+        ("wins", "0003_winentry_win_user_created_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,56 @@
+import json
+import zlib
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class DaySnapshot(models.Model):
+    """
+    DaySnapshot model to store all entries a user has for a finished day
+
+    The day payload is kept as zlib compressed JSON, so a sealed day is
+    read with one unique index lookup instead of a query per entry type
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="day_snapshots",
+    )
+    day = models.DateField(_("Day"))
+    data = models.BinaryField(_("Data"))
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Meta options for the DaySnapshot model
+        """
+
+        verbose_name_plural = "Day Snapshots"
+        ordering = ["user", "day"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "day"], name="unique_user_day_snapshot"
+            ),
+        ]
+
+    @staticmethod
+    def compress(day_entries):
+        """
+        Returns the compressed JSON of a day payload
+        """
+        return zlib.compress(
+            json.dumps(day_entries, cls=JSONEncoder).encode("utf-8")
+        )
+
+    def load(self):
+        """
+        Returns the day payload stored in the snapshot
+        """
+        return json.loads(zlib.decompress(self.data))
+
+    def __str__(self):
+        return f"{self.user} {self.day}"
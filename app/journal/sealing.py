@@ -0,0 +1,63 @@
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .entries import ENTRY_TYPES, serialize_day
+from .models import DaySnapshot
+
+
+def unsealed_days(user, before):
+    """
+    Return the days before the given date on which the user has entries
+    and that are not sealed yet, oldest first
+
+    The days are found with an anti-join against the snapshots, so days
+    unsealed after a change or filled by an import are sealed again by
+    the next run, and a run that is interrupted continues where it
+    stopped. Both sides are read from the (user, day) indexes
+    """
+    sealed = DaySnapshot.objects.filter(user=user, day=OuterRef("entry_date"))
+    days = set()
+    for model, _ in ENTRY_TYPES.values():
+        days.update(
+            model.objects.filter(user=user, entry_date__lt=before)
+            .filter(~Exists(sealed))
+            .order_by()
+            .values_list("entry_date", flat=True)
+            .distinct()
+        )
+    return sorted(days)
+
+
+def seal_day(user, day):
+    """
+    Store a snapshot of all entries the user has for the day
+    """
+    with transaction.atomic():
+        snapshot, _ = DaySnapshot.objects.update_or_create(
+            user=user,
+            day=day,
+            defaults={"data": DaySnapshot.compress(serialize_day(user, day))},
+        )
+    return snapshot
+
+
+def unseal_day(user_id, day):
+    """
+    Remove the snapshot of a day whose entries have changed
+    """
+    DaySnapshot.objects.filter(user_id=user_id, day=day).delete()
+
+
+def seal_finished_days(users):
+    """
+    Seal the days before today of the users and return how many days
+    were sealed
+    """
+    today = timezone.localdate()
+    sealed = 0
+    for user in users.iterator():
+        for day in unsealed_days(user, today):
+            seal_day(user, day)
+            sealed += 1
+    return sealed
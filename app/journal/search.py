@@ -0,0 +1,222 @@
+import re
+
+from django.db import connection
+from django.utils.html import escape
+
+from .entries import ENTRY_TYPES
+
+# Entry types with free text and the field searched, the position of a
+# type is part of the row id in the SQLite index
+SEARCH_FIELDS = {
+    "appointments": "title",
+    "gratitude": "content",
+    "ideas": "content",
+    "improvements": "content",
+    "knowledge": "content",
+    "notes": "content",
+    "targets": "title",
+    "wins": "title",
+}
+
+# Text search configuration of the Postgres tsvector columns
+SEARCH_CONFIG = "english"
+
+# Control characters wrapping the matches of a snippet, replaced by
+# <mark> tags once the snippet is HTML escaped
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+
+FTS_TABLE = "journal_search"
+
+
+def search_terms(query):
+    """
+    Return the words of a search query
+    """
+    return re.findall(r"\w+", query)
+
+
+def highlight(snippet):
+    """
+    Return the snippet HTML escaped with the matches wrapped in <mark>
+    """
+    return (
+        escape(snippet)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+class PostgresSearch:
+    """
+    Search the generated tsvector columns of the entry tables
+
+    Every table has a stored search_vector column with a GIN index, so
+    matching and ranking never touch the text itself. Snippets are only
+    built for the rows of the requested page
+    """
+
+    def search(self, user, query, limit, offset):
+        """
+        Return (entry type, id, entry date, snippet) rows ranked by
+        relevance
+        """
+        selects = []
+        params = []
+        for entry_type, field in SEARCH_FIELDS.items():
+            model, _ = ENTRY_TYPES[entry_type]
+            selects.append(
+                f"SELECT %s AS entry_type, id, entry_date, {field} AS text, "
+                "ts_rank(search_vector, search.query) AS rank "
+                f"FROM {model._meta.db_table}, search "
+                "WHERE user_id = %s AND search_vector @@ search.query"
+            )
+            params += [entry_type, user.pk]
+
+        sql = (
+            "WITH search AS (SELECT websearch_to_tsquery(%s, %s) AS query) "
+            "SELECT entry_type, id, entry_date, "
+            "ts_headline(%s, text, search.query, %s) "
+            f"FROM ({' UNION ALL '.join(selects)}) AS hits, search "
+            "ORDER BY rank DESC, entry_date DESC, id DESC "
+            "LIMIT %s OFFSET %s"
+        )
+        options = (
+            f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+            # fragments drop the words before a match ending a short text
+            "MaxWords=24, MinWords=12"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql,
+                # in the order of the placeholders, the headline comes
+                # before the selects of the entry types
+                [SEARCH_CONFIG, query, SEARCH_CONFIG, options, *params]
+                + [limit, offset],
+            )
+            return cursor.fetchall()
+
+    def index(self, entry_type, entries):
+        """
+        Nothing to do, the database keeps the tsvector columns up to date
+        """
+
+    def remove(self, entry_type, entry):
+        """
+        Nothing to do, the database keeps the tsvector columns up to date
+        """
+
+    def purge_user(self, user_id, batch_size):
+        """
+        Nothing to do, the tsvector columns go with the entries
+        """
+        return 0
+
+
+class SQLiteSearch:
+    """
+    Search the FTS5 shadow table used on SQLite
+
+    The table is kept in sync by signals. The row id of an entry is
+    derived from its id and type, so updates and deletes are lookups
+    """
+
+    types = list(SEARCH_FIELDS)
+
+    def get_rowid(self, entry_type, entry_id):
+        return entry_id * 16 + self.types.index(entry_type)
+
+    def search(self, user, query, limit, offset):
+        """
+        Return (entry type, id, entry date, snippet) rows ranked by
+        relevance
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+
+        match = " ".join(f'"{term}"' for term in terms)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT entry_type, entry_id, entry_date, "
+                f"snippet({FTS_TABLE}, 0, %s, %s, '…', 24) "
+                f"FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND user_id = %s "
+                "ORDER BY rank, entry_date DESC, entry_id DESC "
+                "LIMIT %s OFFSET %s",
+                [HIGHLIGHT_START, HIGHLIGHT_STOP, match, user.pk]
+                + [limit, offset],
+            )
+            return cursor.fetchall()
+
+    def index(self, entry_type, entries):
+        """
+        Add or replace the text of entries in the search table
+        """
+        field = SEARCH_FIELDS[entry_type]
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT OR REPLACE INTO {FTS_TABLE} "
+                "(rowid, text, user_id, entry_type, entry_id, entry_date) "
+                "VALUES (%s, %s, %s, %s, %s, %s)",
+                [
+                    (
+                        self.get_rowid(entry_type, entry.pk),
+                        getattr(entry, field),
+                        entry.user_id,
+                        entry_type,
+                        entry.pk,
+                        entry.entry_date.isoformat(),
+                    )
+                    for entry in entries
+                ],
+            )
+
+    def remove(self, entry_type, entry):
+        """
+        Remove an entry from the search table
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s",
+                [self.get_rowid(entry_type, entry.pk)],
+            )
+
+    def purge_user(self, user_id, batch_size):
+        """
+        Remove up to ``batch_size`` entries of a user from the search
+        table and return how many were removed
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN ("
+                f"SELECT rowid FROM {FTS_TABLE} WHERE user_id = %s LIMIT %s)",
+                [user_id, batch_size],
+            )
+            return cursor.rowcount
+
+
+def get_search_backend():
+    """
+    Return the search backend of the database in use
+    """
+    if connection.vendor == "postgresql":
+        return PostgresSearch()
+    return SQLiteSearch()
+
+
+def search_entries(user, query, limit, offset=0):
+    """
+    Return the entries of the user matching the query, best match first,
+    with a highlighted snippet of the matching text
+    """
+    rows = get_search_backend().search(user, query, limit, offset)
+    return [
+        {
+            "type": entry_type,
+            "id": entry_id,
+            "entry_date": str(entry_date),
+            "snippet": highlight(snippet),
+        }
+        for entry_type, entry_id, entry_date, snippet in rows
+    ]
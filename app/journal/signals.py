@@ -0,0 +1,101 @@
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from mindfulminutes.bulk import entries_created
+from mindfulminutes.cache import invalidate_user_entries
+from user_settings.models import UserSettings
+
+from .entries import ENTRY_TYPES
+from .models import DaySnapshot
+from .sealing import unseal_day
+from .search import SEARCH_FIELDS, get_search_backend
+
+# The entry type of every searched entry model
+SEARCH_TYPES = {
+    ENTRY_TYPES[entry_type][0]: entry_type for entry_type in SEARCH_FIELDS
+}
+
+
+def invalidate_entry_cache(sender, instance, **kwargs):
+    """
+    Invalidate the cached responses of the owner of a saved
+    or deleted entry
+    """
+    invalidate_user_entries(instance.user_id, instance.entry_date)
+
+
+def invalidate_day_snapshot(sender, instance, **kwargs):
+    """
+    Remove the snapshot of a sealed day when one of its entries
+    is saved or deleted
+    """
+    if instance.entry_date < timezone.localdate():
+        unseal_day(instance.user_id, instance.entry_date)
+
+
+def invalidate_day_snapshots(sender, entries, **kwargs):
+    """
+    Remove the snapshots of the sealed days entries were created
+    in bulk for
+    """
+    today = timezone.localdate()
+    past_days = {
+        (entry.user_id, entry.entry_date)
+        for entry in entries
+        if entry.entry_date < today
+    }
+    for user_id in {user_id for user_id, _ in past_days}:
+        DaySnapshot.objects.filter(
+            user_id=user_id,
+            day__in=[day for user, day in past_days if user == user_id],
+        ).delete()
+
+
+def index_entry(sender, instance, **kwargs):
+    """
+    Add a saved entry to the search index
+    """
+    get_search_backend().index(SEARCH_TYPES[sender], [instance])
+
+
+def index_entries(sender, entries, **kwargs):
+    """
+    Add entries created in bulk to the search index
+    """
+    if sender in SEARCH_TYPES:
+        get_search_backend().index(SEARCH_TYPES[sender], entries)
+
+
+def remove_entry_from_index(sender, instance, **kwargs):
+    """
+    Remove a deleted entry from the search index
+    """
+    get_search_backend().remove(SEARCH_TYPES[sender], instance)
+
+
+def invalidate_settings_cache(sender, instance, **kwargs):
+    """
+    Invalidate the cached weeks of a user whose start week day
+    may have changed
+    """
+    invalidate_user_entries(instance.user_id)
+
+
+def connect_entry_signals():
+    """
+    Connect the cache and snapshot invalidation and the search index
+    to every journal entry model and the user settings
+    """
+    for model, _ in ENTRY_TYPES.values():
+        for handler in (invalidate_entry_cache, invalidate_day_snapshot):
+            post_save.connect(handler, sender=model)
+            post_delete.connect(handler, sender=model)
+
+    for model in SEARCH_TYPES:
+        post_save.connect(index_entry, sender=model)
+        post_delete.connect(remove_entry_from_index, sender=model)
+    entries_created.connect(invalidate_day_snapshots)
+    entries_created.connect(index_entries)
+
+    post_save.connect(invalidate_settings_cache, sender=UserSettings)
+    post_delete.connect(invalidate_settings_cache, sender=UserSettings)
@@ -0,0 +1,17 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+
+from jobs.registry import task
+
+from .sealing import seal_finished_days
+
+User = get_user_model()
+
+
+@task(every=timedelta(days=1))
+def seal_days():
+    """
+    Seal the days every user finished since the last run
+    """
+    seal_finished_days(User.objects.order_by("pk"))
@@ -0,0 +1,43 @@
+from django.urls import path
+
+from .views import (
+    CalendarMonth,
+    DayEntryList,
+    EntrySearch,
+    JournalExport,
+    JournalImport,
+    WeekEntryList,
+)
+
+urlpatterns = [
+    path(
+        "api/users/<str:slug>/day/<str:date_request>/",
+        DayEntryList.as_view(),
+        name="day-entry-list",
+    ),
+    path(
+        "api/users/<str:slug>/week/<str:date_request>/",
+        WeekEntryList.as_view(),
+        name="week-entry-list",
+    ),
+    path(
+        "api/users/<str:slug>/calendar/<str:month_request>/",
+        CalendarMonth.as_view(),
+        name="calendar-month",
+    ),
+    path(
+        "api/users/<str:slug>/search/",
+        EntrySearch.as_view(),
+        name="entry-search",
+    ),
+    path(
+        "api/users/<str:slug>/export/",
+        JournalExport.as_view(),
+        name="journal-export",
+    ),
+    path(
+        "api/users/<str:slug>/import/",
+        JournalImport.as_view(),
+        name="journal-import",
+    ),
+]
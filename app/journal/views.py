@@ -0,0 +1,385 @@
+import io
+from datetime import date, datetime
+
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from mindfulminutes.cache import EntryCacheMixin
+
+from .entries import (
+    ENTRY_TYPES,
+    get_month_end,
+    get_week_start,
+    month_presence,
+    serialize_day,
+    serialize_week,
+)
+from .export import (
+    EXPORT_FORMATS,
+    export_csv,
+    export_jsonl,
+    export_markdown_zip,
+)
+from .imports import IMPORT_FORMATS, import_journal
+from .models import DaySnapshot
+from .search import search_entries
+
+
+class DayEntryList(EntryCacheMixin, APIView):
+    """
+    List the entries of every type for a specific date
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, slug, date_request):
+        """
+        List all entries for the date, keyed by entry type
+        """
+        if request.user.slug != slug:
+            return Response(
+                {"error": "You are not authorised to access these entries."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        try:
+            requested_date = date.fromisoformat(date_request)
+        except ValueError:
+            return Response(
+                {"error": "Invalid date format. Please use YYYY-MM-DD."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cached = self.get_cached_response(request, requested_date)
+        if cached is not None:
+            return cached
+
+        if self.past_day:
+            try:
+                snapshot = DaySnapshot.objects.get(
+                    user=request.user, day=requested_date
+                )
+            except DaySnapshot.DoesNotExist:
+                pass
+            else:
+                return self.cache_response(Response(snapshot.load()))
+
+        day_entries = serialize_day(request.user, requested_date)
+        return self.cache_response(Response(day_entries))
+
+
+class WeekEntryList(EntryCacheMixin, APIView):
+    """
+    List the entries of every type for the week of a specific date
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, slug, date_request):
+        """
+        List all entries for the seven days of the week, keyed by date
+        and entry type
+
+        The week starts on the start week day of the user's settings
+        """
+        if request.user.slug != slug:
+            return Response(
+                {"error": "You are not authorised to access these entries."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        try:
+            requested_date = date.fromisoformat(date_request)
+        except ValueError:
+            return Response(
+                {"error": "Invalid date format. Please use YYYY-MM-DD."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # weeks are not cached as immutable, their alignment follows
+        # the user's settings
+        cached = self.get_cached_response(request)
+        if cached is not None:
+            return cached
+
+        try:
+            week_start = get_week_start(request.user, requested_date)
+        except OverflowError:
+            return Response(
+                {"error": "Invalid date format. Please use YYYY-MM-DD."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        week_entries = serialize_week(request.user, week_start)
+        return self.cache_response(Response(week_entries))
+
+
+class CalendarMonth(EntryCacheMixin, APIView):
+    """
+    List which entry types a user has on each day of a month
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, slug, month_request):
+        """
+        Return a bitmask of the entry types for every day of the month
+
+        ``types`` lists the entry types in bit order, ``days`` holds the
+        bitmask of the first day of the month at index 0
+        """
+        if request.user.slug != slug:
+            return Response(
+                {"error": "You are not authorised to access these entries."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        try:
+            month_start = datetime.strptime(month_request, "%Y-%m").date()
+        except ValueError:
+            return Response(
+                {"error": "Invalid month format. Please use YYYY-MM."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cached = self.get_cached_response(request, get_month_end(month_start))
+        if cached is not None:
+            return cached
+
+        return self.cache_response(
+            Response(
+                {
+                    "month": month_start.strftime("%Y-%m"),
+                    "types": list(ENTRY_TYPES),
+                    "days": month_presence(request.user, month_start),
+                }
+            )
+        )
+
+
+class EntrySearch(APIView):
+    """
+    Search the free text of all journal entries of a user
+    """
+
+    permission_classes = [IsAuthenticated]
+    page_size = 20
+    max_page_size = 100
+    # last page whose offset fits in the 64 bit integers of the databases
+    max_page = (2**63 - 1) // max_page_size
+
+    def get(self, request, slug):
+        """
+        List the entries matching ?q=, best match first, with a snippet
+        of the matching text
+
+        The matches in the snippet are wrapped in <mark> tags, the rest of
+        the snippet is HTML escaped. Pages are selected with ?page= and
+        the following page is linked in the Link header
+        """
+        if request.user.slug != slug:
+            return Response(
+                {"error": "You are not authorised to access these entries."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"error": "Please provide a search query with ?q=."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            page = self.get_positive_int(request, "page", 1, self.max_page)
+        except ValueError:
+            return Response(
+                {"error": f"Please provide a page up to {self.max_page}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        page_size = min(
+            self.get_positive_int(request, "page_size", self.page_size),
+            self.max_page_size,
+        )
+
+        # fetch one result more than needed to know if there is a next page
+        results = search_entries(
+            request.user, query, page_size + 1, (page - 1) * page_size
+        )
+
+        headers = {}
+        if len(results) > page_size:
+            next_link = replace_query_param(
+                request.build_absolute_uri(), "page", page + 1
+            )
+            headers["Link"] = f'<{next_link}>; rel="next"'
+        return Response(results[:page_size], headers=headers)
+
+    def get_positive_int(self, request, name, default, maximum=None):
+        """
+        Return a positive integer query parameter or the default
+
+        Raises ValueError when the value is above ``maximum``
+        """
+        try:
+            value = int(request.query_params[name])
+        except (KeyError, ValueError):
+            return default
+        if maximum is not None and value > maximum:
+            raise ValueError(f"{name} is above {maximum}")
+        return value if value > 0 else default
+
+
+class FileFormatContentNegotiation(DefaultContentNegotiation):
+    """
+    Content negotiation ignoring ?format=, which names the format of an
+    exported or imported file rather than a renderer
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+class JournalExport(APIView):
+    """
+    Export all journal entries of a user
+    """
+
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = FileFormatContentNegotiation
+
+    def get(self, request, slug):
+        """
+        Stream every entry of the user as JSON lines, CSV or a zip of
+        Markdown files, one per day, chosen with ?format=
+
+        JSON lines and CSV list the entries type by type in id order and
+        can be resumed with ?type= and ?after=, the id of the last entry
+        received of that type. The Markdown export can be resumed with
+        ?after=, the last day received
+        """
+        if request.user.slug != slug:
+            return Response(
+                {"error": "You are not authorised to access these entries."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        export_format = request.query_params.get("format", "jsonl")
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {
+                    "error": "Invalid format. Please use "
+                    f"{', '.join(EXPORT_FORMATS)}."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        after = request.query_params.get("after")
+        try:
+            if export_format == "md.zip":
+                if after is not None:
+                    after = date.fromisoformat(after)
+                content = export_markdown_zip(request.user, after)
+            else:
+                start_type = request.query_params.get("type")
+                if start_type is not None and start_type not in ENTRY_TYPES:
+                    raise ValueError
+                if after is not None:
+                    after = int(after)
+                exporter = (
+                    export_csv if export_format == "csv" else export_jsonl
+                )
+                content = exporter(request.user, start_type, after)
+        except ValueError:
+            return Response(
+                {"error": "Invalid export position."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        content_type, extension = EXPORT_FORMATS[export_format]
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="mindful-minutes-{slug}.{extension}"'
+        return response
+
+
+class JournalImport(APIView):
+    """
+    Import journal entries of a user from an uploaded file
+    """
+
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = FileFormatContentNegotiation
+    # the number of errors returned, the others are only counted
+    max_reported_errors = 100
+
+    def post(self, request, slug):
+        """
+        Import the JSON lines or CSV file uploaded as ``file``, the format
+        is chosen with ?format= or guessed from the file name
+
+        Every record names its entry type with ``type`` and may name its
+        day with ``entry_date``. The file is read and inserted in batches,
+        invalid records are skipped and returned with their line number
+
+        Responses for past days are sent to browsers as immutable, so a
+        browser that already read a day the import adds entries to keeps
+        showing its copy until it expires or the browser cache is cleared
+        """
+        if request.user.slug != slug:
+            return Response(
+                {"error": "You are not authorised to import these entries."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"error": "Please upload the file to import as file."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        import_format = request.query_params.get(
+            "format", upload.name.rsplit(".", 1)[-1]
+        )
+        if import_format not in IMPORT_FORMATS:
+            return Response(
+                {
+                    "error": "Invalid format. Please use "
+                    f"{', '.join(IMPORT_FORMATS)}."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        created = failed = 0
+        reported_errors = []
+        stream = io.TextIOWrapper(upload, encoding="utf-8", newline="")
+        try:
+            for _, batch_created, errors in import_journal(
+                request.user, stream, import_format
+            ):
+                created += batch_created
+                failed += len(errors)
+                reported_errors += errors[
+                    : self.max_reported_errors - len(reported_errors)
+                ]
+        except UnicodeDecodeError:
+            return Response(
+                {
+                    "error": "The file must be UTF-8 encoded.",
+                    "created": created,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {"created": created, "failed": failed, "errors": reported_errors},
+            status=status.HTTP_207_MULTI_STATUS
+            if failed
+            else status.HTTP_201_CREATED,
+        )
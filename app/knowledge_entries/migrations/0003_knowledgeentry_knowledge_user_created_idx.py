@@ -0,0 +1,19 @@
+# Generated by Django 4.2.10 on 2026-10-18 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("knowledge_entries", "0002_knowledgeentry_entry_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="knowledgeentry",
+            index=models.Index(
+                fields=["user", "created_on", "id"],
+                name="knowledge_user_created_idx",
+            ),
+        ),
+    ]
@@ -9,11 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import KnowledgeEntry
 from .serializers import KnowledgeEntrySerializer
 
 
-class KnowledgeEntryList(APIView):
+class KnowledgeEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all knowledge entries or create new knowledge entry
     """
@@ -29,16 +38,34 @@ class KnowledgeEntryList(APIView):
                 knowledge_entries = KnowledgeEntry.objects.filter(
                     user=request.user
                 )
+                serializer = self.get_values_serializer(
+                    KnowledgeEntrySerializer, request
+                )
+                knowledge_entries = serializer.get_queryset(
+                    knowledge_entries, *KeysetPagination.ordering, "updated_on"
+                )
 
-                serializer = KnowledgeEntrySerializer(
-                    knowledge_entries, many=True
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    knowledge_entries, request, view=self
+                )
+
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
+
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
                 )
-                return Response(serializer.data)
 
             raise MethodNotAllowed(request.method)
 
 
-class KnowledgeEntryListCreate(APIView):
+class KnowledgeEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create knowledge entries for a specific date
     """
@@ -61,14 +88,27 @@ class KnowledgeEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 knowledge_entries = KnowledgeEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
+                )
+                serializer = self.get_values_serializer(
+                    KnowledgeEntrySerializer, request
+                )
+                knowledge_entries = serializer.get_queryset(knowledge_entries)
+
+                not_modified = self.check_not_modified(
+                    request, knowledge_entries
                 )
+                if not_modified is not None:
+                    return not_modified
 
-                serializer = KnowledgeEntrySerializer(
-                    knowledge_entries, many=True
+                return self.cache_response(
+                    Response(serializer.to_representation(knowledge_entries))
                 )
-                return Response(serializer.data)
 
         raise MethodNotAllowed(request.method)
 
@@ -99,6 +139,11 @@ class KnowledgeEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(
+                        request, KnowledgeEntrySerializer
+                    )
+
                 serializer = KnowledgeEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -112,20 +157,22 @@ class KnowledgeEntryListCreate(APIView):
         raise MethodNotAllowed(request.method)
 
 
-class KnowledgeEntryDetail(APIView):
+class KnowledgeEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete an knowledge entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get an knowledge entry object from the database
-        or raise a 404 error
+        Helper method to get an knowledge entry object of the user for the date
+        from the database or raise a 404 error
         """
         try:
-            return KnowledgeEntry.objects.get(pk=pk)
+            return KnowledgeEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except KnowledgeEntry.DoesNotExist:
             raise Http404
 
@@ -183,9 +230,16 @@ class KnowledgeEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    knowledge_entry = self.get_object(pk)
+                    knowledge_entry = self.get_object(
+                        pk, request.user, date_request
+                    )
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -195,8 +249,16 @@ class KnowledgeEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = KnowledgeEntrySerializer(knowledge_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(
+                        request, knowledge_entry
+                    )
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = KnowledgeEntrySerializer(
+                        knowledge_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = KnowledgeEntrySerializer(
@@ -0,0 +1,98 @@
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.response import Response
+
+from .cache import invalidate_user_entries
+
+# Upper bound on the number of entries accepted in one bulk request
+MAX_BULK_ENTRIES = 500
+
+# Sent with the model as sender and the created entries, since
+# bulk_create sends no post_save signals
+entries_created = Signal()
+
+
+class BulkCreateListSerializer(serializers.ListSerializer):
+    """
+    List serializer that inserts all entries with a single bulk_create
+
+    When the context sets ``allow_partial`` invalid entries are skipped
+    and their errors are kept in ``entry_errors`` instead of failing the
+    whole list
+    """
+
+    def to_internal_value(self, data):
+        """
+        Validate every entry of the list
+        """
+        if not self.context.get("allow_partial") or not isinstance(data, list):
+            return super().to_internal_value(data)
+
+        validated_entries = []
+        self.entry_errors = []
+        for index, item in enumerate(data):
+            try:
+                validated_entries.append(self.child.run_validation(item))
+            except serializers.ValidationError as exc:
+                self.entry_errors.append(
+                    {"index": index, "errors": exc.detail}
+                )
+        return validated_entries
+
+    def create(self, validated_data):
+        """
+        Create all entries with one INSERT statement
+        """
+        model = self.child.Meta.model
+        entry_date = timezone.localdate()
+        # bulk_create skips Model.save(), so entry_date is set here
+        entries = [
+            model(entry_date=entry_date, **attrs) for attrs in validated_data
+        ]
+        return model.objects.bulk_create(entries)
+
+
+def bulk_create_entries(request, serializer_class):
+    """
+    Create the list of entries sent in the request body for the user
+
+    Either every entry is created or, when the request sets
+    ``?allow_partial=true``, the valid entries are created and the errors
+    of the others are returned alongside them
+    """
+    if len(request.data) > MAX_BULK_ENTRIES:
+        return Response(
+            {
+                "error": f"No more than {MAX_BULK_ENTRIES} entries can be "
+                "created at once."
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    allow_partial = request.query_params.get("allow_partial") == "true"
+    serializer = serializer_class(
+        data=request.data, many=True, context={"allow_partial": allow_partial}
+    )
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    with transaction.atomic():
+        entries = serializer.save(user=request.user)
+        entries_created.send(
+            sender=serializer.child.Meta.model, entries=entries
+        )
+    # bulk_create sends no post_save signals
+    invalidate_user_entries(request.user.pk)
+
+    if not allow_partial:
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    entry_errors = serializer.entry_errors
+    return Response(
+        {"created": serializer.data, "errors": entry_errors},
+        status=status.HTTP_207_MULTI_STATUS
+        if entry_errors
+        else status.HTTP_201_CREATED,
+    )
@@ -0,0 +1,152 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.crypto import md5
+from rest_framework.response import Response
+
+from .conditional import ConditionalGetMixin
+from .metrics import record_cache_lookup
+from .replicas import mark_recent_write, read_database
+
+ENTRY_CACHE_ALIAS = getattr(settings, "ENTRY_CACHE_ALIAS", "default")
+ENTRY_CACHE_TIMEOUT = getattr(settings, "ENTRY_CACHE_TIMEOUT", 60 * 60 * 24)
+
+# Past days cannot be changed through the entry endpoints, browsers may
+# keep them for a year. A journal import can add entries to past days,
+# browsers that cached such a day do not see them until it expires
+PAST_DAY_MAX_AGE = 60 * 60 * 24 * 365
+
+
+def get_entry_cache():
+    """
+    Return the cache backend the entry responses are stored in
+    """
+    return caches[ENTRY_CACHE_ALIAS]
+
+
+def _generation_key(user_id, past=False):
+    scope = "history" if past else "generation"
+    return f"entries:{scope}:{user_id}"
+
+
+def get_generation(user_id, past=False):
+    """
+    Return the current cache generation of a user's entries
+
+    A missing counter starts from the current time rather than 1, so an
+    evicted counter can never bring back responses of an old generation
+    """
+    cache = get_entry_cache()
+    key = _generation_key(user_id, past)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def _bump_generation(key):
+    cache = get_entry_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_user_entries(user_id, entry_date=None):
+    """
+    Invalidate the cached entry responses of a user in O(1)
+
+    Bumping the generation changes all the user's cache keys, the stale
+    responses simply expire. Responses for past days are kept under a
+    separate generation that only changes when an entry of a past day is
+    written, which the API itself never does. The reads of the user go
+    to the primary database until the replicas caught up with the write
+    """
+    mark_recent_write(user_id)
+    _bump_generation(_generation_key(user_id))
+    if entry_date is not None and entry_date < timezone.localdate():
+        _bump_generation(_generation_key(user_id, past=True))
+
+
+def entry_cache_key(request, past=False):
+    """
+    Return the cache key of the response to a read request
+    """
+    user_id = request.user.pk
+    generation = get_generation(user_id, past)
+    path = md5(request.get_full_path().encode()).hexdigest()
+    return f"entries:{user_id}:{generation}:{int(past)}:{path}"
+
+
+class EntryCacheMixin(ConditionalGetMixin):
+    """
+    Mixin for entry views to serve reads from the entry cache
+
+    The serialized data is stored together with its validators, so a
+    cached read needs neither a query nor serialization and conditional
+    requests are still answered with 304. Responses for past days are
+    stored without expiry and marked immutable for the browser. Reads
+    served by a replica may miss recent writes of other sessions, they
+    are neither stored nor marked immutable
+    """
+
+    past_day = False
+    from_replica = False
+
+    def get_cached_response(self, request, requested_date=None):
+        """
+        Return the cached response to the request or None on a miss
+        """
+        self.past_day = (
+            requested_date is not None
+            and requested_date < timezone.localdate()
+        )
+        self.from_replica = read_database.get() is not None
+        self.cache_key = entry_cache_key(request, self.past_day)
+        cached = get_entry_cache().get(self.cache_key)
+        record_cache_lookup("entries", cached is not None)
+        if cached is None:
+            return None
+
+        data, self.etag, self.last_modified = cached
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        return Response(data)
+
+    def cache_response(self, response):
+        """
+        Store the data of a response in the entry cache and return it
+        """
+        if self.from_replica:
+            return response
+        get_entry_cache().set(
+            self.cache_key,
+            (response.data, self.etag, self.last_modified),
+            timeout=None if self.past_day else ENTRY_CACHE_TIMEOUT,
+        )
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Mark successful reads of past days as immutable
+        """
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        if (
+            self.past_day
+            and not self.from_replica
+            and response.status_code in (200, 304)
+        ):
+            patch_cache_control(
+                response,
+                private=True,
+                max_age=PAST_DAY_MAX_AGE,
+                immutable=True,
+            )
+        return response
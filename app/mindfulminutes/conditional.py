@@ -0,0 +1,90 @@
+from django.db.models import Count, Max, Model
+from django.utils.cache import get_conditional_response
+from django.utils.crypto import md5
+from django.utils.http import http_date
+
+
+def entry_validators(request, entries, has_next=False):
+    """
+    Return a weak ETag and the Last-Modified timestamp for entries
+
+    ``entries`` is either a single entry, a queryset or the list of rows
+    of a page. For a queryset the validators come from one aggregate of
+    max(updated_on) and the row count, so deletions change the ETag as
+    well. For a page they come from the ids and updated_on of its rows
+    and ``has_next``, so they cost no query over the rest of the history.
+    The requested path is part of the ETag because pages of a list share
+    the same scope
+    """
+    if isinstance(entries, Model):
+        last_modified, version = entries.updated_on, 1
+    elif isinstance(entries, list):
+        last_modified = max(
+            (entry.updated_on for entry in entries), default=None
+        )
+        version = ",".join(
+            f"{entry.id}:{entry.updated_on.timestamp()}" for entry in entries
+        )
+        version = f"{version}:{int(has_next)}"
+    else:
+        stats = entries.order_by().aggregate(
+            last_modified=Max("updated_on"), count=Count("pk")
+        )
+        last_modified, version = stats["last_modified"], stats["count"]
+
+    timestamp = last_modified.timestamp() if last_modified else 0
+    digest = md5(
+        f"{request.get_full_path()}:{version}:{timestamp}".encode()
+    ).hexdigest()
+    return f'W/"{digest}"', last_modified
+
+
+class ConditionalGetMixin:
+    """
+    Mixin for entry views to answer conditional GET requests
+
+    Views call ``check_not_modified`` with the entries the response is
+    built from before serializing anything, paginated lists with the rows
+    of the page. The validators are then sent with the final response
+    """
+
+    etag = None
+    last_modified = None
+
+    def check_not_modified(self, request, entries, has_next=False):
+        """
+        Return a 304 response when the client copy of entries is current,
+        otherwise None
+        """
+        self.etag, self.last_modified = entry_validators(
+            request, entries, has_next
+        )
+        return self.get_not_modified_response(request)
+
+    def get_not_modified_response(self, request):
+        """
+        Return a 304 response when the client copy matches the validators
+        of the view, otherwise None
+        """
+        return get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=int(self.last_modified.timestamp())
+            if self.last_modified
+            else None,
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Add the ETag and Last-Modified headers to successful reads
+        """
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        if self.etag is not None and response.status_code in (200, 304):
+            response.headers["ETag"] = self.etag
+            if self.last_modified is not None:
+                response.headers["Last-Modified"] = http_date(
+                    self.last_modified.timestamp()
+                )
+        return response
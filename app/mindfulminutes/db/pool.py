@@ -0,0 +1,214 @@
+import threading
+import time
+from collections import deque
+
+from django.db.utils import OperationalError
+
+# Connection pools of the process by key, see pooled.base.get_pool_key
+POOLS = {}
+
+
+class PoolTimeout(OperationalError):
+    """
+    No connection became free within the acquire timeout
+    """
+
+
+class ConnectionPool:
+    """
+    Thread safe pool of database connections
+
+    Connections are opened by the ``connect`` callable given to acquire
+    and ``check`` raises when an idle connection is no longer usable.
+    Connections idle for more than ``check_interval`` seconds are checked
+    before they are handed out, instead of pinging the database on every
+    request. Connections idle for more than ``max_idle`` seconds are
+    closed, except for ``min_size`` connections that are kept open. The
+    pool does not open connections ahead of use, so ``min_size`` is only
+    the number of connections idle reaping leaves open
+    """
+
+    def __init__(
+        self,
+        check=None,
+        min_size=0,
+        max_size=10,
+        timeout=30,
+        max_idle=600,
+        check_interval=30,
+    ):
+        self.check = check
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.check_interval = check_interval
+
+        self.condition = threading.Condition()
+        # (connection, time it was released), the most recent last
+        self.idle = deque()
+        self.size = 0
+        self.in_use = 0
+
+        self.acquired = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.timeouts = 0
+        self.opened = 0
+        self.closed = 0
+
+    def acquire(self, connect):
+        """
+        Return a free connection, opening one with ``connect`` while the
+        pool is below its maximum size and waiting for one otherwise
+
+        Raises PoolTimeout when no connection is free within the timeout
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+        with self.condition:
+            while True:
+                stale = self.reap_idle()
+                if self.idle:
+                    connection, released = self.idle.pop()
+                    break
+                if self.size < self.max_size:
+                    connection = released = None
+                    self.size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeout(
+                        f"No database connection free within "
+                        f"{self.timeout} seconds"
+                    )
+                waited = True
+                self.condition.wait(remaining)
+
+            if waited:
+                self.waits += 1
+                self.wait_time += time.monotonic() - start
+            self.acquired += 1
+            self.in_use += 1
+
+        self.close_connections(stale)
+        try:
+            if connection is None:
+                return self.open(connect)
+            if time.monotonic() - released > self.check_interval:
+                return self.checked(connection, connect)
+            return connection
+        except BaseException:
+            with self.condition:
+                self.size -= 1
+                self.in_use -= 1
+                self.condition.notify()
+            raise
+
+    def release(self, connection, discard=False):
+        """
+        Give a connection back to the pool, closing it when it is
+        discarded as unusable
+        """
+        with self.condition:
+            self.in_use -= 1
+            if discard:
+                self.size -= 1
+            else:
+                self.idle.append((connection, time.monotonic()))
+            self.condition.notify()
+        if discard:
+            self.close_connections([connection])
+
+    def open(self, connect):
+        connection = connect()
+        with self.condition:
+            self.opened += 1
+        return connection
+
+    def checked(self, connection, connect):
+        """
+        Return the connection if it passes the health check or a new one
+        in its place
+        """
+        if self.check is None:
+            return connection
+        try:
+            self.check(connection)
+        except Exception:
+            self.close_connections([connection])
+            return self.open(connect)
+        return connection
+
+    def reap_idle(self):
+        """
+        Take the connections idle for too long out of the pool and return
+        them to be closed, called with the condition held
+        """
+        stale = []
+        expired = time.monotonic() - self.max_idle
+        while (
+            self.idle
+            and self.idle[0][1] < expired
+            and self.size > self.min_size
+        ):
+            stale.append(self.idle.popleft()[0])
+            self.size -= 1
+        return stale
+
+    def close_connections(self, connections):
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        if connections:
+            with self.condition:
+                self.closed += len(connections)
+
+    def close_all(self):
+        """
+        Close the idle connections, for instance before the process forks
+        """
+        with self.condition:
+            connections = [connection for connection, _ in self.idle]
+            self.idle.clear()
+            self.size -= len(connections)
+        self.close_connections(connections)
+
+    def stats(self):
+        """
+        Return the usage counters of the pool
+        """
+        with self.condition:
+            return {
+                "size": self.size,
+                "in_use": self.in_use,
+                "idle": len(self.idle),
+                "max_size": self.max_size,
+                "acquired": self.acquired,
+                "waits": self.waits,
+                "wait_time": round(self.wait_time, 6),
+                "timeouts": self.timeouts,
+                "opened": self.opened,
+                "closed": self.closed,
+            }
+
+
+def close_pools():
+    """
+    Close the idle connections of every pool of the process, so processes
+    forked afterwards do not share their sockets
+    """
+    for pool in POOLS.values():
+        pool.close_all()
+
+
+def get_pool_stats():
+    """
+    Return the stats of the connection pools of the process by key
+    """
+    return {alias: pool.stats() for alias, pool in POOLS.items()}
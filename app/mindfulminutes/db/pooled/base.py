@@ -0,0 +1,111 @@
+import threading
+
+from django.db.backends.postgresql.base import (
+    DatabaseWrapper as PostgresDatabaseWrapper,
+)
+from django.utils.crypto import md5
+
+from ..pool import POOLS, ConnectionPool
+from .creation import DatabaseCreation
+
+# Defaults of the POOL options of a database using this backend
+POOL_DEFAULTS = {
+    "MIN_SIZE": 0,
+    "MAX_SIZE": 10,
+    "TIMEOUT": 30,
+    "MAX_IDLE": 600,
+    "CHECK_INTERVAL": 30,
+}
+
+# libpq transaction states shared by psycopg2 and psycopg
+TRANSACTION_STATUS_IDLE = 0
+TRANSACTION_STATUS_UNKNOWN = 4
+
+_pools_lock = threading.Lock()
+
+
+def check_connection(connection):
+    """
+    Raise when a pooled connection can no longer run a query
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+        connection.rollback()
+
+
+def get_pool_key(alias, conn_params):
+    """
+    Return the key of the pool of a database alias and its connection
+    parameters, so a pool never hands out a connection opened with other
+    settings. The parameters are hashed to keep the password out of the
+    pool stats
+    """
+    params = repr(sorted(conn_params.items())).encode()
+    return f"{alias}:{md5(params, usedforsecurity=False).hexdigest()[:8]}"
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    """
+    Postgres backend taking its connections from a pool shared by the
+    threads of the process
+
+    Closing the connection at the end of a request hands it back to the
+    pool, so it is meant to be used with CONN_MAX_AGE = 0 and without
+    CONN_HEALTH_CHECKS. The pool is configured with the POOL dictionary
+    of the database settings, see POOL_DEFAULTS
+    """
+
+    creation_class = DatabaseCreation
+
+    def get_pool(self, conn_params):
+        """
+        Return the pool of the connection parameters, created on first use
+        """
+        key = get_pool_key(self.alias, conn_params)
+        with _pools_lock:
+            if key not in POOLS:
+                options = {
+                    **POOL_DEFAULTS,
+                    **self.settings_dict.get("POOL", {}),
+                }
+                POOLS[key] = ConnectionPool(
+                    check=check_connection,
+                    min_size=options["MIN_SIZE"],
+                    max_size=options["MAX_SIZE"],
+                    timeout=options["TIMEOUT"],
+                    max_idle=options["MAX_IDLE"],
+                    check_interval=options["CHECK_INTERVAL"],
+                )
+        return POOLS[key]
+
+    def get_new_connection(self, conn_params):
+        # the connection goes back to the pool it was taken from
+        self.pool = self.get_pool(conn_params)
+        return self.pool.acquire(
+            lambda: super(DatabaseWrapper, self).get_new_connection(
+                conn_params
+            )
+        )
+
+    def _close(self):
+        """
+        Hand the connection back to the pool, rolled back if a
+        transaction is left open, or drop it when it is broken
+        """
+        if self.connection is None:
+            return
+        connection = self.connection
+        discard = bool(connection.closed)
+        with self.wrap_database_errors:
+            try:
+                if not discard:
+                    status = connection.info.transaction_status
+                    if status == TRANSACTION_STATUS_UNKNOWN:
+                        discard = True
+                    elif status != TRANSACTION_STATUS_IDLE:
+                        connection.rollback()
+            except Exception:
+                discard = True
+            finally:
+                self.pool.release(connection, discard=discard)
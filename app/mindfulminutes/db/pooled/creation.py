@@ -0,0 +1,17 @@
+from django.db.backends.postgresql.creation import (
+    DatabaseCreation as PostgresDatabaseCreation,
+)
+
+from ..pool import close_pools
+
+
+class DatabaseCreation(PostgresDatabaseCreation):
+    """
+    Test database creation closing the pooled connections first
+    """
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # idle pooled connections to the test database would make
+        # DROP DATABASE fail
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
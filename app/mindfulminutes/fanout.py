@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from threading import Lock
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from .timing import track_queries
+
+# Threads of the pool the queries of one read are spread over, shared by
+# all requests of a process, so it also bounds the extra database
+# connections. Below 2 the queries run one after the other
+FANOUT_THREADS = getattr(settings, "FANOUT_THREADS", 4)
+
+_executor = None
+_executor_lock = Lock()
+
+
+def get_executor():
+    """
+    Return the thread pool of the process, created on first use
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=FANOUT_THREADS, thread_name_prefix="fanout"
+            )
+    return _executor
+
+
+def _call(func, item):
+    try:
+        with track_queries():
+            return func(item)
+    finally:
+        # pool threads keep their own connection as long as
+        # CONN_MAX_AGE allows, like request threads do
+        close_old_connections()
+
+
+def fan_out(func, items):
+    """
+    Return [func(item) for item in items], calling func for the items
+    concurrently on the thread pool
+
+    Every pool thread queries over its own connection, so a read made of
+    one query per entry table takes about as long as its slowest query.
+    Inside a transaction the calls run in order on the current
+    connection, as the other connections would not see its writes
+    """
+    items = list(items)
+    if FANOUT_THREADS < 2 or len(items) < 2 or connection.in_atomic_block:
+        return [func(item) for item in items]
+    # every call runs in a copy of the context of the caller, so the
+    # database routing of the request applies to it
+    return list(
+        get_executor().map(
+            lambda context, item: context.run(_call, func, item),
+            [copy_context() for _ in items],
+            items,
+        )
+    )
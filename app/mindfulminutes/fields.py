@@ -0,0 +1,98 @@
+from django.core.exceptions import FieldDoesNotExist
+
+from .timing import measure
+from .values import ValuesSerializer
+
+
+class DynamicFieldsMixin:
+    """
+    Serializer mixin to limit the serialized fields
+
+    Takes an optional ``fields`` argument with the names of the fields to
+    keep and an optional ``exclude`` argument with the names to drop
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        exclude = kwargs.pop("exclude", None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+        for field_name in set(exclude or ()) & set(self.fields):
+            self.fields.pop(field_name)
+
+    def to_representation(self, instance):
+        with measure("serialize"):
+            return super().to_representation(instance)
+
+    def only_serialized_fields(self, queryset, *required):
+        """
+        Return the queryset loading only the columns the serializer reads
+
+        The queryset is returned unchanged when a field is not read from a
+        concrete column of the model, such as nested or method fields
+        """
+        model = queryset.model
+        columns = {model._meta.pk.name, *required}
+        for field in self.fields.values():
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return queryset
+            if not model_field.concrete or model_field.many_to_many:
+                return queryset
+            columns.add(model_field.name)
+        return queryset.only(*columns)
+
+
+class SparseFieldsetMixin:
+    """
+    Mixin for views to serialize only the fields a client asks for
+
+    ``?fields=`` lists the fields to return and ``?exclude=`` the fields
+    to leave out, both comma separated. The same projection is applied to
+    the queryset, so columns that are not returned are not loaded either
+    """
+
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+
+    def get_fieldset(self, request):
+        """
+        Return the serializer arguments for the requested fields
+        """
+        fieldset = {}
+        for argument, param in (
+            ("fields", self.fields_query_param),
+            ("exclude", self.exclude_query_param),
+        ):
+            value = request.query_params.get(param)
+            if value:
+                fieldset[argument] = [
+                    name.strip() for name in value.split(",") if name.strip()
+                ]
+        return fieldset
+
+    def get_sparse_queryset(
+        self, queryset, serializer_class, request, required=()
+    ):
+        """
+        Return the queryset deferring the columns that are not requested
+
+        ``required`` names columns the view itself reads, such as the
+        ordering fields of the pagination
+        """
+        fieldset = self.get_fieldset(request)
+        if not fieldset:
+            return queryset
+
+        serializer = serializer_class(**fieldset)
+        return serializer.only_serialized_fields(queryset, *required)
+
+    def get_values_serializer(self, serializer_class, request):
+        """
+        Return the fast read only serializer for the requested fields
+        """
+        return ValuesSerializer(serializer_class, **self.get_fieldset(request))
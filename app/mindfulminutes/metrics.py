@@ -0,0 +1,101 @@
+import os
+import time
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+)
+
+from .timing import RequestTimings, request_timings, track_queries
+
+# Label of the requests whose URL did not resolve to a view
+UNMATCHED = "<unmatched>"
+
+REQUESTS = Counter(
+    "mindfulminutes_http_requests_total",
+    "Requests by URL name, method and status",
+    ["view", "method", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "mindfulminutes_http_request_duration_seconds",
+    "Request latency by URL name and method",
+    ["view", "method"],
+)
+REQUEST_QUERIES = Histogram(
+    "mindfulminutes_http_request_queries",
+    "Database queries per request by URL name",
+    ["view"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500),
+)
+CACHE_LOOKUPS = Counter(
+    "mindfulminutes_cache_lookups_total",
+    "Cache lookups by cache and result, hit or miss",
+    ["cache", "result"],
+)
+# labelled with the pid of every live worker process in multiprocess mode
+WORKER_START_TIME = Gauge(
+    "mindfulminutes_worker_start_time_seconds",
+    "Start time of the worker process",
+    multiprocess_mode="liveall",
+)
+
+
+def get_registry():
+    """
+    Return the registry of the metrics to expose
+
+    With PROMETHEUS_MULTIPROC_DIR set every worker process writes its
+    metrics to files in that directory and the metrics of all workers
+    are read from there, whichever worker serves the scrape
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def record_cache_lookup(cache, hit):
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class MetricsMiddleware:
+    """
+    Middleware counting the requests with their latency and number of
+    queries by URL name
+
+    The queries are counted with the timings of the request, shared with
+    ServerTimingMiddleware when the request is sampled by it
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        WORKER_START_TIME.set_to_current_time()
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        timings = request_timings.get()
+        if timings is not None:
+            queries = timings.queries
+            response = self.get_response(request)
+        else:
+            timings = RequestTimings()
+            queries = 0
+            token = request_timings.set(timings)
+            try:
+                with track_queries():
+                    response = self.get_response(request)
+            finally:
+                request_timings.reset(token)
+
+        duration = time.perf_counter() - start
+        match = request.resolver_match
+        view = match.view_name if match else UNMATCHED
+        REQUESTS.labels(view, request.method, response.status_code).inc()
+        REQUEST_DURATION.labels(view, request.method).observe(duration)
+        REQUEST_QUERIES.labels(view).observe(timings.queries - queries)
+        return response
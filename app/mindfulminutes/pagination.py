@@ -0,0 +1,114 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque cursor pagination over a (timestamp, id) ordering
+
+    Each page is selected with a range condition on the ordering columns,
+    so fetching a page costs the same wherever it is in the history and no
+    COUNT(*) is needed. The response body stays a plain list, the cursor
+    of the following page is sent in the Link header
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = api_settings.PAGE_SIZE or 100
+    max_page_size = 1000
+    ordering = ("created_on", "id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return the page of the queryset following the requested cursor
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        field, tiebreaker = self.ordering
+
+        queryset = queryset.order_by(field, tiebreaker)
+        position = self.decode_cursor(request)
+        if position is not None:
+            value, pk = position
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": value})
+                | Q(**{field: value, f"{tiebreaker}__gt": pk})
+            )
+
+        # fetch one row more than needed to know if there is a next page
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        """
+        Return the page as a list with a Link header to the next page
+        """
+        headers = {}
+        next_link = self.get_next_link()
+        if next_link is not None:
+            headers["Link"] = f'<{next_link}>; rel="next"'
+        return Response(data, headers=headers)
+
+    def get_page_size(self, request):
+        """
+        Return the page size requested by the client within the limits
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        """
+        Return the URL of the next page or None on the last page
+        """
+        if not self.has_next:
+            return None
+
+        field, tiebreaker = self.ordering
+        last = self.page[-1]
+        cursor = self.encode_cursor(
+            getattr(last, field), getattr(last, tiebreaker)
+        )
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def encode_cursor(self, value, pk):
+        """
+        Encode the position of the last row of a page as an opaque token
+        """
+        position = f"{value.isoformat()}|{pk}"
+        return base64.urlsafe_b64encode(position.encode("ascii")).decode(
+            "ascii"
+        )
+
+    def decode_cursor(self, request):
+        """
+        Decode the requested cursor into a (value, id) position
+        or return None for the first page
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            position = base64.urlsafe_b64decode(encoded.encode("ascii"))
+            value, pk = position.decode("ascii").split("|")
+            return datetime.fromisoformat(value), int(pk)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
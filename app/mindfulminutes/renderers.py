@@ -0,0 +1,74 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _floats_match(data):
+    """
+    Return whether orjson encodes every float of the data like the DRF
+    encoder
+
+    Both write the shortest representation that reads back the same, but
+    floats Python writes with an exponent differ (1e16 against 1e+16) and
+    orjson writes NaN and infinity as null instead of raising
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if value != 0 and not 1e-4 <= abs(value) < 1e16:
+                return False
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return True
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer encoding with orjson when it is installed
+
+    The output is the same as the JSON renderer of DRF: compact, UTF-8
+    and with datetimes in UTC ending in Z. Values orjson does not know,
+    such as Decimal or lazy translations, go through the DRF encoder.
+    Anything orjson cannot encode the same way, such as floats written
+    with an exponent, indented output or other JSON settings are rendered
+    by the DRF renderer
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON, returning a bytestring
+        """
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {})
+            is not None
+            or not _floats_match(data)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_UTC_Z,
+            )
+        except (TypeError, ValueError):
+            # such as integers beyond 64 bits or non-string keys
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # escape U+2028 and U+2029 like the DRF renderer
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
@@ -0,0 +1,189 @@
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+# Aliases of the read replicas of the default database
+REPLICA_DATABASES = getattr(settings, "REPLICA_DATABASES", [])
+
+# Seconds a user reads from the primary after writing, longer than the
+# replicas usually lag behind, so users always see their own writes
+REPLICA_LAG = getattr(settings, "REPLICA_LAG", 5)
+
+# Cache the users who wrote recently are kept in, shared by all processes
+REPLICA_CACHE_ALIAS = getattr(settings, "REPLICA_CACHE_ALIAS", "default")
+
+# Seconds between two health checks of a replica
+REPLICA_CHECK_INTERVAL = getattr(settings, "REPLICA_CHECK_INTERVAL", 30)
+
+# Replicas lagging further behind than this are not read from, only
+# measured on Postgres. At most REPLICA_LAG, a replica further behind
+# could miss the writes of users no longer sent to the primary
+REPLICA_MAX_LAG = getattr(settings, "REPLICA_MAX_LAG", REPLICA_LAG)
+
+# The database the reads of the current request are routed to
+read_database = ContextVar("read_database", default=None)
+
+_health = {}
+_health_lock = threading.Lock()
+
+
+def check_replica_lag():
+    """
+    Refuse a REPLICA_MAX_LAG above REPLICA_LAG
+    """
+    if REPLICA_MAX_LAG > REPLICA_LAG:
+        raise ImproperlyConfigured(
+            f"REPLICA_MAX_LAG ({REPLICA_MAX_LAG}) must not be above "
+            f"REPLICA_LAG ({REPLICA_LAG})"
+        )
+
+
+check_replica_lag()
+
+
+def _recent_write_key(user_id):
+    return f"replicas:wrote:{user_id}"
+
+
+def mark_recent_write(user_id):
+    """
+    Send the reads of a user to the primary for the next REPLICA_LAG
+    seconds
+    """
+    if REPLICA_DATABASES:
+        caches[REPLICA_CACHE_ALIAS].set(
+            _recent_write_key(user_id), 1, REPLICA_LAG
+        )
+
+
+def wrote_recently(user_id):
+    """
+    Return whether a user wrote within the last REPLICA_LAG seconds
+    """
+    cache = caches[REPLICA_CACHE_ALIAS]
+    return cache.get(_recent_write_key(user_id)) is not None
+
+
+def replica_lag(alias):
+    """
+    Return how many seconds a replica lags behind the primary, 0 when
+    it cannot be measured
+    """
+    with connections[alias].cursor() as cursor:
+        if connections[alias].vendor != "postgresql":
+            cursor.execute("SELECT 1")
+            return 0
+        cursor.execute(
+            "SELECT EXTRACT(EPOCH FROM "
+            "now() - pg_last_xact_replay_timestamp())"
+        )
+        lag = cursor.fetchone()[0]
+    return 0 if lag is None else float(lag)
+
+
+def is_healthy(alias):
+    """
+    Return whether a replica answers and is not lagging too far behind,
+    checked at most every REPLICA_CHECK_INTERVAL seconds
+    """
+    now = time.monotonic()
+    with _health_lock:
+        healthy, checked = _health.get(alias, (False, None))
+        if checked is not None and now - checked < REPLICA_CHECK_INTERVAL:
+            return healthy
+        # other threads keep the last result while this one checks
+        _health[alias] = (healthy, now)
+
+    try:
+        healthy = replica_lag(alias) <= REPLICA_MAX_LAG
+    except Exception:
+        healthy = False
+    with _health_lock:
+        _health[alias] = (healthy, now)
+    return healthy
+
+
+def choose_read_database(request):
+    """
+    Return the replica the reads of a request go to or None to read
+    from the primary
+
+    Only safe requests of users who did not write recently are sent to a
+    replica, picked at random among the healthy ones
+    """
+    if not REPLICA_DATABASES or request.method not in SAFE_METHODS:
+        return None
+    if request.user.is_authenticated and wrote_recently(request.user.pk):
+        return None
+    healthy = [alias for alias in REPLICA_DATABASES if is_healthy(alias)]
+    return random.choice(healthy) if healthy else None
+
+
+class ReplicaRouter:
+    """
+    Database router sending the reads of views using ReplicaReadMixin to
+    a read replica, everything else goes to the primary
+    """
+
+    def db_for_read(self, model, **hints):
+        return read_database.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # the replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in REPLICA_DATABASES
+
+
+class ReplicaReadMixin:
+    """
+    Mixin for list views whose reads may be served by a read replica
+
+    The replica is chosen once the user is authenticated and used for
+    every read of the request
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.read_database_token = read_database.set(
+            choose_read_database(request)
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, "read_database_token", None)
+        if token is not None:
+            read_database.reset(token)
+            self.read_database_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Middleware remembering the users who just wrote, so their next
+    reads see their own writes
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        user = getattr(request, "user", None)
+        if (
+            request.method not in SAFE_METHODS
+            and user is not None
+            and user.is_authenticated
+        ):
+            mark_recent_write(user.pk)
+        return response
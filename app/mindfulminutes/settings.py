@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 import dj_database_url
@@ -22,6 +23,20 @@ ALLOWED_HOSTS = [
     "mindfulminutes-2823fda845e7.herokuapp.com",
 ]
 
+# orjson is used for JSON when it is installed, the renderer and parser
+# fall back to the DRF implementation otherwise
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": (
+        "mindfulminutes.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "mindfulminutes.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+}
+
 if not DEBUG:
     SECURE_HSTS_SECONDS = 3600
     SECURE_CONTENT_TYPE_NOSNIFF = True
@@ -35,9 +50,9 @@ if not DEBUG:
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
     SECURE_REFERRER_POLICY = "same-origin"
 
-    REST_FRAMEWORK = {
-        "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",)
-    }
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        "mindfulminutes.renderers.FastJSONRenderer",
+    )
 
 INSTALLED_APPS = [
     "django.contrib.admin",
@@ -60,6 +75,8 @@ INSTALLED_APPS = [
     "gratitude_entries",
     "ideas",
     "improvements",
+    "jobs",
+    "journal",
     "knowledge_entries",
     "notes",
     "targets",
@@ -69,6 +86,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "mindfulminutes.timing.ServerTimingMiddleware",
+    "mindfulminutes.metrics.MetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     # "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -76,6 +95,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "mindfulminutes.replicas.ReplicaStickinessMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -100,17 +120,33 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "mindfulminutes.wsgi.application"
 
+# Postgres connections can be taken from a pool shared by the threads of
+# a process, enabled with DB_POOL=1 or SQL_ENGINE=mindfulminutes.db.pooled
+POOLED_ENGINE = "mindfulminutes.db.pooled"
+DATABASE_POOL = {
+    "MIN_SIZE": int(os.environ.get("DB_POOL_MIN_SIZE", 0)),
+    "MAX_SIZE": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+    "TIMEOUT": float(os.environ.get("DB_POOL_TIMEOUT", 30)),
+    "MAX_IDLE": float(os.environ.get("DB_POOL_MAX_IDLE", 600)),
+    "CHECK_INTERVAL": float(os.environ.get("DB_POOL_CHECK_INTERVAL", 30)),
+}
+
 if not DEBUG:
     DATABASE_URL = os.environ.get("DATABASE_URL")
+    DB_POOL = os.environ.get("DB_POOL") == "1"
 
     if DATABASE_URL is not None:
         DATABASES = {
             "default": dj_database_url.config(
                 default=DATABASE_URL,
-                conn_max_age=600,
-                conn_health_checks=True,
+                # the pool keeps the connections and checks them itself
+                conn_max_age=0 if DB_POOL else 600,
+                conn_health_checks=not DB_POOL,
             ),
         }
+        if DB_POOL:
+            DATABASES["default"]["ENGINE"] = POOLED_ENGINE
+            DATABASES["default"]["POOL"] = DATABASE_POOL
 else:
     DATABASES = {
         "default": {
@@ -124,9 +160,102 @@ else:
             "PASSWORD": os.environ.get("SQL_PASSWORD", "password"),
             "HOST": os.environ.get("SQL_HOST", "localhost"),
             "PORT": os.environ.get("SQL_PORT", "5432"),
+            "POOL": DATABASE_POOL,
         }
     }
 
+# Read replicas of the default database, as comma separated database URLs.
+# The entry and user lists read from them unless the user just wrote
+REPLICA_DATABASES = []
+for index, replica_url in enumerate(
+    filter(None, os.environ.get("REPLICA_DATABASE_URLS", "").split(",")), 1
+):
+    alias = f"replica{index}"
+    DATABASES[alias] = dj_database_url.parse(
+        replica_url,
+        conn_max_age=600,
+        conn_health_checks=True,
+        test_options={"MIRROR": "default"},
+    )
+    if DATABASES["default"]["ENGINE"] == POOLED_ENGINE:
+        DATABASES[alias].update(
+            ENGINE=POOLED_ENGINE,
+            POOL=DATABASE_POOL,
+            CONN_MAX_AGE=0,
+            CONN_HEALTH_CHECKS=False,
+        )
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ["mindfulminutes.replicas.ReplicaRouter"]
+
+# Seconds users read from the primary after they wrote, keep it above the
+# usual replication lag. Replicas lagging more than REPLICA_MAX_LAG
+# seconds are not read from, it cannot be above REPLICA_LAG
+REPLICA_LAG = float(os.environ.get("REPLICA_LAG", 5))
+REPLICA_MAX_LAG = float(os.environ.get("REPLICA_MAX_LAG", REPLICA_LAG))
+REPLICA_CHECK_INTERVAL = float(os.environ.get("REPLICA_CHECK_INTERVAL", 30))
+
+# Threads the per-table queries of the combined day, week and month reads
+# are spread over, each thread uses its own database connection
+FANOUT_THREADS = int(os.environ.get("FANOUT_THREADS", 4))
+
+# Fraction of the requests returning their query count and database,
+# serialize and render times in a Server-Timing header, also logged as
+# JSON lines by the mindfulminutes.timing logger with SERVER_TIMING_LOG
+SERVER_TIMING_SAMPLE_RATE = float(
+    os.environ.get("SERVER_TIMING_SAMPLE_RATE", 0)
+)
+SERVER_TIMING_LOG = os.environ.get("SERVER_TIMING_LOG") == "1"
+
+# Bearer token Prometheus scrapes /metrics with, staff users can always
+# read it. Set PROMETHEUS_MULTIPROC_DIR to aggregate the gunicorn workers
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "mindfulminutes.timing": {
+            "handlers": ["console"],
+            "level": "INFO",
+        },
+    },
+}
+
+# Any cache backend works, the entry cache only needs get, set and incr.
+# It has to be shared by all the worker processes, as a write only bumps
+# the generation of the user in the cache it is served by. The default is
+# a file-based cache, shared by the workers of one host, use Redis or
+# Memcached across hosts. The per-process LocMemCache is only the default
+# of the single process development server
+if DEBUG:
+    DEFAULT_CACHE_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+    DEFAULT_CACHE_LOCATION = "mindfulminutes"
+else:
+    DEFAULT_CACHE_BACKEND = (
+        "django.core.cache.backends.filebased.FileBasedCache"
+    )
+    DEFAULT_CACHE_LOCATION = os.path.join(
+        tempfile.gettempdir(), "mindfulminutes-cache"
+    )
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("CACHE_BACKEND") or DEFAULT_CACHE_BACKEND,
+        "LOCATION": os.environ.get("CACHE_LOCATION") or DEFAULT_CACHE_LOCATION,
+        # the local backends cull a third of the keys beyond this
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.environ.get("CACHE_MAX_ENTRIES") or 10000),
+        },
+    }
+}
+
+ENTRY_CACHE_ALIAS = "default"
+ENTRY_CACHE_TIMEOUT = int(os.environ.get("ENTRY_CACHE_TIMEOUT", 60 * 60 * 24))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation"
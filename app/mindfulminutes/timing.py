@@ -0,0 +1,207 @@
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+# Fraction of the requests that are timed, between 0 and 1
+SERVER_TIMING_SAMPLE_RATE = getattr(settings, "SERVER_TIMING_SAMPLE_RATE", 0)
+
+# Whether the timings of a timed request are also logged
+SERVER_TIMING_LOG = getattr(settings, "SERVER_TIMING_LOG", False)
+
+logger = logging.getLogger(__name__)
+
+# The timings of the current request, None when it is not timed
+request_timings = ContextVar("request_timings", default=None)
+
+_noop = nullcontext()
+
+
+class RequestTimings:
+    """
+    Query count, database time and time spent in the phases of a request
+
+    An instance is installed as execute wrapper on the connections used
+    by the request, including those of the fan out threads, so the
+    database time is the sum over all connections. The time of a phase
+    excludes the queries run during it
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.phases = {}
+        self.lock = threading.Lock()
+        # database time and running phases of the current thread
+        self.local = threading.local()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.local.db_time = self.thread_db_time() + duration
+            with self.lock:
+                self.queries += 1
+                self.db_time += duration
+
+    def thread_db_time(self):
+        return getattr(self.local, "db_time", 0.0)
+
+    def start_phase(self, name):
+        """
+        Start timing a phase, return None when the phase is already
+        running in this thread, such as for nested serializers
+        """
+        running = self.local.__dict__.setdefault("running", set())
+        if name in running:
+            return None
+        running.add(name)
+        return (name, time.perf_counter(), self.thread_db_time())
+
+    def stop_phase(self, token):
+        """
+        Add the time since start_phase, less its queries, to the phase
+        """
+        if token is None:
+            return
+        name, start, db_time = token
+        duration = time.perf_counter() - start
+        duration -= self.thread_db_time() - db_time
+        self.local.running.discard(name)
+        with self.lock:
+            self.phases[name] = self.phases.get(name, 0.0) + duration
+
+    def total(self):
+        return time.perf_counter() - self.start
+
+    def header(self, total):
+        """
+        Return the value of the Server-Timing header, in milliseconds
+        """
+        metrics = [
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"'
+        ]
+        metrics += [
+            f"{name};dur={duration * 1000:.1f}"
+            for name, duration in self.phases.items()
+        ]
+        metrics.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def as_dict(self, total):
+        return {
+            "queries": self.queries,
+            "db_ms": round(self.db_time * 1000, 1),
+            **{
+                f"{name}_ms": round(duration * 1000, 1)
+                for name, duration in self.phases.items()
+            },
+            "total_ms": round(total * 1000, 1),
+        }
+
+
+class _Phase:
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.token = self.timings.start_phase(self.name)
+
+    def __exit__(self, *exc_info):
+        self.timings.stop_phase(self.token)
+
+
+def measure(name):
+    """
+    Return a context manager adding the time spent in it to a phase of
+    the current request, doing nothing when the request is not timed
+    """
+    timings = request_timings.get()
+    if timings is None:
+        return _noop
+    return _Phase(timings, name)
+
+
+@contextmanager
+def track_queries():
+    """
+    Count the queries the current thread runs for the timed request
+    """
+    timings = request_timings.get()
+    if timings is None:
+        yield
+        return
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(timings))
+        yield
+
+
+class ServerTimingMiddleware:
+    """
+    Middleware timing a sample of the requests
+
+    The query count, database, serialize and render times of a timed
+    request are returned in the Server-Timing header and logged as one
+    JSON line when SERVER_TIMING_LOG is set. Keep it first, so the total
+    includes the other middleware
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= SERVER_TIMING_SAMPLE_RATE:
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        try:
+            with track_queries():
+                response = self.get_response(request)
+        finally:
+            request_timings.reset(token)
+
+        total = timings.total()
+        response["Server-Timing"] = timings.header(total)
+        if SERVER_TIMING_LOG:
+            self.log(request, response, timings, total)
+        return response
+
+    def process_template_response(self, request, response):
+        """
+        Time the rendering of the response, which happens after the view
+        returned it
+        """
+        timings = request_timings.get()
+        if timings is not None:
+            token = timings.start_phase("render")
+            response.add_post_render_callback(
+                lambda response: timings.stop_phase(token)
+            )
+        return response
+
+    def log(self, request, response, timings, total):
+        match = request.resolver_match
+        logger.info(
+            json.dumps(
+                {
+                    "method": request.method,
+                    # the URL pattern, so requests group by endpoint
+                    "route": match.route if match else request.path,
+                    "view": match.view_name if match else None,
+                    "status": response.status_code,
+                    **timings.as_dict(total),
+                }
+            )
+        )
@@ -21,11 +21,13 @@ from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
 from .views import (
+    DatabasePoolStats,
     account_page,
     design_system,
     evening_page,
     index,
     morning_page,
+    prometheus_metrics,
     search,
 )
 
@@ -47,6 +49,7 @@ urlpatterns = [
     path("", include("gratitude_entries.urls")),
     path("", include("ideas.urls")),
     path("", include("improvements.urls")),
+    path("", include("journal.urls")),
     path("", include("knowledge_entries.urls")),
     path("", include("notes.urls")),
     path("", include("targets.urls")),
@@ -59,6 +62,12 @@ urlpatterns = [
     path("morning/", morning_page, name="morning"),
     path("evening/", evening_page, name="evening"),
     path("design-system", design_system, name="design-systems"),
+    path(
+        "api/health/db-pool/",
+        DatabasePoolStats.as_view(),
+        name="db-pool-stats",
+    ),
+    path("metrics", prometheus_metrics, name="metrics"),
     path(
         "swagger-docs/",
         schema_view.with_ui("swagger", cache_timeout=0),
@@ -0,0 +1,157 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .timing import measure
+
+
+def _date_converter(field):
+    output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+    if output_format is not None and output_format.lower() == ISO_8601:
+        return lambda value: value.isoformat()
+    return field.to_representation
+
+
+def _time_converter(field):
+    output_format = getattr(field, "format", api_settings.TIME_FORMAT)
+    if output_format is not None and output_format.lower() == ISO_8601:
+        return lambda value: value.isoformat()
+    return field.to_representation
+
+
+def _datetime_converter(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() == ISO_8601:
+        return field.to_representation
+
+    field_timezone = getattr(field, "timezone", field.default_timezone())
+    if field_timezone is None:
+        return field.to_representation
+    if output_format == "%Y-%m-%d":
+        # the format of created_on, isoformat is much faster than strftime
+        return (
+            lambda value: value.astimezone(field_timezone).date().isoformat()
+        )
+    return lambda value: value.astimezone(field_timezone).strftime(
+        output_format
+    )
+
+
+# Fields whose representation of a database value is the value itself
+IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+)
+
+CONVERTER_FACTORIES = (
+    (serializers.DateTimeField, _datetime_converter),
+    (serializers.DateField, _date_converter),
+    (serializers.TimeField, _time_converter),
+)
+
+
+def get_converter(field):
+    """
+    Return the function converting a column value to the representation
+    of the serializer field, None when the value is used as it is
+    """
+    if isinstance(field, IDENTITY_FIELDS):
+        return None
+    for field_class, factory in CONVERTER_FACTORIES:
+        if isinstance(field, field_class):
+            return factory(field)
+    return field.to_representation
+
+
+class ValuesSerializer:
+    """
+    Read only serializer building the representation of a model
+    serializer straight from values_list() rows
+
+    The converters of the fields are looked up once, so serializing a row
+    is a single dict comprehension instead of the per-field machinery of
+    ModelSerializer. Serializers with a field that is not read from a
+    plain column, such as nested or method fields, fall back to the
+    model serializer
+    """
+
+    def __init__(self, serializer_class, **fieldset):
+        self.serializer_class = serializer_class
+        self.fieldset = fieldset
+        self.columns = []
+        self.fields = self.compile(serializer_class(**fieldset))
+
+    def compile(self, serializer):
+        """
+        Return the (name, column index, converter) of every readable field
+        or None when a field cannot be read from a column
+        """
+        model = serializer.Meta.model
+        fields = []
+        for field in serializer._readable_fields:
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.many_to_many:
+                return None
+
+            if model_field.is_relation:
+                # only the primary key of a related object is in the row
+                if not isinstance(
+                    field, serializers.PrimaryKeyRelatedField
+                ) or (field.pk_field is not None):
+                    return None
+                converter = None
+            else:
+                converter = get_converter(field)
+
+            fields.append(
+                (field.field_name, self.get_column(model_field), converter)
+            )
+        return fields
+
+    def get_column(self, model_field):
+        """
+        Return the index of the column of a model field in the rows
+        """
+        if model_field.name not in self.columns:
+            self.columns.append(model_field.name)
+        return self.columns.index(model_field.name)
+
+    def get_queryset(self, queryset, *required):
+        """
+        Return the queryset of rows to serialize
+
+        ``required`` names columns the view itself reads, such as the
+        ordering fields of the pagination. The rows are named tuples,
+        so they can be read like model instances
+        """
+        if self.fields is None:
+            return queryset
+
+        for name in required:
+            self.get_column(queryset.model._meta.get_field(name))
+        return queryset.values_list(*self.columns, named=True)
+
+    def to_representation(self, rows):
+        """
+        Return the representation of the rows
+        """
+        if self.fields is None:
+            return self.serializer_class(rows, many=True, **self.fieldset).data
+
+        fields = self.fields
+        with measure("serialize"):
+            return [
+                {
+                    name: row[column]
+                    if converter is None or row[column] is None
+                    else converter(row[column])
+                    for name, column, converter in fields
+                }
+                for row in rows
+            ]
@@ -1,7 +1,18 @@
+import os
+
+from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden
+from django.http import HttpResponse, HttpResponseForbidden
 from django.shortcuts import render
+from django.utils.crypto import constant_time_compare
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .db.pool import get_pool_stats
+from .metrics import get_registry
 
 
 def index(request):
@@ -69,3 +80,38 @@ def design_system(request):
     title = "Design System"
     context = {"title": title}
     return render(request, "design_system.html", context)
+
+
+class DatabasePoolStats(APIView):
+    """
+    Report the usage of the database connection pools
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        """
+        Return the stats of the pools of the process serving the request
+
+        Every worker process has its own pools, so sizing against
+        max_connections means multiplying by the number of processes
+        """
+        return Response({"pid": os.getpid(), "pools": get_pool_stats()})
+
+
+def prometheus_metrics(request):
+    """
+    Render the metrics of all worker processes in the Prometheus format
+    Only visible with the METRICS_TOKEN bearer token or for staff users
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    authorization = request.headers.get("Authorization", "")
+    if (
+        not (token and constant_time_compare(authorization, f"Bearer {token}"))
+        and not request.user.is_staff
+    ):
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
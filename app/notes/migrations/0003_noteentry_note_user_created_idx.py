@@ -0,0 +1,19 @@
+# Generated by Django 4.2.10 on 2026-10-18 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notes", "0002_noteentry_entry_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="noteentry",
+            index=models.Index(
+                fields=["user", "created_on", "id"],
+                name="note_user_created_idx",
+            ),
+        ),
+    ]
@@ -1,12 +1,15 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from mindfulminutes.bulk import BulkCreateListSerializer
+from mindfulminutes.fields import DynamicFieldsMixin
+
 from .models import NoteEntry
 
 User = get_user_model()
 
 
-class NoteEntrySerializer(serializers.ModelSerializer):
+class NoteEntrySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for NoteEntry model to convert it to JSON representation
     """
@@ -22,5 +25,6 @@ class NoteEntrySerializer(serializers.ModelSerializer):
         """
 
         model = NoteEntry
-        exclude = ("updated_on",)
+        exclude = ("updated_on", "entry_date")
         read_only_fields = ("id",)
+        list_serializer_class = BulkCreateListSerializer
@@ -9,11 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import NoteEntry
 from .serializers import NoteEntrySerializer
 
 
-class NoteEntryList(APIView):
+class NoteEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all note entries or create a new note entry
     """
@@ -27,14 +36,34 @@ class NoteEntryList(APIView):
         if request.method == "GET":
             if request.user.slug == slug:
                 note_entries = NoteEntry.objects.filter(user=request.user)
+                serializer = self.get_values_serializer(
+                    NoteEntrySerializer, request
+                )
+                note_entries = serializer.get_queryset(
+                    note_entries, *KeysetPagination.ordering, "updated_on"
+                )
+
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    note_entries, request, view=self
+                )
 
-                serializer = NoteEntrySerializer(note_entries, many=True)
-                return Response(serializer.data)
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
+
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
+                )
 
             raise MethodNotAllowed(request.method)
 
 
-class NoteEntryListCreate(APIView):
+class NoteEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create note entries for a specific date
     """
@@ -57,12 +86,25 @@ class NoteEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 note_entries = NoteEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
+                )
+                serializer = self.get_values_serializer(
+                    NoteEntrySerializer, request
                 )
+                note_entries = serializer.get_queryset(note_entries)
 
-                serializer = NoteEntrySerializer(note_entries, many=True)
-                return Response(serializer.data)
+                not_modified = self.check_not_modified(request, note_entries)
+                if not_modified is not None:
+                    return not_modified
+
+                return self.cache_response(
+                    Response(serializer.to_representation(note_entries))
+                )
 
         raise MethodNotAllowed(request.method)
 
@@ -93,6 +135,9 @@ class NoteEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(request, NoteEntrySerializer)
+
                 serializer = NoteEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -106,20 +151,22 @@ class NoteEntryListCreate(APIView):
         raise MethodNotAllowed(request.method)
 
 
-class NoteEntryDetail(APIView):
+class NoteEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete a note entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get a note entry object from the database
-        or raise a 404 error
+        Helper method to get a note entry object of the user for the date
+        from the database or raise a 404 error
         """
         try:
-            return NoteEntry.objects.get(pk=pk)
+            return NoteEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except NoteEntry.DoesNotExist:
             raise Http404
 
@@ -171,9 +218,16 @@ class NoteEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    note_entry = self.get_object(pk)
+                    note_entry = self.get_object(
+                        pk, request.user, date_request
+                    )
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -183,8 +237,14 @@ class NoteEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = NoteEntrySerializer(note_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(request, note_entry)
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = NoteEntrySerializer(
+                        note_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = NoteEntrySerializer(
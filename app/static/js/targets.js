@@ -52,6 +52,16 @@ const updateTarget = async (data) => {
   deactivateLoader('Day target entry', 'update');
 };
 
+const updateTargets = async (changes) => {
+  activateLoader('update');
+  const formData = new FormData(targetsForm);
+  const currentDate = getCurrentDate();
+  
+  const api = createUrl(`/api/users/${ formData.get('user') }/target/${ currentDate }/`);
+  await postData(api, changes, formData.get('csrfmiddlewaretoken'), 'PATCH');
+  deactivateLoader('Day target entry', 'update');
+};
+
 const createDataObject = (data) => {
   let dataObj = {};
   for (let [ key, value ] of data.entries()) {
@@ -153,7 +163,7 @@ const toggleTargetCompleted = (e) => {
   
   item.dataset.completed === 'true' ? item.dataset.completed = 'false' : item.dataset.completed = 'true';
   
-  updateTarget(item)
+  updateTargets([ { id: Number(item.dataset.id), completed: item.dataset.completed === 'true' } ])
     .then(() => {
       if (target.dataset.btn === 'done') {
         target.dataset.btn = 'refresh';
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.10 on 2026-10-18 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("targets", "0003_targetentry_entry_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="targetentry",
+            index=models.Index(
+                fields=["user", "created_on", "id"],
+                name="target_user_created_idx",
+            ),
+        ),
+    ]
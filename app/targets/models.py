@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -18,6 +19,7 @@ class TargetEntry(models.Model):
     completed = models.BooleanField(_("Completed"), default=False)
     created_on = models.DateTimeField(auto_now_add=True)
     updated_on = models.DateTimeField(auto_now=True)
+    entry_date = models.DateField(_("Entry Date"), editable=False)
 
     # @property decorator transforms the method into a getter method
     # for a specific property
@@ -36,6 +38,23 @@ class TargetEntry(models.Model):
 
         verbose_name_plural = "Target Entries"
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["user", "entry_date"], name="target_user_date_idx"
+            ),
+            models.Index(
+                fields=["user", "created_on", "id"],
+                name="target_user_created_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Populate entry_date with the local date the entry is created on
+        """
+        if self.entry_date is None:
+            self.entry_date = timezone.localdate()
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.title
@@ -1,12 +1,15 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from mindfulminutes.bulk import BulkCreateListSerializer
+from mindfulminutes.fields import DynamicFieldsMixin
+
 from .models import TargetEntry
 
 User = get_user_model()
 
 
-class TargetEntrySerializer(serializers.ModelSerializer):
+class TargetEntrySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for TargetEntry model to convert it to JSON representation
     """
@@ -22,5 +25,16 @@ class TargetEntrySerializer(serializers.ModelSerializer):
         """
 
         model = TargetEntry
-        exclude = ("updated_on",)
+        exclude = ("updated_on", "entry_date")
         read_only_fields = ("id",)
+        list_serializer_class = BulkCreateListSerializer
+
+
+class TargetEntryBatchUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for the changes of one target entry in a batch update
+    """
+
+    id = serializers.IntegerField()
+    order = serializers.IntegerField(required=False)
+    completed = serializers.BooleanField(required=False)
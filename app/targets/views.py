@@ -1,6 +1,7 @@
 from datetime import date
 
 from django.http import Http404
+from django.utils import timezone
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -9,11 +10,23 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin, invalidate_user_entries
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import TargetEntry
-from .serializers import TargetEntrySerializer
+from .serializers import (
+    TargetEntryBatchUpdateSerializer,
+    TargetEntrySerializer,
+)
 
 
-class TargetEntryList(APIView):
+class TargetEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all target entries or create a new target entry
     """
@@ -27,14 +40,34 @@ class TargetEntryList(APIView):
         if request.method == "GET":
             if request.user.slug == slug:
                 target_entries = TargetEntry.objects.filter(user=request.user)
+                serializer = self.get_values_serializer(
+                    TargetEntrySerializer, request
+                )
+                target_entries = serializer.get_queryset(
+                    target_entries, *KeysetPagination.ordering, "updated_on"
+                )
+
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    target_entries, request, view=self
+                )
+
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
 
-                serializer = TargetEntrySerializer(target_entries, many=True)
-                return Response(serializer.data)
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
+                )
 
             raise MethodNotAllowed(request.method)
 
 
-class TargetEntryListCreate(APIView):
+class TargetEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create target entries for a specific date
     """
@@ -57,12 +90,25 @@ class TargetEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 target_entries = TargetEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
                 )
+                serializer = self.get_values_serializer(
+                    TargetEntrySerializer, request
+                )
+                target_entries = serializer.get_queryset(target_entries)
+
+                not_modified = self.check_not_modified(request, target_entries)
+                if not_modified is not None:
+                    return not_modified
 
-                serializer = TargetEntrySerializer(target_entries, many=True)
-                return Response(serializer.data)
+                return self.cache_response(
+                    Response(serializer.to_representation(target_entries))
+                )
 
         raise MethodNotAllowed(request.method)
 
@@ -93,6 +139,9 @@ class TargetEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(request, TargetEntrySerializer)
+
                 serializer = TargetEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -105,21 +154,91 @@ class TargetEntryListCreate(APIView):
 
         raise MethodNotAllowed(request.method)
 
+    @swagger_auto_schema(
+        request_body=openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "order": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "completed": openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                },
+            ),
+        )
+    )
+    def patch(self, request, slug, date_request=None):
+        """
+        Update the order and completion of several target entries at once
+        """
+        if request.user.slug == slug:
+            current_date = date.today().strftime("%Y-%m-%d")
+            if date_request != current_date:
+                return Response(
+                    {
+                        "error": "You are not allowed to change targets "
+                        "for past or future dates."
+                    },
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+            serializer = TargetEntryBatchUpdateSerializer(
+                data=request.data, many=True
+            )
+            if not serializer.is_valid():
+                return Response(
+                    serializer.errors, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            changes = {
+                item.pop("id"): item for item in serializer.validated_data
+            }
+            target_entries = list(
+                TargetEntry.objects.filter(
+                    user=request.user, entry_date=date_request, pk__in=changes
+                )
+            )
+            missing_ids = set(changes) - {entry.pk for entry in target_entries}
+            if missing_ids:
+                return Response(
+                    {"error": f"Invalid target IDs: {sorted(missing_ids)}"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            # bulk_update skips auto_now, so updated_on is set here
+            updated_on = timezone.now()
+            fields = {"updated_on"}
+            for target_entry in target_entries:
+                for field, value in changes[target_entry.pk].items():
+                    setattr(target_entry, field, value)
+                    fields.add(field)
+                target_entry.updated_on = updated_on
+            TargetEntry.objects.bulk_update(target_entries, sorted(fields))
+            invalidate_user_entries(request.user.pk)
+
+            target_entries.sort(key=lambda entry: entry.order)
+            serializer = TargetEntrySerializer(target_entries, many=True)
+            return Response(serializer.data)
+
+        raise MethodNotAllowed(request.method)
+
 
-class TargetEntryDetail(APIView):
+class TargetEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete a target entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get a target entry object from the database
-        or raise a 404 error
+        Helper method to get a target entry object of the user for the date
+        from the database or raise a 404 error
         """
         try:
-            return TargetEntry.objects.get(pk=pk)
+            return TargetEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except TargetEntry.DoesNotExist:
             raise Http404
 
@@ -177,9 +296,16 @@ class TargetEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    target_entry = self.get_object(pk)
+                    target_entry = self.get_object(
+                        pk, request.user, date_request
+                    )
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -189,8 +315,16 @@ class TargetEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = TargetEntrySerializer(target_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(
+                        request, target_entry
+                    )
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = TargetEntrySerializer(
+                        target_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = TargetEntrySerializer(
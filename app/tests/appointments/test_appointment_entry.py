@@ -3,6 +3,7 @@ from datetime import date, time
 import pytest
 from django.core.exceptions import ValidationError
 from faker import Faker
+from freezegun import freeze_time
 
 from appointments.models import AppointmentEntry
 
@@ -61,3 +62,26 @@ def test_create_appointment_entry_from_until(custom_user):
             time_until=time(9, 0),
         )
         appointment_entry.clean()
+
+
+@pytest.mark.django_db
+def test_appointment_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a appointment entry model
+    WHEN creating a appointment entry shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        appointment_entry = AppointmentEntry.objects.create(
+            user=custom_user,
+            title="Dentist",
+            date="2023-07-02",
+            time_from=time(10, 0),
+            time_until=time(11, 0),
+        )
+
+    appointment_entry.refresh_from_db()
+    assert appointment_entry.entry_date == date(2023, 7, 2)
+    assert AppointmentEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
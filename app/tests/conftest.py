@@ -1,5 +1,6 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from faker import Faker
 from rest_framework.test import APIClient
 
@@ -18,6 +19,16 @@ User = get_user_model()
 fake = Faker()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Fixture to start every test with an empty cache
+    """
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def authenticated_user():
     """
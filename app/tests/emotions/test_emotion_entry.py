@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from freezegun import freeze_time
 
 from emotions.models import EmotionEntry
 
@@ -22,3 +25,23 @@ def test_create_emotion_entry(custom_user):
         isinstance(emotion_entries[0].emotion, str)
         and emotion_entries[0].emotion is not None
     )
+
+
+@pytest.mark.django_db
+def test_emotion_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a emotion entry model
+    WHEN creating a emotion entry shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        emotion_entry = EmotionEntry.objects.create(
+            user=custom_user,
+            emotion="good",
+        )
+
+    emotion_entry.refresh_from_db()
+    assert emotion_entry.entry_date == date(2023, 7, 2)
+    assert EmotionEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
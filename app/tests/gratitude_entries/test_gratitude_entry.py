@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from freezegun import freeze_time
 
 from gratitude_entries.models import GratitudeEntry
 
@@ -22,3 +25,23 @@ def test_create_knowledge_entry(custom_user):
         isinstance(gratitude_entries[0].content, str)
         and gratitude_entries[0].content is not None
     )
+
+
+@pytest.mark.django_db
+def test_gratitude_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a gratitude entry model
+    WHEN creating a gratitude entry shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        gratitude_entry = GratitudeEntry.objects.create(
+            user=custom_user,
+            content="A quiet morning walk",
+        )
+
+    gratitude_entry.refresh_from_db()
+    assert gratitude_entry.entry_date == date(2023, 7, 2)
+    assert GratitudeEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from freezegun import freeze_time
 
 from ideas.models import IdeasEntry
 
@@ -22,3 +25,23 @@ def test_create_ideas_entry(custom_user):
         isinstance(ideas_entries[0].content, str)
         and ideas_entries[0].content is not None
     )
+
+
+@pytest.mark.django_db
+def test_ideas_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a ideas entry model
+    WHEN creating a ideas entry shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        ideas_entry = IdeasEntry.objects.create(
+            user=custom_user,
+            content="Build a bird feeder",
+        )
+
+    ideas_entry.refresh_from_db()
+    assert ideas_entry.entry_date == date(2023, 7, 2)
+    assert IdeasEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
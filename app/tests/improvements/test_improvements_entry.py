@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from freezegun import freeze_time
 
 from improvements.models import ImprovementEntry
 
@@ -22,3 +25,23 @@ def test_create_improvement_entry(custom_user):
         isinstance(improvement_entries[0].content, str)
         and improvement_entries[0].content is not None
     )
+
+
+@pytest.mark.django_db
+def test_improvement_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a improvement entry model
+    WHEN creating a improvement entry shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        improvement_entry = ImprovementEntry.objects.create(
+            user=custom_user,
+            content="Go to bed earlier",
+        )
+
+    improvement_entry.refresh_from_db()
+    assert improvement_entry.entry_date == date(2023, 7, 2)
+    assert ImprovementEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
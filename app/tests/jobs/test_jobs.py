@@ -0,0 +1,304 @@
+import time
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import OperationalError
+from django.db.models import F
+from django.utils import timezone
+from freezegun import freeze_time
+
+from jobs import worker
+from jobs.models import Job
+from jobs.registry import schedule_periodic_tasks, task
+from jobs.worker import claim_job, get_next_run, requeue_stale_jobs
+from users.deletion import schedule_account_deletion
+from users.models import AccountDeletion
+
+calls = []
+
+
+@task(name="tests.record")
+def record(value):
+    calls.append(value)
+
+
+@task(name="tests.fail", max_attempts=2)
+def fail():
+    raise RuntimeError("Printer on fire")
+
+
+@task(name="tests.tick", every=timedelta(hours=1))
+def tick():
+    calls.append("tick")
+
+
+@task(name="tests.slow")
+def slow():
+    time.sleep(0.3)
+
+
+def run_workers():
+    call_command("run_workers", "--burst", stdout=StringIO())
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+@pytest.mark.django_db
+def test_run_queued_job():
+    """
+    GIVEN a Django application
+    WHEN a job is queued and the workers run
+    THEN the task runs with the job arguments and the job is done
+    """
+    job = record.enqueue(value="Set up printer.")
+
+    run_workers()
+
+    job.refresh_from_db()
+    assert calls.count("Set up printer.") == 1
+    assert job.status == Job.DONE
+    assert job.attempts == 1
+    assert job.finished_on is not None
+
+
+@pytest.mark.django_db
+def test_claim_job_order():
+    """
+    GIVEN a Django application
+    WHEN a worker claims a job
+    THEN the oldest due job is locked for the worker and jobs that
+    are not due or claimed already are skipped
+    """
+    now = timezone.now()
+    record.enqueue(run_at=now + timedelta(minutes=5), value="later")
+    second = record.enqueue(run_at=now - timedelta(minutes=1), value="2")
+    first = record.enqueue(run_at=now - timedelta(minutes=2), value="1")
+
+    assert claim_job("worker-1") == first
+    job = claim_job("worker-2")
+
+    assert job == second
+    assert job.status == Job.RUNNING
+    assert job.locked_by == "worker-2"
+    assert job.attempts == 1
+    assert claim_job("worker-3") is None
+
+
+@pytest.mark.django_db
+def test_failed_job_retried_with_backoff():
+    """
+    GIVEN a Django application
+    WHEN a job fails
+    THEN it is queued again after a backoff until it used all of its
+    attempts and then marked failed
+    """
+    with freeze_time("2023-07-06 12:00:00"):
+        job = fail.enqueue()
+        run_workers()
+
+    job.refresh_from_db()
+    assert job.status == Job.QUEUED
+    assert job.attempts == 1
+    assert job.run_at == job.created_on + timedelta(seconds=10)
+    assert "Printer on fire" in job.last_error
+
+    with freeze_time("2023-07-06 12:00:10"):
+        run_workers()
+
+    job.refresh_from_db()
+    assert job.status == Job.FAILED
+    assert job.attempts == 2
+    assert job.finished_on is not None
+
+
+@pytest.mark.django_db
+def test_periodic_job():
+    """
+    GIVEN a Django application
+    WHEN a periodic task runs
+    THEN a single run is pending at a time and the next run is queued
+    once a run is done
+    """
+    with freeze_time("2023-07-06 12:00:00"):
+        schedule_periodic_tasks()
+        schedule_periodic_tasks()
+
+        assert Job.objects.filter(name="tests.tick").count() == 1
+
+        run_workers()
+
+    assert calls == ["tick"]
+    jobs = Job.objects.filter(name="tests.tick").order_by("run_at")
+
+    assert [job.status for job in jobs] == [Job.DONE, Job.QUEUED]
+    assert jobs[1].run_at - jobs[0].run_at == timedelta(hours=1)
+
+
+@pytest.mark.django_db
+def test_get_next_run_skips_missed_runs():
+    """
+    GIVEN a Django application
+    WHEN a periodic job ran long after it was due
+    THEN its next run is the first one still ahead
+    """
+    job = Job(run_at=timezone.now() - timedelta(hours=5, minutes=30))
+
+    next_run = get_next_run(job, timedelta(hours=1))
+
+    assert timedelta(0) < next_run - timezone.now() <= timedelta(hours=1)
+
+
+@pytest.mark.django_db
+def test_requeue_stale_jobs():
+    """
+    GIVEN a Django application
+    WHEN the workers start with jobs left running by a dead worker
+    THEN the jobs are queued again or failed once out of attempts
+    """
+    locked_at = timezone.now() - timedelta(days=1)
+    stale = Job.objects.create(
+        name="tests.record",
+        status=Job.RUNNING,
+        locked_at=locked_at,
+        attempts=1,
+        max_attempts=3,
+    )
+    exhausted = Job.objects.create(
+        name="tests.record",
+        status=Job.RUNNING,
+        locked_at=locked_at,
+        attempts=3,
+        max_attempts=3,
+    )
+    running = Job.objects.create(
+        name="tests.record",
+        status=Job.RUNNING,
+        locked_at=timezone.now(),
+    )
+
+    assert requeue_stale_jobs() == 1
+
+    stale.refresh_from_db()
+    exhausted.refresh_from_db()
+    running.refresh_from_db()
+    assert stale.status == Job.QUEUED
+    assert exhausted.status == Job.FAILED
+    assert running.status == Job.RUNNING
+
+
+@pytest.mark.django_db
+def test_timed_out_periodic_job_scheduled_again():
+    """
+    GIVEN a Django application
+    WHEN a periodic job times out on its last attempt
+    THEN it is failed and its next run is queued
+    """
+    with freeze_time("2023-07-06 12:00:00"):
+        schedule_periodic_tasks()
+        Job.objects.filter(name="tests.tick").update(
+            status=Job.RUNNING,
+            locked_at=timezone.now() - timedelta(days=1),
+            attempts=F("max_attempts"),
+        )
+
+        requeue_stale_jobs()
+
+    jobs = Job.objects.filter(name="tests.tick").order_by("run_at")
+    assert [job.status for job in jobs] == [Job.FAILED, Job.QUEUED]
+    assert jobs[0].last_error == "The job timed out."
+    assert jobs[1].run_at - jobs[0].run_at == timedelta(hours=1)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_running_job_kept_locked(monkeypatch):
+    """
+    GIVEN a running worker
+    WHEN a job runs for longer than the lock refresh interval
+    THEN its lock is refreshed while it runs, so it is not taken for
+    the job of a worker that died
+    """
+    monkeypatch.setattr(worker, "JOB_HEARTBEAT_INTERVAL", 0.05)
+    job = slow.enqueue()
+    job = claim_job("worker")
+    claimed_at = job.locked_at
+
+    worker.run_job(job)
+
+    job.refresh_from_db()
+    assert job.status == Job.DONE
+    assert job.locked_at > claimed_at
+
+
+@pytest.mark.django_db
+def test_worker_requeues_stale_jobs_periodically(monkeypatch):
+    """
+    GIVEN a running worker
+    WHEN a job is left running by a worker that died
+    THEN the worker queues it again without being restarted and runs it
+    """
+    monkeypatch.setattr(worker, "JOB_REQUEUE_INTERVAL", 0)
+    stale = record.enqueue(value="Set up printer.")
+    Job.objects.filter(pk=stale.pk).update(
+        status=Job.RUNNING,
+        locked_at=timezone.now() - timedelta(days=1),
+        attempts=1,
+    )
+
+    run_workers()
+
+    stale.refresh_from_db()
+    assert stale.status == Job.DONE
+    assert calls.count("Set up printer.") == 1
+
+
+@pytest.mark.django_db
+def test_worker_survives_database_errors(monkeypatch):
+    """
+    GIVEN a running worker
+    WHEN the database connection is lost while claiming a job
+    THEN the worker backs off and runs the job once the database is back
+    """
+    job = record.enqueue(value="Set up printer.")
+    failures = [OperationalError("server closed the connection")]
+    delays = []
+
+    def flaky_claim_job(worker_id):
+        if failures:
+            raise failures.pop()
+        return claim_job(worker_id)
+
+    monkeypatch.setattr(worker, "claim_job", flaky_claim_job)
+    monkeypatch.setattr(
+        worker, "get_error_delay", lambda errors: delays.append(errors) or 0
+    )
+
+    run_workers()
+
+    job.refresh_from_db()
+    assert job.status == Job.DONE
+    assert delays == [1]
+
+
+@pytest.mark.django_db
+def test_account_deletion_job(custom_user):
+    """
+    GIVEN a Django application
+    WHEN the deletion of an account is requested
+    THEN a job is queued and the workers purge the account
+    """
+    deletion = schedule_account_deletion(custom_user)
+
+    job = Job.objects.get(name="users.tasks.purge_deleted_account")
+
+    assert job.kwargs == {"deletion_id": deletion.pk}
+
+    run_workers()
+
+    deletion.refresh_from_db()
+    assert deletion.user is None
+    assert AccountDeletion.objects.get().finished_on is not None
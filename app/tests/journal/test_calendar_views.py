@@ -0,0 +1,97 @@
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from journal.entries import ENTRY_TYPES
+
+NOTES = 1 << list(ENTRY_TYPES).index("notes")
+WINS = 1 << list(ENTRY_TYPES).index("wins")
+
+
+@pytest.mark.django_db
+def test_get_calendar_month(
+    authenticated_user,
+    add_note_entry,
+    add_win_entry,
+    django_assert_num_queries,
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests the calendar of a month
+    THEN every day of the month has a bitmask of its entry types
+    computed with one query per entry type
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-06-01 12:00:00"):
+        add_note_entry(content="Set up printer.", user=user)
+        add_note_entry(content="Order book.", user=user)
+        add_win_entry(title="Finished the report", user=user)
+    with freeze_time("2023-06-30 12:00:00"):
+        add_win_entry(title="Ran 5 km", user=user)
+    with freeze_time("2023-07-01 12:00:00"):
+        add_note_entry(content="Call the bank.", user=user)
+
+    url = reverse("calendar-month", args=[user.slug, "2023-06"])
+
+    with django_assert_num_queries(len(ENTRY_TYPES)):
+        res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.data["month"] == "2023-06"
+    assert res.data["types"] == list(ENTRY_TYPES)
+    assert len(res.data["days"]) == 30
+    assert res.data["days"][0] == NOTES | WINS
+    assert res.data["days"][29] == WINS
+    assert sum(res.data["days"][1:29]) == 0
+    assert "immutable" in res["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_get_calendar_month_cached(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN the user adds an entry after requesting the current month
+    THEN the calendar of the month includes the new entry
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        url = reverse("calendar-month", args=[user.slug, "2023-07"])
+        assert client.get(url).data["days"][5] == 0
+
+        add_note_entry(content="Order book.", user=user)
+
+        assert client.get(url).data["days"][5] == NOTES
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("month", ["2023-13", "2023-W27", "2023-07-01"])
+def test_get_calendar_month_invalid_month(authenticated_user, month):
+    """
+    GIVEN a Django application
+    WHEN the user requests the calendar of an invalid month
+    THEN a bad request response is returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("calendar-month", args=[user.slug, month])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_get_calendar_month_other_user(authenticated_user, custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests the calendar of another user
+    THEN the request is forbidden
+    """
+    client, user = authenticated_user
+
+    url = reverse("calendar-month", args=[custom_user.slug, "2023-06"])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,148 @@
+from datetime import date, time
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from journal.entries import ENTRY_TYPES
+
+
+@pytest.mark.django_db
+def test_get_day_entries(
+    authenticated_user,
+    add_appointment_entry,
+    add_target_entry,
+    add_note_entry,
+    add_win_entry,
+    add_emotion_entry,
+    django_assert_num_queries,
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests all entries for a date
+    THEN every entry type is returned in one response
+    with one query per entry type when the day is not sealed
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        add_appointment_entry(
+            title="Dentist",
+            date="2023-07-06",
+            time_from=time(10, 0),
+            time_until=time(11, 0),
+            user=user,
+        )
+        add_target_entry(title="2 minute cold shower", order=1, user=user)
+        add_target_entry(title="Read 10 pages", order=2, user=user)
+        add_note_entry(content="Set up printer.", user=user)
+        add_win_entry(title="Finished the report", user=user)
+        add_emotion_entry(emotion="good", user=user)
+
+    with freeze_time("2023-07-07 12:00:00"):
+        add_note_entry(content="Order book.", user=user)
+
+    url = reverse("day-entry-list", args=[user.slug, "2023-07-06"])
+
+    # one lookup for a sealed snapshot of the past day
+    with django_assert_num_queries(len(ENTRY_TYPES) + 1):
+        res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert set(res.data) == set(ENTRY_TYPES)
+    assert res.data["appointments"][0]["title"] == "Dentist"
+    assert [target["order"] for target in res.data["targets"]] == [1, 2]
+    assert len(res.data["notes"]) == 1
+    assert res.data["notes"][0]["content"] == "Set up printer."
+    assert res.data["notes"][0]["created_on"] == "2023-07-06"
+    assert res.data["wins"][0]["title"] == "Finished the report"
+    assert res.data["emotions"][0]["emotion"] == "good"
+    assert res.data["gratitude"] == []
+
+
+@pytest.mark.django_db
+def test_get_day_entries_other_user(authenticated_user, custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests the day entries of another user
+    THEN the request is forbidden
+    """
+    client, user = authenticated_user
+
+    url = reverse("day-entry-list", args=[custom_user.slug, date.today()])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_get_day_entries_invalid_date(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests day entries with an invalid date
+    THEN a bad request response is returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("day-entry-list", args=[user.slug, "2023-13-01"])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_get_past_day_entries_immutable(
+    authenticated_user,
+    add_note_entry,
+    django_assert_num_queries,
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests the entries of a past date
+    THEN the response is marked immutable and stays cached
+    when entries are added today
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        add_note_entry(content="Set up printer.", user=user)
+
+    url = reverse("day-entry-list", args=[user.slug, "2023-07-06"])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert "immutable" in res["Cache-Control"]
+    assert "private" in res["Cache-Control"]
+
+    add_note_entry(content="Order book.", user=user)
+
+    with django_assert_num_queries(0):
+        res_cached = client.get(url)
+
+    assert res_cached.data == res.data
+    assert "immutable" in res_cached["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_get_current_day_entries_not_immutable(
+    authenticated_user, add_note_entry
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests the entries of the current date
+    THEN the response is not marked immutable and
+    new entries are returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("day-entry-list", args=[user.slug, date.today()])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert "Cache-Control" not in res
+
+    add_note_entry(content="Order book.", user=user)
+    res = client.get(url)
+
+    assert len(res.data["notes"]) == 1
@@ -0,0 +1,105 @@
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from journal.models import DaySnapshot
+
+
+@pytest.mark.django_db
+def test_seal_days(custom_user, add_note_entry, add_win_entry):
+    """
+    GIVEN a Django application
+    WHEN the seal_days command is run
+    THEN every finished day with entries is sealed once
+    and the current day is not
+    """
+    with freeze_time("2023-07-05 12:00:00"):
+        add_note_entry(content="Set up printer.", user=custom_user)
+    with freeze_time("2023-07-06 12:00:00"):
+        add_win_entry(title="Finished the report", user=custom_user)
+    add_note_entry(content="Order book.", user=custom_user)
+
+    call_command("seal_days")
+    call_command("seal_days")
+
+    snapshots = DaySnapshot.objects.filter(user=custom_user)
+    assert [snapshot.day for snapshot in snapshots] == [
+        date(2023, 7, 5),
+        date(2023, 7, 6),
+    ]
+    day = snapshots.get(day=date(2023, 7, 6)).load()
+    assert day["wins"][0]["title"] == "Finished the report"
+    assert day["notes"] == []
+
+
+@pytest.mark.django_db
+def test_get_sealed_day_entries(
+    authenticated_user, add_note_entry, django_assert_num_queries
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests the entries of a sealed day
+    THEN the snapshot is returned with a single query
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        add_note_entry(content="Set up printer.", user=user)
+
+    url = reverse("day-entry-list", args=[user.slug, "2023-07-06"])
+    expected = client.get(url).data
+
+    call_command("seal_days", user=user.slug)
+    cache.clear()
+
+    with django_assert_num_queries(1):
+        res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.data == expected
+
+
+@pytest.mark.django_db
+def test_changed_past_entry_unseals_day(custom_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN an entry of a sealed day is changed
+    THEN the snapshot of the day is removed
+    """
+    with freeze_time("2023-07-06 12:00:00"):
+        note = add_note_entry(content="Set up printer.", user=custom_user)
+
+    call_command("seal_days")
+    assert DaySnapshot.objects.filter(user=custom_user).exists()
+
+    note.content = "Set up the printer."
+    note.save()
+
+    assert not DaySnapshot.objects.filter(user=custom_user).exists()
+
+
+@pytest.mark.django_db
+def test_unsealed_day_is_sealed_again(custom_user, add_note_entry):
+    """
+    GIVEN a Django application with two sealed days
+    WHEN an entry of the older day is changed and seal_days is run again
+    THEN the older day is sealed again with the change
+    """
+    with freeze_time("2023-07-05 12:00:00"):
+        note = add_note_entry(content="Set up printer.", user=custom_user)
+    with freeze_time("2023-07-06 12:00:00"):
+        add_note_entry(content="Order book.", user=custom_user)
+
+    call_command("seal_days")
+    note.content = "Set up the printer."
+    note.save()
+    call_command("seal_days")
+
+    snapshot = DaySnapshot.objects.get(user=custom_user, day=date(2023, 7, 5))
+    assert snapshot.load()["notes"][0]["content"] == "Set up the printer."
+    assert DaySnapshot.objects.filter(user=custom_user).count() == 2
@@ -0,0 +1,171 @@
+import json
+from datetime import date
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from journal.views import EntrySearch
+
+
+@pytest.mark.django_db
+def test_search_entries(
+    authenticated_user,
+    custom_user,
+    add_note_entry,
+    add_ideas_entry,
+    add_win_entry,
+):
+    """
+    GIVEN a Django application
+    WHEN the user searches their entries
+    THEN the matching entries of every type are returned
+    with the matches highlighted
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        note = add_note_entry(content="Set up the printer.", user=user)
+    idea = add_ideas_entry(content="Print the weekly report.", user=user)
+    win = add_win_entry(title="Fixed the printer", user=user)
+    add_note_entry(content="Order book.", user=user)
+    add_note_entry(content="Printer ink for the office.", user=custom_user)
+
+    url = reverse("entry-search", args=[user.slug])
+    res = client.get(url, {"q": "printer"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert {(result["type"], result["id"]) for result in res.data} == {
+        ("notes", note.id),
+        ("wins", win.id),
+    }
+    result = next(result for result in res.data if result["type"] == "notes")
+    assert result["entry_date"] == "2023-07-06"
+    assert result["snippet"] == "Set up the <mark>printer</mark>."
+
+    res = client.get(url, {"q": "print report"})
+    assert [(result["type"], result["id"]) for result in res.data] == [
+        ("ideas", idea.id)
+    ]
+
+
+@pytest.mark.django_db
+def test_search_entries_index_in_sync(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN entries are updated, deleted or created in bulk
+    THEN the search results follow
+    """
+    client, user = authenticated_user
+
+    note = add_note_entry(content="Set up printer.", user=user)
+    url = reverse("entry-search", args=[user.slug])
+
+    note.content = "Set up scanner."
+    note.save()
+    assert client.get(url, {"q": "printer"}).data == []
+    assert len(client.get(url, {"q": "scanner"}).data) == 1
+
+    note.delete()
+    assert client.get(url, {"q": "scanner"}).data == []
+
+    client.post(
+        reverse("note-entry-date-list", args=[user.slug, date.today()]),
+        json.dumps([{"content": "Buy a scanner."}]),
+        content_type="application/json",
+    )
+    assert len(client.get(url, {"q": "scanner"}).data) == 1
+
+
+@pytest.mark.django_db
+def test_search_entries_escaped(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN a matching entry contains HTML
+    THEN the snippet is escaped apart from the highlight
+    """
+    client, user = authenticated_user
+
+    add_note_entry(content="<b>printer</b> & <i>ink</i>", user=user)
+
+    url = reverse("entry-search", args=[user.slug])
+    res = client.get(url, {"q": '"printer*'})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert "<b>" not in res.data[0]["snippet"]
+    assert "<mark>printer</mark>" in res.data[0]["snippet"]
+
+
+@pytest.mark.django_db
+def test_search_entries_paginated(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN the user searches with a page size
+    THEN the results are split into pages linked by the Link header
+    """
+    client, user = authenticated_user
+
+    for num in range(5):
+        add_note_entry(content=f"Printer task {num}.", user=user)
+
+    url = reverse("entry-search", args=[user.slug])
+    res = client.get(url, {"q": "printer", "page_size": 2})
+
+    assert len(res.data) == 2
+    assert "page=2" in res["Link"]
+
+    res = client.get(url, {"q": "printer", "page_size": 2, "page": 3})
+
+    assert len(res.data) == 1
+    assert "Link" not in res
+
+
+@pytest.mark.django_db
+def test_search_entries_page_out_of_range(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests a page whose offset the database cannot hold
+    THEN a bad request response is returned, the last page is empty
+    """
+    client, user = authenticated_user
+
+    url = reverse("entry-search", args=[user.slug])
+    res = client.get(url, {"q": "printer", "page": 10**20})
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    res = client.get(url, {"q": "printer", "page": EntrySearch.max_page})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.data == []
+
+
+@pytest.mark.django_db
+def test_search_entries_without_query(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user searches without a query
+    THEN a bad request response is returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("entry-search", args=[user.slug])
+    res = client.get(url, {"q": " "})
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_search_entries_other_user(authenticated_user, custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user searches the entries of another user
+    THEN the request is forbidden
+    """
+    client, user = authenticated_user
+
+    url = reverse("entry-search", args=[custom_user.slug])
+    res = client.get(url, {"q": "printer"})
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+import zipfile
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+
+def get_content(res):
+    return b"".join(res.streaming_content)
+
+
+@pytest.fixture
+def journal(authenticated_user, add_note_entry, add_target_entry):
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        first_note = add_note_entry(content="Set up printer.", user=user)
+        add_target_entry(title="Read 10 pages", order=1, user=user)
+    with freeze_time("2023-07-07 12:00:00"):
+        second_note = add_note_entry(content="Order book.", user=user)
+
+    return client, user, first_note, second_note
+
+
+@pytest.mark.django_db
+def test_export_jsonl(journal):
+    """
+    GIVEN a Django application
+    WHEN the user exports the journal as JSON lines
+    THEN every entry is streamed as one JSON object per line
+    """
+    client, user, first_note, second_note = journal
+
+    url = reverse("journal-export", args=[user.slug])
+    res = client.get(url, {"format": "jsonl"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res["Content-Type"] == "application/x-ndjson"
+    assert "attachment" in res["Content-Disposition"]
+
+    lines = [json.loads(line) for line in get_content(res).splitlines()]
+
+    assert [(line["type"], line["id"]) for line in lines] == [
+        ("notes", first_note.id),
+        ("notes", second_note.id),
+        ("targets", lines[2]["id"]),
+    ]
+    assert lines[0]["content"] == "Set up printer."
+    assert lines[0]["entry_date"] == "2023-07-06"
+    assert lines[2]["title"] == "Read 10 pages"
+
+
+@pytest.mark.django_db
+def test_export_jsonl_resume(journal):
+    """
+    GIVEN a Django application
+    WHEN the user resumes a JSON lines export after an entry
+    THEN only the entries after it are streamed
+    """
+    client, user, first_note, second_note = journal
+
+    url = reverse("journal-export", args=[user.slug])
+    res = client.get(url, {"type": "notes", "after": first_note.id})
+
+    lines = [json.loads(line) for line in get_content(res).splitlines()]
+
+    assert [line["type"] for line in lines] == ["notes", "targets"]
+    assert lines[0]["id"] == second_note.id
+
+
+@pytest.mark.django_db
+def test_export_csv(journal):
+    """
+    GIVEN a Django application
+    WHEN the user exports the journal as CSV
+    THEN a header and one row per entry are streamed
+    """
+    client, user, first_note, second_note = journal
+
+    url = reverse("journal-export", args=[user.slug])
+    res = client.get(url, {"format": "csv"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res["Content-Type"] == "text/csv"
+
+    rows = list(csv.DictReader(io.StringIO(get_content(res).decode())))
+
+    assert [row["type"] for row in rows] == ["notes", "notes", "targets"]
+    assert rows[1]["content"] == "Order book."
+    assert rows[1]["title"] == ""
+    assert rows[2]["title"] == "Read 10 pages"
+
+
+@pytest.mark.django_db
+def test_export_markdown_zip(journal):
+    """
+    GIVEN a Django application
+    WHEN the user exports the journal as zipped Markdown
+    THEN the archive holds one Markdown file per day
+    """
+    client, user, first_note, second_note = journal
+
+    url = reverse("journal-export", args=[user.slug])
+    res = client.get(url, {"format": "md.zip"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res["Content-Type"] == "application/zip"
+
+    archive = zipfile.ZipFile(io.BytesIO(get_content(res)))
+
+    assert archive.namelist() == ["2023-07-06.md", "2023-07-07.md"]
+
+    first_day = archive.read("2023-07-06.md").decode()
+
+    assert first_day.startswith("# 2023-07-06\n")
+    assert "## Notes\n\n- Set up printer.\n" in first_day
+    assert "## Targets\n\n- [ ] Read 10 pages\n" in first_day
+
+
+@pytest.mark.django_db
+def test_export_markdown_zip_resume(journal):
+    """
+    GIVEN a Django application
+    WHEN the user resumes a zipped Markdown export after a day
+    THEN only the following days are in the archive
+    """
+    client, user, first_note, second_note = journal
+
+    url = reverse("journal-export", args=[user.slug])
+    res = client.get(url, {"format": "md.zip", "after": "2023-07-06"})
+
+    archive = zipfile.ZipFile(io.BytesIO(get_content(res)))
+
+    assert archive.namelist() == ["2023-07-07.md"]
+
+
+@pytest.mark.django_db
+def test_export_other_user(authenticated_user, custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user exports the journal of another user
+    THEN the request is forbidden
+    """
+    client, user = authenticated_user
+
+    url = reverse("journal-export", args=[custom_user.slug])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"format": "xml"},
+        {"type": "unknown"},
+        {"type": "notes", "after": "first"},
+        {"format": "md.zip", "after": "2023-13-01"},
+    ],
+)
+def test_export_invalid_params(authenticated_user, params):
+    """
+    GIVEN a Django application
+    WHEN the user exports the journal with invalid parameters
+    THEN a bad request response is returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("journal-export", args=[user.slug])
+    res = client.get(url, params)
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,264 @@
+import json
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from journal.models import DaySnapshot
+from journal.sealing import seal_day
+from notes.models import NoteEntry
+from targets.models import TargetEntry
+
+
+def jsonl_file(records, name="journal.jsonl"):
+    content = "".join(json.dumps(record) + "\n" for record in records)
+    return SimpleUploadedFile(name, content.encode())
+
+
+@pytest.mark.django_db
+@freeze_time("2023-07-07 12:00:00")
+def test_import_jsonl(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user uploads a JSON lines file of entries
+    THEN the entries are created on their days
+    """
+    client, user = authenticated_user
+
+    upload = jsonl_file(
+        [
+            {
+                "type": "notes",
+                "content": "Set up printer.",
+                "entry_date": "2023-07-06",
+            },
+            {"type": "targets", "title": "Read 10 pages", "order": 1},
+        ]
+    )
+    url = reverse("journal-import", args=[user.slug])
+    res = client.post(url, {"file": upload})
+
+    assert res.status_code == status.HTTP_201_CREATED
+    assert res.data == {"created": 2, "failed": 0, "errors": []}
+
+    note = NoteEntry.objects.get(user=user)
+
+    assert note.content == "Set up printer."
+    assert str(note.entry_date) == "2023-07-06"
+    assert str(TargetEntry.objects.get(user=user).entry_date) == "2023-07-07"
+
+
+@pytest.mark.django_db
+def test_import_keeps_history_order(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application with a note entry of the current day
+    WHEN the user imports a note entry of a past day
+    THEN the imported note entry is created on its day and listed before
+    the note entry of the current day
+    """
+    client, user = authenticated_user
+    add_note_entry(content="Order book.", user=user)
+
+    upload = jsonl_file(
+        [
+            {
+                "type": "notes",
+                "content": "Set up printer.",
+                "entry_date": "2020-01-01",
+            }
+        ]
+    )
+    client.post(reverse("journal-import", args=[user.slug]), {"file": upload})
+    res = client.get(reverse("note-entry-list", args=[user.slug]))
+
+    assert [note["content"] for note in res.data] == [
+        "Set up printer.",
+        "Order book.",
+    ]
+    assert res.data[0]["created_on"] == "2020-01-01"
+
+
+@pytest.mark.django_db
+@freeze_time("2023-07-07 12:00:00")
+def test_import_invalid_records(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user uploads a file with invalid records
+    THEN the valid records are created and the others
+    are returned with their line number
+    """
+    client, user = authenticated_user
+
+    content = (
+        '{"type": "notes", "content": "Set up printer."}\n'
+        "not json\n"
+        '{"type": "dreams", "content": "Flying."}\n'
+        '{"type": "notes", "content": "Later.", "entry_date": "2023-07-08"}\n'
+        '{"type": "targets", "order": 1}\n'
+    )
+    upload = SimpleUploadedFile("journal.jsonl", content.encode())
+    url = reverse("journal-import", args=[user.slug])
+    res = client.post(url, {"file": upload})
+
+    assert res.status_code == status.HTTP_207_MULTI_STATUS
+    assert res.data["created"] == 1
+    assert res.data["failed"] == 4
+    assert [error["line"] for error in res.data["errors"]] == [2, 3, 4, 5]
+    assert "title" in res.data["errors"][3]["errors"]
+    assert NoteEntry.objects.filter(user=user).count() == 1
+
+
+@pytest.mark.django_db
+@freeze_time("2023-07-07 12:00:00")
+def test_import_csv(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user uploads a CSV file of entries
+    THEN the entries are created
+    """
+    client, user = authenticated_user
+
+    content = (
+        "type,entry_date,content,title,order,completed\n"
+        "notes,2023-07-06,Set up printer.,,,\n"
+        "targets,,,Read 10 pages,1,True\n"
+    )
+    upload = SimpleUploadedFile("journal.csv", content.encode())
+    url = reverse("journal-import", args=[user.slug])
+    res = client.post(url, {"file": upload})
+
+    assert res.status_code == status.HTTP_201_CREATED
+    assert res.data["created"] == 2
+    assert TargetEntry.objects.get(user=user).completed is True
+
+
+@pytest.mark.django_db
+def test_import_export_round_trip(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN the user imports an export of their journal
+    THEN every entry is created again on its day
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        add_note_entry(content="Set up printer.", user=user)
+
+    res = client.get(reverse("journal-export", args=[user.slug]))
+    upload = SimpleUploadedFile(
+        "journal.jsonl", b"".join(res.streaming_content)
+    )
+    res = client.post(
+        reverse("journal-import", args=[user.slug]), {"file": upload}
+    )
+
+    assert res.status_code == status.HTTP_201_CREATED
+    assert (
+        list(
+            NoteEntry.objects.filter(user=user).values_list(
+                "content", "entry_date"
+            )
+        )
+        == [("Set up printer.", date(2023, 7, 6))] * 2
+    )
+
+
+@pytest.mark.django_db
+def test_import_unseals_past_days(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN entries are imported for a sealed day
+    THEN the snapshot of the day is removed
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        note = add_note_entry(content="Set up printer.", user=user)
+    seal_day(user, note.entry_date)
+
+    upload = jsonl_file(
+        [
+            {
+                "type": "notes",
+                "content": "Order book.",
+                "entry_date": str(note.entry_date),
+            }
+        ]
+    )
+    client.post(reverse("journal-import", args=[user.slug]), {"file": upload})
+
+    assert not DaySnapshot.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_import_other_user(authenticated_user, custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user imports entries for another user
+    THEN the request is forbidden
+    """
+    client, user = authenticated_user
+
+    url = reverse("journal-import", args=[custom_user.slug])
+    res = client.post(url, {"file": jsonl_file([])})
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_import_invalid_format(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user uploads a file of an unknown format
+    THEN a bad request response is returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("journal-import", args=[user.slug])
+    res = client.post(url, {"file": jsonl_file([], name="journal.xml")})
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    res = client.post(url)
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@freeze_time("2023-07-07 12:00:00")
+def test_import_journal_command(custom_user, tmp_path):
+    """
+    GIVEN a Django application
+    WHEN the import_journal command imports a file in batches
+    THEN the valid entries are created, progress is reported
+    and the invalid records are written to the error file
+    """
+    path = tmp_path / "journal.jsonl"
+    path.write_text(
+        '{"type": "notes", "content": "Set up printer."}\n'
+        '{"type": "notes", "content": "Order book."}\n'
+        '{"type": "notes"}\n'
+    )
+    out = StringIO()
+
+    call_command(
+        "import_journal",
+        custom_user.slug,
+        str(path),
+        "--batch-size",
+        "2",
+        stdout=out,
+    )
+
+    assert NoteEntry.objects.filter(user=custom_user).count() == 2
+    assert "Line 2: 2 created, 0 failed" in out.getvalue()
+    assert "Line 3: 2 created, 1 failed" in out.getvalue()
+
+    errors = (tmp_path / "journal.jsonl.errors.jsonl").read_text()
+
+    assert json.loads(errors)["line"] == 3
@@ -0,0 +1,56 @@
+from datetime import date, time
+
+import pytest
+from freezegun import freeze_time
+from rest_framework.renderers import JSONRenderer
+
+from journal.entries import ENTRY_TYPES
+from mindfulminutes.values import ValuesSerializer
+
+ENTRY_DATA = {
+    "appointments": {
+        "title": "Dentist",
+        "date": date(2023, 7, 6),
+        "time_from": time(10, 0),
+        "time_until": time(11, 30, 15),
+    },
+    "emotions": {"emotion": "good"},
+    "gratitude": {"content": "Sunny morning walk."},
+    "ideas": {"content": "Automate the weekly report."},
+    "improvements": {"content": "Go to bed earlier."},
+    "knowledge": {"content": "Django querysets are lazy."},
+    "notes": {"content": "Set up printer."},
+    "targets": {"title": "Read 10 pages", "order": 1, "completed": True},
+    "wins": {"title": "Finished the report"},
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("entry_type", ENTRY_TYPES)
+@pytest.mark.parametrize(
+    "fieldset",
+    [{}, {"fields": ["id", "created_on"]}, {"exclude": ["user"]}],
+)
+def test_values_serializer_matches_model_serializer(
+    custom_user, entry_type, fieldset
+):
+    """
+    GIVEN a Django application
+    WHEN entries are serialized from values rows
+    THEN the output is identical to the model serializer output
+    """
+    model, serializer_class = ENTRY_TYPES[entry_type]
+    # late evening entries fall on the next day in local time
+    for timestamp in ("2023-07-05 12:00:00", "2023-07-06 23:30:00"):
+        with freeze_time(timestamp):
+            model.objects.create(user=custom_user, **ENTRY_DATA[entry_type])
+
+    entries = model.objects.filter(user=custom_user)
+    expected = serializer_class(entries, many=True, **fieldset).data
+
+    serializer = ValuesSerializer(serializer_class, **fieldset)
+    data = serializer.to_representation(serializer.get_queryset(entries))
+
+    assert data == expected
+    assert JSONRenderer().render(data) == JSONRenderer().render(expected)
+    assert data[1].get("created_on", "2023-07-07") == "2023-07-07"
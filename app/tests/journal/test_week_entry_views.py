@@ -0,0 +1,156 @@
+from datetime import time
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from journal.entries import ENTRY_TYPES
+
+
+@pytest.mark.django_db
+def test_get_week_entries(
+    authenticated_user,
+    add_note_entry,
+    add_win_entry,
+    django_assert_num_queries,
+):
+    """
+    GIVEN a Django application
+    WHEN the user without settings requests the entries of a week
+    THEN the seven days from Monday are returned grouped by day
+    with one query per entry type
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-03 12:00:00"):
+        add_note_entry(content="Set up printer.", user=user)
+    with freeze_time("2023-07-09 12:00:00"):
+        add_win_entry(title="Finished the report", user=user)
+    with freeze_time("2023-07-10 12:00:00"):
+        add_note_entry(content="Order book.", user=user)
+
+    url = reverse("week-entry-list", args=[user.slug, "2023-07-06"])
+
+    # one lookup for the start week day of the user
+    with django_assert_num_queries(len(ENTRY_TYPES) + 1):
+        res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert list(res.data) == [f"2023-07-{day:02}" for day in range(3, 10)]
+    assert all(set(day) == set(ENTRY_TYPES) for day in res.data.values())
+    assert res.data["2023-07-03"]["notes"][0]["content"] == "Set up printer."
+    assert res.data["2023-07-09"]["wins"][0]["title"] == "Finished the report"
+    assert res.data["2023-07-05"]["notes"] == []
+
+
+@pytest.mark.django_db
+def test_get_week_entries_start_week_day(
+    authenticated_user, add_user_settings, add_note_entry
+):
+    """
+    GIVEN a Django application
+    WHEN the user whose week starts on Sunday requests a week
+    THEN the week starts on the Sunday before the date
+    """
+    client, user = authenticated_user
+
+    add_user_settings(
+        start_week_day=7,
+        morning_check_in=time(8, 0),
+        evening_check_in=time(20, 0),
+        user=user,
+    )
+    with freeze_time("2023-07-09 12:00:00"):
+        add_note_entry(content="Order book.", user=user)
+
+    url = reverse("week-entry-list", args=[user.slug, "2023-07-09"])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert list(res.data)[0] == "2023-07-09"
+    assert list(res.data)[-1] == "2023-07-15"
+    assert res.data["2023-07-09"]["notes"][0]["content"] == "Order book."
+
+
+@pytest.mark.django_db
+def test_get_week_entries_settings_changed(
+    authenticated_user, add_user_settings
+):
+    """
+    GIVEN a Django application
+    WHEN the user changes the start week day after requesting a week
+    THEN the week is realigned instead of served from the cache
+    """
+    client, user = authenticated_user
+
+    user_settings = add_user_settings(
+        start_week_day=1,
+        morning_check_in=time(8, 0),
+        evening_check_in=time(20, 0),
+        user=user,
+    )
+
+    url = reverse("week-entry-list", args=[user.slug, "2023-07-06"])
+    assert list(client.get(url).data)[0] == "2023-07-03"
+
+    user_settings.start_week_day = 3
+    user_settings.save()
+
+    assert list(client.get(url).data)[0] == "2023-07-05"
+
+
+@pytest.mark.django_db
+def test_get_week_entries_other_user(authenticated_user, custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests the week entries of another user
+    THEN the request is forbidden
+    """
+    client, user = authenticated_user
+
+    url = reverse("week-entry-list", args=[custom_user.slug, "2023-07-06"])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_get_week_entries_invalid_date(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests week entries with an invalid date
+    THEN a bad request response is returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("week-entry-list", args=[user.slug, "2023-07-32"])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_get_week_entries_out_of_range(authenticated_user, add_user_settings):
+    """
+    GIVEN a Django application
+    WHEN the user requests a week running past the first or last date
+    THEN a bad request response is returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("week-entry-list", args=[user.slug, "9999-12-31"])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    add_user_settings(
+        start_week_day=7,
+        morning_check_in=time(8, 0),
+        evening_check_in=time(20, 0),
+        user=user,
+    )
+    url = reverse("week-entry-list", args=[user.slug, "0001-01-01"])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
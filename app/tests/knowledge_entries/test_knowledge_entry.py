@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from freezegun import freeze_time
 
 from knowledge_entries.models import KnowledgeEntry
 
@@ -26,3 +29,23 @@ def test_create_knowledge_entry(custom_user):
         isinstance(knowledge_entries[0].content, str)
         and knowledge_entries[0].content is not None
     )
+
+
+@pytest.mark.django_db
+def test_knowledge_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a knowledge entry model
+    WHEN creating a knowledge entry shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        knowledge_entry = KnowledgeEntry.objects.create(
+            user=custom_user,
+            content="Honey never spoils",
+        )
+
+    knowledge_entry.refresh_from_db()
+    assert knowledge_entry.entry_date == date(2023, 7, 2)
+    assert KnowledgeEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
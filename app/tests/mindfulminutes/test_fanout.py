@@ -0,0 +1,66 @@
+import threading
+from datetime import date
+
+import pytest
+from freezegun import freeze_time
+
+from journal.entries import ENTRY_TYPES, month_presence, serialize_day
+from mindfulminutes.fanout import fan_out
+
+
+def current_thread_name(item):
+    return item, threading.current_thread().name
+
+
+@pytest.mark.django_db(transaction=True)
+def test_fan_out_runs_on_pool():
+    """
+    GIVEN a Django application
+    WHEN calls are fanned out outside of a transaction
+    THEN they run on the pool threads and the results keep their order
+    """
+    results = fan_out(current_thread_name, range(6))
+
+    assert [item for item, _ in results] == list(range(6))
+    assert all(name.startswith("fanout") for _, name in results)
+
+
+@pytest.mark.django_db
+def test_fan_out_in_transaction():
+    """
+    GIVEN a Django application
+    WHEN calls are fanned out inside a transaction
+    THEN they run in order on the current thread
+    """
+    results = fan_out(current_thread_name, range(3))
+
+    assert results == [
+        (item, threading.current_thread().name) for item in range(3)
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_day_and_month_reads_fanned_out(
+    custom_user, add_note_entry, add_win_entry
+):
+    """
+    GIVEN a Django application
+    WHEN the entries of a day and month are read outside of a transaction
+    THEN the concurrent queries return the same data as serial ones
+    """
+    with freeze_time("2023-07-06 12:00:00"):
+        add_note_entry(content="Set up printer.", user=custom_user)
+        add_win_entry(title="Finished the report", user=custom_user)
+
+    day = serialize_day(custom_user, date(2023, 7, 6))
+
+    assert list(day) == list(ENTRY_TYPES)
+    assert day["notes"][0]["content"] == "Set up printer."
+    assert day["wins"][0]["title"] == "Finished the report"
+    assert day["targets"] == []
+
+    days = month_presence(custom_user, date(2023, 7, 1))
+    bits = list(ENTRY_TYPES)
+
+    assert days[5] == (1 << bits.index("notes")) | (1 << bits.index("wins"))
+    assert days[6] == 0
@@ -0,0 +1,154 @@
+import io
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from appointments.serializers import AppointmentEntrySerializer
+from mindfulminutes import parsers, renderers
+from mindfulminutes.parsers import FastJSONParser
+from mindfulminutes.renderers import FastJSONRenderer
+from users.serializers import CustomUserSerializer
+
+PAYLOADS = [
+    {
+        "date": date(2023, 7, 6),
+        "time": time(10, 0, 5, 120),
+        "utc": datetime(2023, 7, 6, 8, 30, tzinfo=timezone.utc),
+        "local": datetime(
+            2023, 7, 6, 10, 30, tzinfo=ZoneInfo("Europe/Zurich")
+        ),
+        "naive": datetime(2023, 7, 6, 10, 30, 0, 5),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "decimal": Decimal("12.50"),
+        "lazy": _("Title"),
+    },
+    OrderedDict(
+        [("text", 'Café "quoted" \\ line\nsep par \x1f'), ("n", None)]
+    ),
+    [1, -2, 3.5, True, False, [], {}, ""],
+    {"big": 2**70, "keys": {1: "one"}},
+    {"floats": [0.0001, 123456.789, -0.0, 9999999999999998.0]},
+    {"exponent": [1e16, 1e-7, 1e-5, -2.5e22]},
+    [{"nested": ({"ratio": 1e-7},)}],
+    "",
+    [],
+]
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+def test_fast_json_renderer_matches_json_renderer(data):
+    """
+    GIVEN a Django application
+    WHEN data is rendered with the fast JSON renderer
+    THEN the bytes are identical to the DRF JSON renderer
+    """
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+def test_fast_json_renderer_without_orjson(monkeypatch, data):
+    """
+    GIVEN a Django application without orjson installed
+    WHEN data is rendered with the fast JSON renderer
+    THEN the DRF JSON renderer is used
+    """
+    monkeypatch.setattr(renderers, "orjson", None)
+
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf")])
+def test_fast_json_renderer_non_finite_float(value):
+    """
+    GIVEN a Django application
+    WHEN data with a float that is not finite is rendered
+    THEN a ValueError is raised like by the DRF JSON renderer
+    """
+    with pytest.raises(ValueError):
+        JSONRenderer().render({"ratio": value})
+    with pytest.raises(ValueError):
+        FastJSONRenderer().render({"ratio": value})
+
+
+def test_fast_json_renderer_indent():
+    """
+    GIVEN a Django application
+    WHEN indented JSON is requested
+    THEN the output is indented like the DRF JSON renderer
+    """
+    data = {"title": "Dentist", "date": date(2023, 7, 6)}
+    media_type = "application/json; indent=4"
+
+    assert FastJSONRenderer().render(
+        data, media_type
+    ) == JSONRenderer().render(data, media_type)
+
+
+@pytest.mark.django_db
+def test_fast_json_renderer_model_payloads(custom_user, add_appointment_entry):
+    """
+    GIVEN a Django application
+    WHEN serialized appointments and users are rendered
+    THEN the bytes are identical to the DRF JSON renderer
+    """
+    appointment = add_appointment_entry(
+        title="Dentist",
+        date="2023-07-06",
+        time_from=time(10, 0),
+        time_until=time(11, 0),
+        user=custom_user,
+    )
+    appointment.refresh_from_db()
+
+    for data in (
+        AppointmentEntrySerializer(appointment).data,
+        CustomUserSerializer([custom_user], many=True).data,
+        {"unique_identifier": custom_user.unique_identifier},
+    ):
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"title": "Caf\xc3\xa9", "order": 1, "completed": true}',
+        b'[{"content": "Set up printer."}, {"content": null}]',
+        b'{"big": 123456789012345678901234567890, "ratio": 0.1}',
+    ],
+)
+def test_fast_json_parser_matches_json_parser(body):
+    """
+    GIVEN a Django application
+    WHEN a JSON body is parsed with the fast JSON parser
+    THEN the data is identical to the DRF JSON parser
+    """
+    assert FastJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(
+        io.BytesIO(body)
+    )
+
+
+@pytest.mark.parametrize("body", [b'{"title": ', b'{"ratio": NaN}'])
+def test_fast_json_parser_invalid_json(monkeypatch, body):
+    """
+    GIVEN a Django application
+    WHEN an invalid JSON body is parsed
+    THEN the same parse error as the DRF JSON parser is raised
+    """
+    with pytest.raises(ParseError) as expected:
+        JSONParser().parse(io.BytesIO(body))
+
+    with pytest.raises(ParseError) as error:
+        FastJSONParser().parse(io.BytesIO(body))
+    assert str(error.value) == str(expected.value)
+
+    monkeypatch.setattr(parsers, "orjson", None)
+    with pytest.raises(ParseError):
+        FastJSONParser().parse(io.BytesIO(body))
@@ -0,0 +1,106 @@
+from datetime import date
+
+import pytest
+from django.test import Client, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+def get_sample(content, name, **labels):
+    """
+    Return the value of a sample of the metrics, 0 when it is missing
+    """
+    # the labels are exposed sorted by name
+    selector = ",".join(
+        f'{key}="{value}"' for key, value in sorted(labels.items())
+    )
+    prefix = f"{name}{{{selector}}} " if labels else f"{name} "
+    for line in content.decode().splitlines():
+        if line.startswith(prefix):
+            return float(line.removeprefix(prefix))
+    return 0
+
+
+@pytest.mark.django_db
+def test_metrics_forbidden(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN a user who is not staff requests the metrics without a token
+    THEN the request is forbidden
+    """
+    client, user = authenticated_user
+
+    res = client.get(reverse("metrics"))
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+@override_settings(METRICS_TOKEN="scrape-token")
+def test_metrics_token():
+    """
+    GIVEN a Django application with a metrics token
+    WHEN the metrics are requested with the token
+    THEN they are returned in the Prometheus format, a wrong token is
+    forbidden
+    """
+    client = APIClient()
+
+    res = client.get(
+        reverse("metrics"), HTTP_AUTHORIZATION="Bearer scrape-token"
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res["Content-Type"].startswith("text/plain")
+    assert b"mindfulminutes_worker_start_time_seconds" in res.content
+
+    res = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong")
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_metrics_per_url_name(
+    authenticated_user, custom_super_user, add_win_entry
+):
+    """
+    GIVEN a Django application
+    WHEN a user reads their wins of a day twice
+    THEN the requests, their latency and queries are counted under the
+    URL name and the second read is an entry cache hit
+    """
+    client, user = authenticated_user
+    add_win_entry(title="Finished the report", user=user)
+    admin_client = Client()
+    admin_client.force_login(custom_super_user)
+    url = reverse("win-entry-date-list", args=[user.slug, date.today()])
+    view = {"view": "win-entry-date-list", "method": "GET"}
+    before = admin_client.get(reverse("metrics")).content
+
+    client.get(url)
+    client.get(url)
+
+    after = admin_client.get(reverse("metrics")).content
+    for name, labels in (
+        (
+            "mindfulminutes_http_requests_total",
+            {**view, "status": "200"},
+        ),
+        ("mindfulminutes_http_request_duration_seconds_count", view),
+        (
+            "mindfulminutes_http_request_queries_count",
+            {"view": "win-entry-date-list"},
+        ),
+    ):
+        assert (
+            get_sample(after, name, **labels)
+            - get_sample(before, name, **labels)
+            == 2
+        )
+    hits = {"cache": "entries", "result": "hit"}
+    assert (
+        get_sample(after, "mindfulminutes_cache_lookups_total", **hits)
+        - get_sample(before, "mindfulminutes_cache_lookups_total", **hits)
+        >= 1
+    )
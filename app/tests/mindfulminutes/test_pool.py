@@ -0,0 +1,226 @@
+import threading
+
+import pytest
+from django.conf import settings
+from django.db import connections
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from mindfulminutes.db.pool import ConnectionPool, PoolTimeout
+from mindfulminutes.db.pooled.base import get_pool_key
+
+pooled_postgres = pytest.mark.skipif(
+    settings.DATABASES["default"]["ENGINE"] != settings.POOLED_ENGINE,
+    reason="The default database does not use the pooled Postgres backend",
+)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_reuses_connections():
+    """
+    GIVEN a connection pool
+    WHEN a released connection is acquired again
+    THEN the same connection is handed out without opening a new one
+    """
+    pool = ConnectionPool(max_size=2)
+
+    connection = pool.acquire(FakeConnection)
+    pool.release(connection)
+
+    assert pool.acquire(FakeConnection) is connection
+    assert pool.stats()["opened"] == 1
+    assert pool.stats()["in_use"] == 1
+    assert pool.stats()["acquired"] == 2
+
+
+def test_pool_waits_for_free_connection():
+    """
+    GIVEN a connection pool at its maximum size
+    WHEN a connection is acquired
+    THEN the caller waits for a connection to be released and the
+    wait is counted
+    """
+    pool = ConnectionPool(max_size=1, timeout=5)
+    connection = pool.acquire(FakeConnection)
+
+    timer = threading.Timer(0.05, pool.release, args=[connection])
+    timer.start()
+    acquired = pool.acquire(FakeConnection)
+    timer.join()
+
+    stats = pool.stats()
+    assert acquired is connection
+    assert stats["waits"] == 1
+    assert stats["wait_time"] > 0
+    assert stats["size"] == 1
+
+
+def test_pool_timeout():
+    """
+    GIVEN a connection pool at its maximum size
+    WHEN no connection is released within the timeout
+    THEN PoolTimeout is raised and counted
+    """
+    pool = ConnectionPool(max_size=1, timeout=0.01)
+    pool.acquire(FakeConnection)
+
+    with pytest.raises(PoolTimeout):
+        pool.acquire(FakeConnection)
+
+    assert pool.stats()["timeouts"] == 1
+    assert pool.stats()["in_use"] == 1
+
+
+def test_pool_health_check():
+    """
+    GIVEN a connection pool
+    WHEN a connection idle for longer than the check interval fails
+    its health check
+    THEN it is closed and replaced by a new connection
+    """
+
+    def check(connection):
+        raise RuntimeError("Connection lost")
+
+    pool = ConnectionPool(check=check, check_interval=0)
+    connection = pool.acquire(FakeConnection)
+    pool.release(connection)
+
+    replacement = pool.acquire(FakeConnection)
+
+    assert replacement is not connection
+    assert connection.closed
+    assert pool.stats()["size"] == 1
+    assert pool.stats()["closed"] == 1
+
+
+def test_pool_reaps_idle_connections():
+    """
+    GIVEN a connection pool
+    WHEN connections stay idle for longer than the maximum idle time
+    THEN they are closed down to the minimum size
+    """
+    pool = ConnectionPool(min_size=1, max_idle=0)
+    connections = [pool.acquire(FakeConnection) for _ in range(3)]
+    for connection in connections:
+        pool.release(connection)
+
+    pool.release(pool.acquire(FakeConnection))
+
+    assert [connection.closed for connection in connections] == [
+        True,
+        True,
+        False,
+    ]
+    assert pool.stats()["size"] == 1
+
+
+def test_pool_discards_broken_connections():
+    """
+    GIVEN a connection pool
+    WHEN a connection is released as broken
+    THEN it is closed and its place is freed
+    """
+    pool = ConnectionPool(max_size=1)
+    connection = pool.acquire(FakeConnection)
+
+    pool.release(connection, discard=True)
+
+    assert connection.closed
+    assert pool.acquire(FakeConnection) is not connection
+
+
+@pytest.mark.django_db
+def test_db_pool_stats_view(custom_super_user, authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the pool stats are requested
+    THEN only admin users get them
+    """
+    client, user = authenticated_user
+    url = reverse("db-pool-stats")
+
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+    admin_client = APIClient()
+    admin_client.force_authenticate(user=custom_super_user)
+    res = admin_client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert "pools" in res.data
+
+
+@pooled_postgres
+@pytest.mark.django_db(transaction=True)
+def test_pooled_backend_reuses_connections():
+    """
+    GIVEN the default database using the pooled Postgres backend
+    WHEN the connection is closed and opened again
+    THEN the same connection comes back from the pool, rolled back
+    """
+    database = connections["default"]
+    database.close()
+    database.ensure_connection()
+    raw_connection = database.connection
+    pool = database.pool
+    raw_connection.autocommit = False
+    with raw_connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+    database.close()
+
+    assert pool.stats()["idle"] >= 1
+    database.ensure_connection()
+    assert database.connection is raw_connection
+    assert not database.connection.info.transaction_status
+    with database.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        assert cursor.fetchone() == (1,)
+
+
+@pooled_postgres
+@pytest.mark.django_db(transaction=True)
+def test_pooled_backend_discards_broken_connections():
+    """
+    GIVEN the default database using the pooled Postgres backend
+    WHEN a connection breaks before it is closed
+    THEN it is dropped from the pool and a new connection is opened
+    """
+    database = connections["default"]
+    database.close()
+    database.ensure_connection()
+    raw_connection = database.connection
+    raw_connection.close()
+
+    database.close()
+    database.ensure_connection()
+
+    assert database.connection is not raw_connection
+    with database.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+def test_pool_key_depends_on_connection_params():
+    """
+    GIVEN the pooled Postgres backend
+    WHEN the connection parameters of an alias change
+    THEN its connections are taken from another pool, whose key does
+    not reveal the password
+    """
+    params = {"database": "journal", "password": "secret"}
+
+    key = get_pool_key("default", params)
+
+    assert key == get_pool_key("default", dict(params))
+    assert key != get_pool_key("default", {**params, "database": "other"})
+    assert "secret" not in key
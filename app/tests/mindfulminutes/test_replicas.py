@@ -0,0 +1,149 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from mindfulminutes import replicas
+from mindfulminutes.replicas import ReplicaRouter
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """
+    Fixture using the default database as the only replica and
+    recording where the reads are routed to
+    """
+    reads = []
+    db_for_read = ReplicaRouter.db_for_read
+
+    def record_read(self, model, **hints):
+        alias = db_for_read(self, model, **hints)
+        reads.append((model.__name__, alias))
+        return alias
+
+    monkeypatch.setattr(replicas, "REPLICA_DATABASES", ["default"])
+    monkeypatch.setattr(replicas, "_health", {})
+    monkeypatch.setattr(ReplicaRouter, "db_for_read", record_read)
+    return reads
+
+
+def test_router_without_request():
+    """
+    GIVEN the replica router
+    WHEN a read is made outside of a replica read view
+    THEN it goes to the primary, as do writes
+    """
+    router = ReplicaRouter()
+
+    assert router.db_for_read(None) is None
+    assert router.db_for_write(None) == "default"
+
+
+@pytest.mark.django_db
+def test_list_reads_from_replica(authenticated_user, add_note_entry, replica):
+    """
+    GIVEN a Django application with a read replica
+    WHEN the user lists their entries
+    THEN the entries are read from the replica
+    """
+    client, user = authenticated_user
+    add_note_entry(content="Set up printer.", user=user)
+    # the replicas caught up with the write
+    cache.delete(f"replicas:wrote:{user.pk}")
+
+    res = client.get(reverse("note-entry-list", args=[user.slug]))
+
+    assert res.status_code == status.HTTP_200_OK
+    assert len(res.data) == 1
+    assert ("NoteEntry", "default") in replica
+
+
+@pytest.mark.django_db
+def test_list_after_write_reads_from_primary(authenticated_user, replica):
+    """
+    GIVEN a Django application with a read replica
+    WHEN the user lists their entries right after writing one
+    THEN the entries are read from the primary
+    """
+    client, user = authenticated_user
+    url = reverse("note-entry-date-list", args=[user.slug, date.today()])
+
+    res = client.post(
+        url,
+        json.dumps({"content": "Set up printer."}),
+        content_type="application/json",
+    )
+
+    assert res.status_code == status.HTTP_201_CREATED
+    assert replicas.wrote_recently(user.pk)
+
+    replica.clear()
+    res = client.get(reverse("note-entry-list", args=[user.slug]))
+
+    assert len(res.data) == 1
+    assert ("NoteEntry", "default") not in replica
+
+
+@pytest.mark.django_db
+def test_unhealthy_replica_not_read(authenticated_user, replica, monkeypatch):
+    """
+    GIVEN a Django application with a read replica
+    WHEN the replica fails its health check
+    THEN the reads go to the primary until it is checked again
+    """
+    client, user = authenticated_user
+
+    def replica_down(alias):
+        raise ConnectionError("Replica down")
+
+    monkeypatch.setattr(replicas, "replica_lag", replica_down)
+    client.get(reverse("note-entry-list", args=[user.slug]))
+
+    assert ("NoteEntry", "default") not in replica
+
+    monkeypatch.setattr(replicas, "replica_lag", lambda alias: 60)
+
+    assert not replicas.is_healthy("default")
+
+
+@pytest.mark.django_db
+def test_replica_read_not_cached(authenticated_user, add_note_entry, replica):
+    """
+    GIVEN a Django application with a read replica
+    WHEN the user reads a past day from the replica
+    THEN the response is neither cached nor marked immutable, the next
+    read queries the database again
+    """
+    client, user = authenticated_user
+    yesterday = date.today() - timedelta(days=1)
+    with freeze_time(yesterday):
+        add_note_entry(content="Set up printer.", user=user)
+    cache.delete(f"replicas:wrote:{user.pk}")
+    url = reverse("note-entry-date-list", args=[user.slug, yesterday])
+
+    res = client.get(url)
+
+    assert len(res.data) == 1
+    assert "immutable" not in res.get("Cache-Control", "")
+
+    replica.clear()
+    client.get(url)
+
+    assert ("NoteEntry", "default") in replica
+
+
+def test_replica_max_lag_above_lag(monkeypatch):
+    """
+    GIVEN the replica settings
+    WHEN replicas may lag further behind than users read from the primary
+    THEN the configuration is refused
+    """
+    monkeypatch.setattr(replicas, "REPLICA_MAX_LAG", replicas.REPLICA_LAG + 1)
+
+    with pytest.raises(ImproperlyConfigured):
+        replicas.check_replica_lag()
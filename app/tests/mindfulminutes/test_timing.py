@@ -0,0 +1,114 @@
+import json
+import logging
+from datetime import date
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from mindfulminutes import timing
+
+
+@pytest.fixture
+def timed(monkeypatch):
+    """
+    Fixture timing every request
+    """
+    monkeypatch.setattr(timing, "SERVER_TIMING_SAMPLE_RATE", 1)
+
+
+def parse_server_timing(header):
+    metrics = {}
+    for metric in header.split(", "):
+        name, *params = metric.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+@pytest.mark.django_db
+def test_server_timing_header(
+    authenticated_user, add_appointment_entry, timed
+):
+    """
+    GIVEN a Django application timing every request
+    WHEN the user requests an appointment entry
+    THEN the response has a Server-Timing header with the number of
+    queries and the database, serialize and render times
+    """
+    client, user = authenticated_user
+    entry = add_appointment_entry(
+        title="Dentist",
+        date=date.today(),
+        time_from="08:00",
+        time_until="09:00",
+        user=user,
+    )
+    url = reverse(
+        "appointment-entry-detail", args=[user.slug, date.today(), entry.pk]
+    )
+
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    metrics = parse_server_timing(res["Server-Timing"])
+    assert set(metrics) == {"db", "serialize", "render", "total"}
+    assert metrics["db"]["desc"] != '"0 queries"'
+    for metric in metrics.values():
+        assert float(metric["dur"]) >= 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_server_timing_counts_fan_out_queries(
+    authenticated_user, add_note_entry, timed
+):
+    """
+    GIVEN a Django application timing every request
+    WHEN the user requests a day, whose entry tables are read on the
+    fan out threads
+    THEN the queries of all threads are counted
+    """
+    client, user = authenticated_user
+    add_note_entry(content="Set up printer.", user=user)
+
+    res = client.get(reverse("day-entry-list", args=[user.slug, date.today()]))
+
+    assert res.status_code == status.HTTP_200_OK
+    metrics = parse_server_timing(res["Server-Timing"])
+    queries = int(metrics["db"]["desc"].strip('"').split()[0])
+    assert queries >= 9
+
+
+@pytest.mark.django_db
+def test_server_timing_not_sampled(authenticated_user):
+    """
+    GIVEN a Django application timing no request
+    WHEN the user lists their users
+    THEN the response has no Server-Timing header
+    """
+    client, user = authenticated_user
+
+    res = client.get(reverse("user-list"))
+
+    assert "Server-Timing" not in res
+
+
+@pytest.mark.django_db
+def test_server_timing_log(authenticated_user, timed, monkeypatch, caplog):
+    """
+    GIVEN a Django application timing and logging every request
+    WHEN the user lists their note entries
+    THEN one JSON line with the route and the timings is logged
+    """
+    client, user = authenticated_user
+    monkeypatch.setattr(timing, "SERVER_TIMING_LOG", True)
+
+    with caplog.at_level(logging.INFO, logger="mindfulminutes.timing"):
+        client.get(reverse("note-entry-list", args=[user.slug]))
+
+    (record,) = caplog.records
+    line = json.loads(record.getMessage())
+    assert line["method"] == "GET"
+    assert line["route"] == "api/users/<str:slug>/note/"
+    assert line["status"] == status.HTTP_200_OK
+    assert line["queries"] >= 1
+    assert "db_ms" in line and "total_ms" in line
@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from freezegun import freeze_time
 
 from notes.models import NoteEntry
 
@@ -20,3 +23,23 @@ def test_create_note(custom_user):
     assert notes[0].user == custom_user
     assert notes[0].content == "I have to order 'Eloquent JavaScript'"
     assert isinstance(notes[0].content, str) and notes[0].content is not None
+
+
+@pytest.mark.django_db
+def test_note_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a note model
+    WHEN creating a note shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        note_entry = NoteEntry.objects.create(
+            user=custom_user,
+            content="I have to order 'Eloquent JavaScript'",
+        )
+
+    note_entry.refresh_from_db()
+    assert note_entry.entry_date == date(2023, 7, 2)
+    assert NoteEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
@@ -2,6 +2,8 @@ import json
 from datetime import date
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 # https://dennisokeeffe.medium.com/mocking-python-datetime-in-tests-with
@@ -537,3 +539,379 @@ def test_update_note_entry_invalid_json(
     )
 
     assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_get_list_of_note_entries_paginated(
+    authenticated_user, add_note_entry
+):
+    """
+    GIVEN a Django application
+    WHEN a user requests the list of note entries page by page
+    THEN each note entry is returned once, in creation order,
+    and the last page has no link to a next page
+    """
+    client, user = authenticated_user
+
+    for index in range(5):
+        with freeze_time(f"2023-07-0{index + 1} 12:00:00"):
+            add_note_entry(content=f"Note {index}", user=user)
+
+    url = reverse("note-entry-list", args=[user.slug])
+    res = client.get(url, {"page_size": 2})
+
+    contents = []
+    while True:
+        assert res.status_code == status.HTTP_200_OK
+        assert len(res.data) <= 2
+        contents += [note["content"] for note in res.data]
+        if "Link" not in res:
+            break
+        next_url = res["Link"].split(";")[0].strip("<>")
+        res = client.get(next_url)
+
+    assert contents == [f"Note {index}" for index in range(5)]
+
+
+@pytest.mark.django_db
+def test_get_list_of_note_entries_invalid_cursor(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN a user requests the list of note entries with an invalid cursor
+    THEN a not found response is returned
+    """
+    client, user = authenticated_user
+
+    url = reverse("note-entry-list", args=[user.slug])
+    res = client.get(url, {"cursor": "not-a-cursor"})
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_get_list_of_note_entries_page_not_modified(
+    authenticated_user, add_note_entry
+):
+    """
+    GIVEN a Django application
+    WHEN a user requests a page of note entries again with the ETag of
+    the previous response
+    THEN a not modified response is returned without aggregating the
+    whole history, until a note entry of the page changes
+    """
+    client, user = authenticated_user
+
+    for index in range(3):
+        with freeze_time(f"2023-07-0{index + 1} 12:00:00"):
+            note = add_note_entry(content=f"Note {index}", user=user)
+            if index == 0:
+                first_note = note
+
+    url = reverse("note-entry-list", args=[user.slug])
+    res = client.get(url, {"page_size": 2})
+    etag = res["ETag"]
+
+    add_note_entry(content="Note 3", user=user)
+    with CaptureQueriesContext(connection) as queries:
+        res = client.get(url, {"page_size": 2}, HTTP_IF_NONE_MATCH=etag)
+
+    assert res.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not any(
+        "COUNT(" in query["sql"] or "MAX(" in query["sql"] for query in queries
+    )
+
+    first_note.content = "Note 0, edited"
+    first_note.save()
+    res = client.get(url, {"page_size": 2}, HTTP_IF_NONE_MATCH=etag)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.data[0]["content"] == "Note 0, edited"
+
+
+@pytest.mark.django_db
+def test_add_note_entries_in_bulk(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user sends a list of note entries
+    THEN all note entries are created with a single INSERT
+    """
+    client, user = authenticated_user
+
+    note_data = [
+        {"content": "Move dentist appointment."},
+        {"content": "Set up printer."},
+        {"content": "Order book."},
+    ]
+
+    url = reverse("note-entry-date-list", args=[user.slug, date.today()])
+
+    with CaptureQueriesContext(connection) as queries:
+        res = client.post(
+            url, json.dumps(note_data), content_type="application/json"
+        )
+
+    assert res.status_code == status.HTTP_201_CREATED
+    assert [note["content"] for note in res.data] == [
+        note["content"] for note in note_data
+    ]
+    assert all(note["user"] == user.id for note in res.data)
+    assert all(note["id"] is not None for note in res.data)
+
+    inserts = [query for query in queries if query["sql"].startswith("INSERT")]
+    assert len(inserts) == 1
+
+    note_entries = NoteEntry.objects.filter(user=user, entry_date=date.today())
+    assert len(note_entries) == 3
+
+
+@pytest.mark.django_db
+def test_add_note_entries_in_bulk_invalid_entry(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user sends a list of note entries with an invalid entry
+    THEN no note entry is created and the errors are returned per entry
+    """
+    client, user = authenticated_user
+
+    note_data = [{"content": "Set up printer."}, {}]
+
+    url = reverse("note-entry-date-list", args=[user.slug, date.today()])
+    res = client.post(
+        url, json.dumps(note_data), content_type="application/json"
+    )
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+    assert res.data[0] == {}
+    assert "content" in res.data[1]
+    assert NoteEntry.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_add_note_entries_in_bulk_allow_partial(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user sends a list of note entries with an invalid entry
+    and allows partial results
+    THEN the valid note entries are created and the errors are returned
+    """
+    client, user = authenticated_user
+
+    note_data = [{"content": "Set up printer."}, {}, {"content": "Order."}]
+
+    url = reverse("note-entry-date-list", args=[user.slug, date.today()])
+    res = client.post(
+        f"{url}?allow_partial=true",
+        json.dumps(note_data),
+        content_type="application/json",
+    )
+
+    assert res.status_code == status.HTTP_207_MULTI_STATUS
+    assert [note["content"] for note in res.data["created"]] == [
+        "Set up printer.",
+        "Order.",
+    ]
+    assert res.data["errors"][0]["index"] == 1
+    assert "content" in res.data["errors"][0]["errors"]
+    assert NoteEntry.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_get_note_entries_not_modified(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN the user requests the note entries of a date again with the
+    ETag of the previous response
+    THEN a not modified response is returned until a note entry is added
+    """
+    client, user = authenticated_user
+
+    add_note_entry(content="Set up printer.", user=user)
+
+    url = reverse("note-entry-date-list", args=[user.slug, date.today()])
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res["ETag"].startswith('W/"')
+    assert "Last-Modified" in res
+
+    etag = res["ETag"]
+    res = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert res.status_code == status.HTTP_304_NOT_MODIFIED
+    assert res["ETag"] == etag
+    assert not res.content
+
+    add_note_entry(content="Order book.", user=user)
+    res = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res["ETag"] != etag
+    assert len(res.data) == 2
+
+
+@pytest.mark.django_db
+def test_get_single_note_entry_not_modified(
+    authenticated_user, add_note_entry
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests a note entry with If-Modified-Since set to
+    its Last-Modified date
+    THEN a not modified response is returned
+    """
+    client, user = authenticated_user
+
+    note_entry = add_note_entry(content="Set up printer.", user=user)
+
+    url = reverse(
+        "note-entry-detail", args=[user.slug, date.today(), note_entry.id]
+    )
+    res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+
+    res = client.get(url, HTTP_IF_MODIFIED_SINCE=res["Last-Modified"])
+
+    assert res.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_get_note_entries_cached(
+    authenticated_user, add_note_entry, django_assert_num_queries
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests the note entries of a date twice
+    THEN the second response is served from the cache without a query
+    and adding a note entry invalidates it
+    """
+    client, user = authenticated_user
+
+    add_note_entry(content="Set up printer.", user=user)
+
+    url = reverse("note-entry-date-list", args=[user.slug, date.today()])
+    res = client.get(url)
+    assert len(res.data) == 1
+
+    with django_assert_num_queries(0):
+        res_cached = client.get(url)
+
+    assert res_cached.status_code == status.HTTP_200_OK
+    assert res_cached.data == res.data
+    assert res_cached["ETag"] == res["ETag"]
+
+    with django_assert_num_queries(0):
+        res_not_modified = client.get(url, HTTP_IF_NONE_MATCH=res["ETag"])
+
+    assert res_not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    note_entry = add_note_entry(content="Order book.", user=user)
+    res = client.get(url)
+    assert len(res.data) == 2
+
+    detail_url = reverse(
+        "note-entry-detail", args=[user.slug, date.today(), note_entry.id]
+    )
+    client.get(detail_url)
+    client.put(
+        detail_url,
+        json.dumps({"content": "Order two books."}),
+        content_type="application/json",
+    )
+    res = client.get(detail_url)
+    assert res.data["content"] == "Order two books."
+
+
+@pytest.mark.django_db
+def test_add_note_entries_in_bulk_invalidates_cache(authenticated_user):
+    """
+    GIVEN a Django application
+    WHEN the user adds note entries in bulk after reading the date
+    THEN the cached note entries of the date are invalidated
+    """
+    client, user = authenticated_user
+
+    url = reverse("note-entry-date-list", args=[user.slug, date.today()])
+    res = client.get(url)
+    assert res.data == []
+
+    client.post(
+        url,
+        json.dumps([{"content": "Set up printer."}]),
+        content_type="application/json",
+    )
+
+    res = client.get(url)
+    assert len(res.data) == 1
+
+
+@pytest.mark.django_db
+def test_update_past_note_entry_with_current_date(
+    authenticated_user, add_note_entry
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests to update a note entry of a past date
+    through the current date
+    THEN the note entry is not found and not updated
+    """
+    client, user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        note_entry = add_note_entry(content="Set up printer.", user=user)
+
+    url = reverse(
+        "note-entry-detail", args=[user.slug, date.today(), note_entry.id]
+    )
+    res = client.put(
+        url,
+        json.dumps({"content": "Order book."}),
+        content_type="application/json",
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+    note_entry.refresh_from_db()
+    assert note_entry.content == "Set up printer."
+
+
+@pytest.mark.django_db
+def test_get_note_entries_sparse_fields(authenticated_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN the user requests note entries with a list of fields
+    THEN only these fields are returned and the content
+    is not loaded from the database
+    """
+    client, user = authenticated_user
+
+    add_note_entry(content="Set up printer.", user=user)
+
+    url = reverse("note-entry-list", args=[user.slug])
+
+    with CaptureQueriesContext(connection) as queries:
+        res = client.get(url, {"fields": "id,created_on"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert set(res.data[0]) == {"id", "created_on"}
+    assert all('"content"' not in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_get_note_entries_by_date_exclude_fields(
+    authenticated_user, add_note_entry
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests note entries for a date excluding a field
+    THEN the field is left out of every entry
+    """
+    client, user = authenticated_user
+
+    add_note_entry(content="Set up printer.", user=user)
+
+    url = reverse("note-entry-date-list", args=[user.slug, date.today()])
+    res = client.get(url, {"exclude": "content"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert set(res.data[0]) == {"id", "user", "created_on"}
@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from freezegun import freeze_time
 
 from targets.models import TargetEntry
 
@@ -25,3 +28,24 @@ def test_create_target(custom_user):
     assert targets[0].order == 1
     assert isinstance(targets[0].order, int) and targets[0].order is not None
     assert targets[0].completed is False
+
+
+@pytest.mark.django_db
+def test_target_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a target model
+    WHEN creating a target shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        target_entry = TargetEntry.objects.create(
+            user=custom_user,
+            title="2 minute cold shower",
+            order=1,
+        )
+
+    target_entry.refresh_from_db()
+    assert target_entry.entry_date == date(2023, 7, 2)
+    assert TargetEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
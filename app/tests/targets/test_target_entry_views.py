@@ -2,6 +2,8 @@ import json
 from datetime import date
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 # https://dennisokeeffe.medium.com/mocking-python-datetime-in-tests-with
@@ -611,3 +613,109 @@ def test_update_target_entry_invalid_json(
     )
 
     assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_batch_update_target_entries(authenticated_user, add_target_entry):
+    """
+    GIVEN a Django application
+    WHEN the user reorders and completes several target entries at once
+    THEN all target entries are updated with a single UPDATE statement
+    """
+    client, user = authenticated_user
+
+    first = add_target_entry(title="2 minute cold shower", order=1, user=user)
+    second = add_target_entry(title="Read 10 pages", order=2, user=user)
+    third = add_target_entry(title="Call grandma", order=3, user=user)
+
+    changes = [
+        {"id": third.id, "order": 1, "completed": True},
+        {"id": first.id, "order": 2},
+        {"id": second.id, "order": 3},
+    ]
+
+    url = reverse("target-entry-date-list", args=[user.slug, date.today()])
+
+    with CaptureQueriesContext(connection) as queries:
+        res = client.patch(
+            url, json.dumps(changes), content_type="application/json"
+        )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert [target["id"] for target in res.data] == [
+        third.id,
+        first.id,
+        second.id,
+    ]
+    assert res.data[0]["completed"] is True
+
+    updates = [query for query in queries if query["sql"].startswith("UPDATE")]
+    assert len(updates) == 1
+
+    first.refresh_from_db()
+    third.refresh_from_db()
+    assert first.order == 2
+    assert first.completed is False
+    assert third.order == 1
+    assert third.completed is True
+
+
+@pytest.mark.django_db
+def test_batch_update_target_entries_of_other_user(
+    authenticated_user, add_target_entry, custom_user
+):
+    """
+    GIVEN a Django application
+    WHEN the user batch updates a target entry of another user
+    THEN no target entry is updated
+    """
+    client, user = authenticated_user
+
+    own_target = add_target_entry(title="Read 10 pages", order=1, user=user)
+    other_target = add_target_entry(
+        title="2 minute cold shower", order=1, user=custom_user
+    )
+
+    changes = [
+        {"id": own_target.id, "order": 2},
+        {"id": other_target.id, "completed": True},
+    ]
+
+    url = reverse("target-entry-date-list", args=[user.slug, date.today()])
+    res = client.patch(
+        url, json.dumps(changes), content_type="application/json"
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+    own_target.refresh_from_db()
+    other_target.refresh_from_db()
+    assert own_target.order == 1
+    assert other_target.completed is False
+
+
+@pytest.mark.django_db
+def test_batch_update_target_entries_not_current_date(
+    authenticated_user, add_target_entry
+):
+    """
+    GIVEN a Django application
+    WHEN the user batch updates target entries on a date,
+    that is not the current date
+    THEN the target entries are not updated
+    """
+    client, user = authenticated_user
+
+    target = add_target_entry(title="Read 10 pages", order=1, user=user)
+
+    url = reverse("target-entry-date-list", args=[user.slug, "2023-07-01"])
+    res = client.patch(
+        url,
+        json.dumps([{"id": target.id, "completed": True}]),
+        content_type="application/json",
+    )
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+    target.refresh_from_db()
+    assert target.completed is False
@@ -0,0 +1,104 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from freezegun import freeze_time
+
+from journal.models import DaySnapshot
+from journal.sealing import seal_day
+from journal.search import search_entries
+from notes.models import NoteEntry
+from users.deletion import purge_account, schedule_account_deletion
+from users.models import AccountDeletion
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_schedule_account_deletion(custom_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN the deletion of an account is requested
+    THEN the user is deactivated at once and its entries are kept
+    until the account is purged
+    """
+    add_note_entry(content="Set up printer.", user=custom_user)
+
+    deletion = schedule_account_deletion(custom_user)
+
+    custom_user.refresh_from_db()
+    assert not custom_user.is_active
+    assert deletion.user == custom_user
+    assert deletion.started_on is None
+    assert NoteEntry.objects.filter(user=custom_user).count() == 1
+
+    assert schedule_account_deletion(custom_user) == deletion
+
+
+@pytest.mark.django_db
+def test_purge_account(
+    custom_user,
+    authenticated_user,
+    add_note_entry,
+    add_win_entry,
+):
+    """
+    GIVEN a Django application
+    WHEN a deactivated account is purged in batches
+    THEN its entries, snapshots and search index go, the user is
+    deleted and the progress is recorded
+    """
+    client, other_user = authenticated_user
+
+    with freeze_time("2023-07-06 12:00:00"):
+        for index in range(5):
+            add_note_entry(
+                content=f"Set up printer {index}.", user=custom_user
+            )
+        add_win_entry(title="Finished the report", user=custom_user)
+    seal_day(custom_user, NoteEntry.objects.first().entry_date)
+    add_note_entry(content="Set up printer.", user=other_user)
+
+    deletion = schedule_account_deletion(custom_user)
+    purge_account(deletion, batch_size=2)
+
+    deletion.refresh_from_db()
+    assert deletion.user is None
+    assert deletion.started_on is not None
+    assert deletion.finished_on is not None
+    assert deletion.current_table == ""
+    # the search rows of the notes and the win on SQLite, the entries and
+    # the snapshot
+    search_rows = 6 if connection.vendor == "sqlite" else 0
+    assert deletion.deleted_rows == search_rows + 6 + 1
+
+    assert not User.objects.filter(pk=custom_user.pk).exists()
+    assert not DaySnapshot.objects.exists()
+    assert NoteEntry.objects.get().user == other_user
+    assert [
+        result["type"] for result in search_entries(other_user, "printer", 10)
+    ] == ["notes"]
+
+
+@pytest.mark.django_db
+def test_purge_accounts_command(custom_user, add_note_entry):
+    """
+    GIVEN a Django application
+    WHEN the purge_accounts command runs
+    THEN every pending account deletion is finished
+    """
+    add_note_entry(content="Set up printer.", user=custom_user)
+    schedule_account_deletion(custom_user)
+    out = StringIO()
+
+    call_command("purge_accounts", stdout=out)
+
+    assert not User.objects.filter(pk=custom_user.pk).exists()
+    assert AccountDeletion.objects.get().finished_on is not None
+    assert "Purged 1 account(s)" in out.getvalue()
+
+    call_command("purge_accounts", stdout=out)
+
+    assert "Purged 0 account(s)" in out.getvalue()
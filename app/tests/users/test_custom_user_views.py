@@ -1,9 +1,15 @@
+from datetime import time
+from io import StringIO
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.urls import reverse
 from faker import Faker
 from rest_framework import status
 
+from users.models import UserSettings
+
 User = get_user_model()
 fake = Faker()
 
@@ -222,7 +228,8 @@ def test_remove_custom_user(client, add_custom_user):
     """
     GIVEN a Django application
     WHEN the user requests to remove a user
-    THEN the user is removed
+    THEN the user is deactivated and queued for deletion,
+    then removed once the account is purged
     """
     users = User.objects.all()
     assert len(users) == 0
@@ -250,10 +257,10 @@ def test_remove_custom_user(client, add_custom_user):
 
     res_delete = client.delete(url)
 
-    assert res_delete.status_code == status.HTTP_204_NO_CONTENT
+    assert res_delete.status_code == status.HTTP_202_ACCEPTED
 
-    users = User.objects.all()
-    assert len(users) == 0
+    user.refresh_from_db()
+    assert not user.is_active
 
     url_retrieve = reverse("user-detail", args=[user.slug])
 
@@ -261,6 +268,8 @@ def test_remove_custom_user(client, add_custom_user):
 
     assert res_retrieve.status_code == status.HTTP_404_NOT_FOUND
 
+    call_command("purge_accounts", stdout=StringIO())
+
     users = User.objects.all()
     assert len(users) == 0
 
@@ -409,3 +418,140 @@ def test_update_custom_user_invalid_data(client, add_custom_user, test_data):
     )
 
     assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_list_custom_users_query_count(
+    client, add_custom_user, django_assert_num_queries
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests the list of users with their settings
+    THEN the users and settings are fetched with a single query
+    """
+    for num in range(5):
+        user = add_custom_user(
+            email=fake.email(),
+            password=fake.password(length=16),
+            first_name=fake.first_name(),
+            last_name=fake.last_name(),
+        )
+        UserSettings.objects.create(
+            user=user,
+            start_week_day=1,
+            morning_check_in=time(8, 0),
+            evening_check_in=time(20, 0),
+        )
+
+    url = reverse("user-list")
+
+    with django_assert_num_queries(1):
+        res = client.get(url)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert len(res.data) == 5
+    assert res.data[0]["user_settings"]["start_week_day"] == 1
+
+
+@pytest.mark.django_db
+def test_list_custom_users_paginated(client, add_custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests the list of users page by page
+    THEN every user is returned once in the order they signed up
+    """
+    users = [
+        add_custom_user(
+            email=f"user{num}@example.com",
+            password=fake.password(length=16),
+            first_name=fake.first_name(),
+            last_name=fake.last_name(),
+        )
+        for num in range(5)
+    ]
+
+    url = f"{reverse('user-list')}?page_size=2"
+    emails = []
+    while url:
+        res = client.get(url)
+        assert res.status_code == status.HTTP_200_OK
+        assert len(res.data) <= 2
+        emails += [user["email"] for user in res.data]
+        url = res.get("Link", "")[1:].split(">")[0] or None
+
+    assert emails == [user.email for user in users]
+
+
+@pytest.mark.django_db
+def test_list_custom_users_filtered(client, add_custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests the users by email prefix and active status
+    THEN only the matching users are returned
+    """
+    for email in ("anna@example.com", "anne@example.com", "bob@example.com"):
+        add_custom_user(
+            email=email,
+            password=fake.password(length=16),
+            first_name=fake.first_name(),
+            last_name=fake.last_name(),
+        )
+    User.objects.filter(email="anne@example.com").update(is_active=False)
+
+    url = reverse("user-list")
+
+    res = client.get(url, {"email": "ann"})
+    assert [user["email"] for user in res.data] == [
+        "anna@example.com",
+        "anne@example.com",
+    ]
+
+    res = client.get(url, {"email": "ann", "is_active": "false"})
+    assert [user["email"] for user in res.data] == ["anne@example.com"]
+
+
+@pytest.mark.django_db
+def test_list_custom_users_fields(client, add_custom_user):
+    """
+    GIVEN a Django application
+    WHEN the user requests the users with a list of fields
+    THEN only the requested fields are returned
+    """
+    add_custom_user(
+        email=fake.email(),
+        password=fake.password(length=16),
+        first_name=fake.first_name(),
+        last_name=fake.last_name(),
+    )
+
+    url = reverse("user-list")
+    res = client.get(url, {"fields": "email,slug"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert set(res.data[0]) == {"email", "slug"}
+
+
+@pytest.mark.django_db
+def test_list_custom_users_exclude_settings(
+    client, add_custom_user, django_assert_num_queries
+):
+    """
+    GIVEN a Django application
+    WHEN the user requests the users without their settings
+    THEN the settings are neither returned nor joined
+    """
+    add_custom_user(
+        email=fake.email(),
+        password=fake.password(length=16),
+        first_name=fake.first_name(),
+        last_name=fake.last_name(),
+    )
+
+    url = reverse("user-list")
+
+    with django_assert_num_queries(1) as queries:
+        res = client.get(url, {"exclude": "user_settings"})
+
+    assert res.status_code == status.HTTP_200_OK
+    assert "user_settings" not in res.data[0]
+    assert "JOIN" not in queries.captured_queries[0]["sql"]
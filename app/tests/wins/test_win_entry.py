@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from freezegun import freeze_time
 
 from wins.models import WinEntry
 
@@ -22,3 +25,23 @@ def test_create_win_entry(custom_user):
         isinstance(win_entries[0].title, str)
         and win_entries[0].title is not None
     )
+
+
+@pytest.mark.django_db
+def test_win_entry_date_is_local_date(custom_user):
+    """
+    GIVEN a win entry model
+    WHEN creating a win entry shortly before midnight UTC
+    THEN entry_date should be the date in the local time zone
+    """
+    with freeze_time("2023-07-01 23:30:00"):
+        win_entry = WinEntry.objects.create(
+            user=custom_user,
+            title="Finished the report",
+        )
+
+    win_entry.refresh_from_db()
+    assert win_entry.entry_date == date(2023, 7, 2)
+    assert WinEntry.objects.filter(
+        user=custom_user, entry_date=date(2023, 7, 2)
+    ).exists()
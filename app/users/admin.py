@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
 from .forms import CustomUserChangeForm, CustomUserCreationForm
-from .models import CustomUser, UserSettings
+from .models import AccountDeletion, CustomUser, UserSettings
 
 
 class CustomUserAdmin(UserAdmin):
@@ -81,4 +81,33 @@ class UserSettingsAdmin(admin.ModelAdmin):
     fields = ("user", "start_week_day", "morning_check_in", "evening_check_in")
 
 
+@admin.register(AccountDeletion)
+class AccountDeletionAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the AccountDeletion model
+
+    The class defines the display and behaviour of the AccountDeletion model
+    """
+
+    model = AccountDeletion
+    readonly_fields = (
+        "user",
+        "requested_on",
+        "started_on",
+        "finished_on",
+        "current_table",
+        "deleted_rows",
+    )
+    list_display = (
+        "__str__",
+        "user",
+        "requested_on",
+        "finished_on",
+        "current_table",
+        "deleted_rows",
+    )
+    fields = readonly_fields
+    ordering = ("-requested_on",)
+
+
 admin.site.register(CustomUser, CustomUserAdmin)
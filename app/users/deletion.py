@@ -0,0 +1,104 @@
+from functools import partial
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from journal.entries import ENTRY_TYPES
+from journal.models import DaySnapshot
+from journal.search import get_search_backend
+from mindfulminutes.cache import invalidate_user_entries
+
+from .models import AccountDeletion
+
+# Number of rows removed by one DELETE statement
+PURGE_BATCH_SIZE = 5000
+
+# Tables purged in batches before the user is deleted, none of them is
+# referenced by another table, so no cascade is skipped
+PURGED_MODELS = [model for model, _ in ENTRY_TYPES.values()] + [DaySnapshot]
+
+
+def schedule_account_deletion(user):
+    """
+    Deactivate the account right away and queue the purge of its data
+    as a background job
+    """
+    from .tasks import purge_deleted_account
+
+    with transaction.atomic():
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+        deletion, created = AccountDeletion.objects.get_or_create(user=user)
+        if created:
+            purge_deleted_account.enqueue(deletion_id=deletion.pk)
+    invalidate_user_entries(user.pk)
+    return deletion
+
+
+def delete_batch(model, user_id, batch_size):
+    """
+    Delete up to ``batch_size`` rows of a user from the table of a model
+    with one DELETE statement and return how many were deleted
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(model._meta.db_table)
+    pk = quote_name(model._meta.pk.column)
+    user_column = quote_name(model._meta.get_field("user").column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {table} WHERE {pk} IN ("
+            f"SELECT {pk} FROM {table} WHERE {user_column} = %s LIMIT %s)",
+            [user_id, batch_size],
+        )
+        return cursor.rowcount
+
+
+def purge_table(deletion, table, delete, batch_size):
+    """
+    Run ``delete`` until the table has no rows of the user left, saving
+    the progress of the deletion after every batch
+    """
+    deletion.current_table = table
+    deletion.save(update_fields=["current_table"])
+    while deleted := delete(deletion.user_id, batch_size):
+        deletion.deleted_rows += deleted
+        deletion.save(update_fields=["deleted_rows"])
+
+
+def purge_account(deletion, batch_size=PURGE_BATCH_SIZE):
+    """
+    Purge the journal of a deactivated account and delete the user
+
+    Every batch is a short statement of its own, so no transaction or
+    lock is held for long and no row is loaded into Python. A purge that
+    is interrupted simply carries on when it runs again. The remaining
+    relations of the user, such as its settings, are small and are left
+    to the regular cascade
+    """
+    if deletion.started_on is None:
+        deletion.started_on = timezone.now()
+        deletion.save(update_fields=["started_on"])
+
+    user_id = deletion.user_id
+    search = get_search_backend()
+    purge_table(deletion, "search", search.purge_user, batch_size)
+    for model in PURGED_MODELS:
+        delete = partial(delete_batch, model)
+        purge_table(deletion, model._meta.db_table, delete, batch_size)
+
+    with transaction.atomic():
+        deletion.user.delete()
+        deletion.user = None
+        deletion.current_table = ""
+        deletion.finished_on = timezone.now()
+        deletion.save(update_fields=["user", "current_table", "finished_on"])
+    invalidate_user_entries(user_id)
+
+
+def pending_deletions():
+    """
+    Return the account deletions that are not finished, oldest first
+    """
+    return AccountDeletion.objects.filter(
+        finished_on__isnull=True, user__isnull=False
+    ).select_related("user")
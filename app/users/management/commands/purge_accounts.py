@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from users.deletion import PURGE_BATCH_SIZE, pending_deletions, purge_account
+
+
+class Command(BaseCommand):
+    """
+    Purge the data of the accounts queued for deletion
+
+    Every deletion is purged by a background job, the command purges all
+    pending deletions at once, oldest first, for instance when no worker
+    runs. An interrupted purge carries on where it stopped
+    """
+
+    help = "Purge the accounts queued for deletion in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PURGE_BATCH_SIZE,
+            help="Number of rows removed by one DELETE statement",
+        )
+
+    def handle(self, *args, **options):
+        purged = 0
+        for deletion in pending_deletions().iterator():
+            purge_account(deletion, options["batch_size"])
+            purged += 1
+            self.stdout.write(
+                f"{deletion}: {deletion.deleted_rows} row(s) deleted"
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} account(s)"))
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.10 on 2026-10-18 07:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                fields=["date_joined", "id"], name="user_joined_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                fields=["is_active", "date_joined", "id"],
+                name="user_active_joined_idx",
+            ),
+        ),
+    ]
@@ -25,6 +25,21 @@ class CustomUser(AbstractUser):
 
     objects = CustomUserManager()
 
+    class Meta:
+        """
+        Meta options for the CustomUser model
+        """
+
+        verbose_name = _("user")
+        verbose_name_plural = _("users")
+        indexes = [
+            models.Index(fields=["date_joined", "id"], name="user_joined_idx"),
+            models.Index(
+                fields=["is_active", "date_joined", "id"],
+                name="user_active_joined_idx",
+            ),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             slug_name = slugify(f"{self.first_name} {self.last_name}")
@@ -84,3 +99,34 @@ class UserSettings(models.Model):
         """
 
         verbose_name_plural = "Users' Settings"
+
+
+class AccountDeletion(models.Model):
+    """
+    AccountDeletion model to track the purge of a deactivated account
+
+    The user is kept until every journal table has been purged, the
+    deletion itself stays as a record once the user is gone
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="account_deletion",
+    )
+    requested_on = models.DateTimeField(auto_now_add=True)
+    started_on = models.DateTimeField(null=True, blank=True)
+    finished_on = models.DateTimeField(null=True, blank=True)
+    current_table = models.CharField(max_length=255, blank=True)
+    deleted_rows = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        """
+        Meta options for the AccountDeletion model
+        """
+
+        ordering = ["requested_on"]
+
+    def __str__(self):
+        return f"Account deletion {self.pk}"
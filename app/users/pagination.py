@@ -0,0 +1,9 @@
+from mindfulminutes.pagination import KeysetPagination
+
+
+class UserKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination over users in the order they signed up
+    """
+
+    ordering = ("date_joined", "id")
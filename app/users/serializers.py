@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from mindfulminutes.fields import DynamicFieldsMixin
+
 from .models import UserSettings
 
 User = get_user_model()
@@ -37,7 +39,7 @@ class UserSettingsSerializer(serializers.ModelSerializer):
         )
 
 
-class CustomUserSerializer(serializers.ModelSerializer):
+class CustomUserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     CustomUserSerializer is a ModelSerializer
     that converts CustomUser model to JSON representation and vice versa
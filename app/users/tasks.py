@@ -0,0 +1,14 @@
+from jobs.registry import task
+
+from .deletion import pending_deletions, purge_account
+
+
+@task(max_attempts=5)
+def purge_deleted_account(deletion_id):
+    """
+    Purge an account queued for deletion, an interrupted purge carries
+    on where it stopped when the job is retried
+    """
+    deletion = pending_deletions().filter(pk=deletion_id).first()
+    if deletion is not None:
+        purge_account(deletion)
@@ -7,21 +7,53 @@ from rest_framework.exceptions import MethodNotAllowed
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.replicas import ReplicaReadMixin
+
+from .deletion import schedule_account_deletion
+from .pagination import UserKeysetPagination
 from .serializers import CustomUserSerializer
 
 User = get_user_model()
 
 
-class CustomUserList(APIView):
+class CustomUserList(ReplicaReadMixin, SparseFieldsetMixin, APIView):
     """
     List all users or create a new user
     """
 
     # permission_classes = [IsAuthenticated]
 
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "email",
+                openapi.IN_QUERY,
+                description="Only list users whose email starts with this",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "is_active",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_BOOLEAN,
+            ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                description="Comma separated list of fields to return",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "exclude",
+                openapi.IN_QUERY,
+                description="Comma separated list of fields to leave out",
+                type=openapi.TYPE_STRING,
+            ),
+        ]
+    )
     def get(self, request):
         """
-        List all users or filter by date
+        List all users, optionally filtered by email prefix or status
         """
         return self._handle_user_list_action(request)
 
@@ -42,6 +74,22 @@ class CustomUserList(APIView):
         """
         return self._handle_user_list_action(request)
 
+    def filter_queryset(self, request, queryset):
+        """
+        Filter the users by the email prefix and active status requested
+
+        Both filters are served by indexes, a prefix match on the unique
+        email index and the (is_active, date_joined, id) index
+        """
+        email = request.query_params.get("email")
+        if email:
+            queryset = queryset.filter(email__startswith=email)
+
+        is_active = request.query_params.get("is_active")
+        if is_active in ("true", "false"):
+            queryset = queryset.filter(is_active=is_active == "true")
+        return queryset
+
     def _handle_user_list_action(self, request):
         """
         Private helper method to handle both GET and POST requests
@@ -50,10 +98,23 @@ class CustomUserList(APIView):
         lists all users or creates a new user
         """
         if request.method == "GET":
-            user_entries = User.objects.all()
+            fieldset = self.get_fieldset(request)
+            user_entries = self.filter_queryset(request, User.objects.all())
+            if "user_settings" in CustomUserSerializer(**fieldset).fields:
+                user_entries = user_entries.select_related("user_settings")
+            user_entries = self.get_sparse_queryset(
+                user_entries,
+                CustomUserSerializer,
+                request,
+                required=UserKeysetPagination.ordering,
+            )
 
-            serializer = CustomUserSerializer(user_entries, many=True)
-            return Response(serializer.data)
+            paginator = UserKeysetPagination()
+            page = paginator.paginate_queryset(
+                user_entries, request, view=self
+            )
+            serializer = CustomUserSerializer(page, many=True, **fieldset)
+            return paginator.get_paginated_response(serializer.data)
 
         if request.method == "POST":
             serializer = CustomUserSerializer(data=request.data)
@@ -80,10 +141,10 @@ class CustomUserDetail(APIView):
     def get_object(self, slug):
         """
         Helper method to get an user object from the database
-        or raise a 404 error
+        or raise a 404 error, users queued for deletion are not found
         """
         try:
-            return User.objects.get(slug=slug)
+            return User.objects.get(slug=slug, account_deletion__isnull=True)
         except User.DoesNotExist:
             raise Http404
 
@@ -113,6 +174,9 @@ class CustomUserDetail(APIView):
     def delete(self, request, slug, format=None):
         """
         Delete an user
+
+        The account is deactivated right away and its data is purged
+        by a background job
         """
         return self._handle_user_detail_action(request, slug)
 
@@ -149,7 +213,7 @@ class CustomUserDetail(APIView):
                 )
 
             elif request.method == "DELETE":
-                user.delete()
-                return Response(status=status.HTTP_204_NO_CONTENT)
+                schedule_account_deletion(user)
+                return Response(status=status.HTTP_202_ACCEPTED)
 
         return Response(status=status.HTTP_400_BAD_REQUEST)
@@ -9,11 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from mindfulminutes.bulk import bulk_create_entries
+from mindfulminutes.cache import EntryCacheMixin
+from mindfulminutes.conditional import ConditionalGetMixin
+from mindfulminutes.fields import SparseFieldsetMixin
+from mindfulminutes.pagination import KeysetPagination
+from mindfulminutes.replicas import ReplicaReadMixin
+
 from .models import WinEntry
 from .serializers import WinEntrySerializer
 
 
-class WinEntryList(APIView):
+class WinEntryList(
+    ReplicaReadMixin, SparseFieldsetMixin, ConditionalGetMixin, APIView
+):
     """
     List all win entries or create a new win entry
     """
@@ -27,14 +36,34 @@ class WinEntryList(APIView):
         if request.method == "GET":
             if request.user.slug == slug:
                 win_entries = WinEntry.objects.filter(user=request.user)
+                serializer = self.get_values_serializer(
+                    WinEntrySerializer, request
+                )
+                win_entries = serializer.get_queryset(
+                    win_entries, *KeysetPagination.ordering, "updated_on"
+                )
+
+                paginator = KeysetPagination()
+                page = paginator.paginate_queryset(
+                    win_entries, request, view=self
+                )
 
-                serializer = WinEntrySerializer(win_entries, many=True)
-                return Response(serializer.data)
+                not_modified = self.check_not_modified(
+                    request, page, paginator.has_next
+                )
+                if not_modified is not None:
+                    return not_modified
+
+                return paginator.get_paginated_response(
+                    serializer.to_representation(page)
+                )
 
             raise MethodNotAllowed(request.method)
 
 
-class WinEntryListCreate(APIView):
+class WinEntryListCreate(
+    ReplicaReadMixin, SparseFieldsetMixin, EntryCacheMixin, APIView
+):
     """
     List or create win entries for a specific date
     """
@@ -57,12 +86,25 @@ class WinEntryListCreate(APIView):
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                cached = self.get_cached_response(request, requested_date)
+                if cached is not None:
+                    return cached
+
                 win_entries = WinEntry.objects.filter(
-                    user=request.user, created_on__date=requested_date
+                    user=request.user, entry_date=requested_date
+                )
+                serializer = self.get_values_serializer(
+                    WinEntrySerializer, request
                 )
+                win_entries = serializer.get_queryset(win_entries)
 
-                serializer = WinEntrySerializer(win_entries, many=True)
-                return Response(serializer.data)
+                not_modified = self.check_not_modified(request, win_entries)
+                if not_modified is not None:
+                    return not_modified
+
+                return self.cache_response(
+                    Response(serializer.to_representation(win_entries))
+                )
 
         raise MethodNotAllowed(request.method)
 
@@ -93,6 +135,9 @@ class WinEntryListCreate(APIView):
                         },
                         status=status.HTTP_403_FORBIDDEN,
                     )
+                if isinstance(request.data, list):
+                    return bulk_create_entries(request, WinEntrySerializer)
+
                 serializer = WinEntrySerializer(data=request.data)
                 if serializer.is_valid():
                     serializer.save(user=request.user)
@@ -106,20 +151,22 @@ class WinEntryListCreate(APIView):
         raise MethodNotAllowed(request.method)
 
 
-class WinEntryDetail(APIView):
+class WinEntryDetail(SparseFieldsetMixin, EntryCacheMixin, APIView):
     """
     Retrieve, update or delete a win entry
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, pk):
+    def get_object(self, pk, user, entry_date):
         """
-        Helper method to get a win entry object from the database
-        or raise a 404 error
+        Helper method to get a win entry object of the user for the date
+        from the database or raise a 404 error
         """
         try:
-            return WinEntry.objects.get(pk=pk)
+            return WinEntry.objects.get(
+                pk=pk, user=user, entry_date=entry_date
+            )
         except WinEntry.DoesNotExist:
             raise Http404
 
@@ -171,9 +218,14 @@ class WinEntryDetail(APIView):
 
         if request.user.slug == slug:
             if pk is not None:
+                if request.method == "GET":
+                    cached = self.get_cached_response(request)
+                    if cached is not None:
+                        return cached
+
                 try:
                     isinstance(pk, int)
-                    win_entry = self.get_object(pk)
+                    win_entry = self.get_object(pk, request.user, date_request)
                 except (ValueError, Http404):
                     if isinstance(pk, str):
                         return Response(
@@ -183,8 +235,14 @@ class WinEntryDetail(APIView):
                     return Response(status=status.HTTP_404_NOT_FOUND)
 
                 if request.method == "GET":
-                    serializer = WinEntrySerializer(win_entry)
-                    return Response(serializer.data)
+                    not_modified = self.check_not_modified(request, win_entry)
+                    if not_modified is not None:
+                        return not_modified
+
+                    serializer = WinEntrySerializer(
+                        win_entry, **self.get_fieldset(request)
+                    )
+                    return self.cache_response(Response(serializer.data))
 
                 elif request.method == "PUT":
                     serializer = WinEntrySerializer(